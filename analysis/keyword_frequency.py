@@ -11,7 +11,8 @@ import json
 import re
 from collections import Counter
 import datetime
-from common.utils import save_results
+from common.utils import save_results, load_superseded_ids
+from common.near_duplicates import NearDuplicateIndex
 
 
 def clean_text(text):
@@ -68,7 +69,55 @@ def load_json_data(file_path):
         return None
 
 
-def analyze_keyword_frequency(json_file, excluded_words=None, top_n=100, min_length=2):
+def iter_jsonl_records(file_path):
+    """
+    JSONL 파일에서 레코드를 한 줄씩 읽어 반환 (전체를 메모리에 올리지 않음)
+    
+    크롤링 도중 중단되어 마지막 줄이 잘린 경우 해당 줄만 건너뛴다.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                print(f"손상된 줄을 건너뜁니다: {file_path}:{line_number}")
+
+
+def iter_video_records(file_path):
+    """
+    크롤링 결과 파일의 동영상 레코드를 차례로 반환
+    
+    JSONL(.jsonl)은 줄 단위로 읽고(사이드카에 무효로 표시된 레코드는 건너뜀),
+    기존 JSON 파일(목록 또는 {"shorts": [...]})도 지원한다.
+    
+    Raises:
+        ValueError: 지원되지 않는 데이터 형식
+    """
+    if file_path is None:
+        raise ValueError("파일 경로가 None입니다.")
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+    
+    if file_path.endswith('.jsonl'):
+        superseded = load_superseded_ids(file_path)
+        records = iter_jsonl_records(file_path)
+        if superseded:
+            return (record for record in records if record.get('video_id') not in superseded)
+        return records
+    
+    data = load_json_data(file_path)
+    # 데이터 형식 확인 (일반 목록 또는 중첩 구조)
+    if isinstance(data, list):
+        return iter(data)
+    if isinstance(data, dict) and isinstance(data.get('shorts'), list):
+        return iter(data['shorts'])
+    raise ValueError("지원되지 않는 데이터 형식입니다.")
+
+
+def analyze_keyword_frequency(json_file, excluded_words=None, top_n=100, min_length=2, count_clusters=False):
     """
     JSON 파일에서 키워드 빈도수 분석
     
@@ -77,6 +126,8 @@ def analyze_keyword_frequency(json_file, excluded_words=None, top_n=100, min_len
         excluded_words (list): 제외할 단어 목록 (기본값: ["shorts", "shortsvideo"])
         top_n (int): 출력할 상위 키워드 수 (기본값: 100)
         min_length (int): 키워드 최소 길이 (기본값: 2)
+        count_clusters (bool): True면 유사 중복(재업로드) 묶음마다 대표 영상 하나만 집계,
+            False면 모든 영상을 각각 집계 (기본값: False)
     
     Returns:
         str: 결과 파일 경로
@@ -89,31 +140,36 @@ def analyze_keyword_frequency(json_file, excluded_words=None, top_n=100, min_len
     today = datetime.datetime.now().strftime("%Y%m%d")
     
     try:
-        # JSON 파일 로드
-        data = load_json_data(json_file)
-        if not data:
-            return None
-            
-        # 데이터 형식 확인 (일반 목록 또는 중첩 구조)
-        if isinstance(data, list):
-            videos_data = data
-        elif 'shorts' in data and isinstance(data['shorts'], list):
-            videos_data = data['shorts']
-        else:
-            print("지원되지 않는 데이터 형식입니다.")
+        # 결과 파일 열기 (JSONL은 줄 단위로 지연 로드)
+        try:
+            videos_data = iter_video_records(json_file)
+        except (ValueError, OSError) as e:
+            print(f"파일 로드 중 오류 발생: {str(e)}")
             return None
         
         print(f"분석 시작: {json_file}")
-        print(f"총 {len(videos_data)} 개의 동영상 데이터 로드 완료")
         print(f"제외 단어: {', '.join(excluded_words)}")
         
+        # 유사 중복 묶음 단위 집계: 먼저 전체를 묶고 묶음별 대표(조회수 최고)만 분석
+        raw_videos = None
+        if count_clusters:
+            near_duplicates = NearDuplicateIndex()
+            raw_videos = 0
+            for video in videos_data:
+                raw_videos += 1
+                near_duplicates.add(video)
+            videos_data = [cluster["canonical"] for cluster in near_duplicates.clusters()]
+            print(f"유사 중복 묶음: 영상 {raw_videos}개 → {len(videos_data)}개 묶음")
+        
         # 키워드 카운터 초기화
         all_keywords = Counter()
         hashtag_keywords = Counter()
         combined_keywords = Counter()  # 해시태그와 일반 키워드를 합친 카운터
         
         # 각 동영상 데이터 분석
+        total_videos = 0
         for video in videos_data:
+            total_videos += 1
             # 제목과 설명 결합
             title = clean_text(video.get('title', ''))
             description = clean_text(video.get('description', ''))
@@ -133,6 +189,11 @@ def analyze_keyword_frequency(json_file, excluded_words=None, top_n=100, min_len
             combined_keywords.update(filtered_hashtags)
             combined_keywords.update(filtered_keywords)
         
+        if not total_videos:
+            print("분석할 동영상 데이터가 없습니다.")
+            return None
+        print(f"총 {total_videos} 개의 동영상 데이터 분석 완료")
+        
         # 문자열 길이순으로 정렬된 결과
         sorted_keywords = sorted(all_keywords.items(), key=lambda x: (x[1], len(x[0])), reverse=True)
         sorted_hashtags = sorted(hashtag_keywords.items(), key=lambda x: (x[1], len(x[0])), reverse=True)
@@ -143,7 +204,9 @@ def analyze_keyword_frequency(json_file, excluded_words=None, top_n=100, min_len
             "metadata": {
                 "source_file": json_file,
                 "analysis_date": today,
-                "total_videos": len(videos_data),
+                "total_videos": total_videos,
+                "count_mode": "clusters" if count_clusters else "videos",
+                "raw_videos": raw_videos if count_clusters else total_videos,
                 "excluded_words": excluded_words
             },
             "top_keywords": dict(sorted_keywords[:top_n]),
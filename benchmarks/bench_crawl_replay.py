@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+크롤러 종단간 오프라인 벤치마크
+get_shorts_by_keyword를 녹화된 HTTP 픽스처(m_http_fixtures)로 재생해 커밋 간 결과/소요 시간을 비교
+
+사용법:
+    python benchmarks/bench_crawl_replay.py 동물 --record              # 실제 YouTube 응답 녹화
+    python benchmarks/bench_crawl_replay.py 동물 --latency 0.2 --repeat 3   # 오프라인 재생
+"""
+
+import os
+import sys
+import time
+import hashlib
+import argparse
+import contextlib
+import io
+
+# 상위 디렉토리 import를 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from youtube.b_crowling import get_shorts_by_keyword
+from youtube.m_http_fixtures import install_fixtures
+
+
+def run_once(args, transport_kwargs):
+    """한 번 실행하고 (소요 시간, 결과, 전송 객체) 반환 (크롤러 출력은 숨김)"""
+    transport = install_fixtures(args.mode, args.fixtures, **transport_kwargs)
+    log = io.StringIO()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(log):
+        shorts = get_shorts_by_keyword(
+            keyword=args.keyword,
+            min_views=args.min_views,
+            max_days=args.max_days,
+            max_results=args.max_results,
+            concurrent=args.concurrent,
+            use_scheduler=False  # 지난 실행 통계에 따라 전략 순서가 바뀌지 않도록
+        )
+    elapsed = time.perf_counter() - started
+    return elapsed, shorts, transport
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤러 종단간 오프라인 벤치마크")
+    parser.add_argument("keyword", help="검색 키워드")
+    parser.add_argument("--fixtures", help="픽스처 디렉토리 (기본값: benchmarks/fixtures/<키워드>)")
+    parser.add_argument("--record", dest="mode", action="store_const", const="record", default="replay",
+                        help="실제 요청을 보내고 응답을 녹화")
+    parser.add_argument("--latency", type=float, default=0.0, help="재생 시 응답당 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="재생 시 지연 무작위 범위 (초)")
+    parser.add_argument("--recorded-latency", action="store_true", help="녹화 당시 응답 시간으로 지연")
+    parser.add_argument("--concurrent", action="store_true", help="동시 크롤링 모드로 실행")
+    parser.add_argument("--min-views", type=int, default=100000)
+    parser.add_argument("--max-days", type=int, default=3)
+    parser.add_argument("--max-results", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=1, help="재생 반복 횟수 (기본값: 1)")
+    args = parser.parse_args()
+
+    if not args.fixtures:
+        args.fixtures = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", args.keyword)
+
+    transport_kwargs = {}
+    if args.mode == "replay":
+        transport_kwargs = {
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "use_recorded_latency": args.recorded_latency
+        }
+    repeat = 1 if args.mode == "record" else max(1, args.repeat)
+
+    timings = []
+    for _ in range(repeat):
+        elapsed, shorts, transport = run_once(args, transport_kwargs)
+        timings.append(elapsed)
+
+    # 결과 지문: 같은 픽스처로 같은 결과가 나오는지 커밋 간 비교용
+    fingerprint = hashlib.sha1(",".join(sorted(s.get("video_id", "") for s in shorts)).encode()).hexdigest()[:12]
+    print(f"모드: {args.mode} / 픽스처: {args.fixtures}")
+    print(f"결과: {len(shorts)}개 (지문 {fingerprint})")
+    print(f"소요 시간: 최소 {min(timings):.3f}s / 평균 {sum(timings) / len(timings):.3f}s ({len(timings)}회)")
+    if args.mode == "replay":
+        stats = transport.stats()
+        print(f"재생 응답: {stats['served']}개 / 녹화되지 않은 요청: {len(stats['missing'])}개")
+
+
+if __name__ == "__main__":
+    main()
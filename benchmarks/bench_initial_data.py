@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+ytInitialData 추출 마이크로 벤치마크
+기존 정규식 3종 탐색(.text 디코딩 + re.search + json.loads)과 h_initial_data 추출기를 비교
+
+사용법:
+    python benchmarks/bench_initial_data.py [저장된_페이지.html ...] [--repeat N]
+    (페이지를 지정하지 않으면 합성 페이지로 측정)
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+
+# 상위 디렉토리 import를 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from youtube.h_initial_data import extract_initial_data
+
+# 기존 d_page_parser의 탐색 방식
+LEGACY_PATTERNS = [
+    r'var\s+ytInitialData\s*=\s*({.+?});</script>',
+    r'window\["ytInitialData"\]\s*=\s*({.+?});</script>',
+    r'ytInitialData\s*=\s*({.+?});</script>'
+]
+
+
+def legacy_extract(body):
+    """기존 방식: 전체 디코딩 후 패턴을 순서대로 재탐색"""
+    text = body.decode("utf-8", errors="replace")
+    for pattern in LEGACY_PATTERNS:
+        match = re.search(pattern, text, re.DOTALL)
+        if match:
+            return json.loads(match.group(1))
+    return None
+
+
+def build_synthetic_page(renderer_count=400, assignment='window["ytInitialData"] = '):
+    """실제 검색 페이지와 비슷한 크기/구조의 합성 HTML 생성"""
+    items = []
+    for i in range(renderer_count):
+        items.append({
+            "videoRenderer": {
+                "videoId": f"vid{i:08d}",
+                "title": {"runs": [{"text": f"합성 쇼츠 제목 {i} #shorts"}]},
+                "viewCountText": {"simpleText": f"조회수 {i % 97}.{i % 10}만회"},
+                "publishedTimeText": {"simpleText": f"{i % 7}일 전"},
+                "descriptionSnippet": {"runs": [{"text": "설명 \\u003cb\\u003e텍스트\\u003c/b\\u003e " * 5}]},
+                "thumbnail": {"thumbnails": [{"url": f"https://i.ytimg.com/vi/{i}/hq.jpg", "width": 405, "height": 720}]}
+            }
+        })
+    data = {"contents": {"twoColumnSearchResultsRenderer": {"primaryContents": {
+        "sectionListRenderer": {"contents": [{"itemSectionRenderer": {"contents": items}}]}
+    }}}}
+
+    # 앞뒤로 다른 스크립트를 채워 실제 페이지처럼 큰 본문 구성
+    filler = "<script>var ytcfg = {\"x\": \"" + ("a" * 200000) + "\"};</script>"
+    tail = "<script>" + ("var f = function(){return 1;};" * 20000) + "</script>"
+    html = (
+        "<!DOCTYPE html><html><head>" + filler + "</head><body>"
+        + "<script nonce=\"abc\">" + assignment + json.dumps(data, ensure_ascii=False) + ";</script>"
+        + tail + "</body></html>"
+    )
+    return html.encode("utf-8")
+
+
+def time_call(func, body, repeat):
+    """최소 실행 시간(ms) 반환"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(body)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ytInitialData 추출 마이크로 벤치마크")
+    parser.add_argument("pages", nargs="*", help="저장된 YouTube 페이지 HTML 파일")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수 (기본값: 20)")
+    args = parser.parse_args()
+
+    samples = []
+    for path in args.pages:
+        with open(path, "rb") as f:
+            samples.append((os.path.basename(path), f.read()))
+    if not samples:
+        samples = [
+            ("synthetic_var", build_synthetic_page(assignment="var ytInitialData = ")),
+            ("synthetic_window", build_synthetic_page(assignment='window["ytInitialData"] = ')),
+        ]
+
+    print(f"{'페이지':<30} {'크기(KB)':>10} {'정규식(ms)':>12} {'추출기(ms)':>12} {'배속':>8} {'일치':>6}")
+    for name, body in samples:
+        legacy_ms, legacy_data = time_call(legacy_extract, body, args.repeat)
+        new_ms, new_data = time_call(extract_initial_data, body, args.repeat)
+        speedup = legacy_ms / new_ms if new_ms else float("inf")
+        same = "예" if legacy_data == new_data else "아니오"
+        print(f"{name:<30} {len(body) / 1024:>10.0f} {legacy_ms:>12.2f} {new_ms:>12.2f} {speedup:>7.1f}x {same:>6}")
+
+
+if __name__ == "__main__":
+    main()
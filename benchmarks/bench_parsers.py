@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+페이지 파서 단계별 벤치마크
+검색/해시태그/채널/연속 페이지 형태의 합성 ytInitialData를 크기별(50~5,000 렌더러)로 만들어
+walk_renderers, detect_if_short, extract_video_info, parse_view_count, extract_shorts_from_data,
+process_items를 각각 측정하고 최대 메모리(tracemalloc)와 함께 JSON 결과 파일로 저장
+
+사용법:
+    python benchmarks/bench_parsers.py [--sizes 50 500 5000] [--repeat N] [--output 결과.json] [--compare 이전결과.json]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import subprocess
+import tracemalloc
+from datetime import datetime
+
+# 상위 디렉토리 import를 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from youtube.d_page_parser import (
+    walk_renderers, detect_if_short, extract_video_info, extract_shorts_from_data, process_items,
+    CONTINUATION_RENDERER_KEY
+)
+from youtube.i_text_parsers import parse_view_count
+
+DEFAULT_SIZES = (50, 500, 5000)
+PAYLOAD_KINDS = ("search", "hashtag", "channel", "continuation")
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def synthetic_video(i, rng, short=True):
+    """videoRenderer/gridVideoRenderer 공통 본문 (short=False면 일반 가로 영상)"""
+    view_text = rng.choice([f"조회수 {rng.randint(1, 999)}.{rng.randint(0, 9)}만회",
+                            f"조회수 {rng.randint(100, 9999):,}회",
+                            f"{rng.randint(1, 99)}.{rng.randint(0, 9)}K views"])
+    renderer = {
+        "videoId": f"v{i:010d}",
+        "title": {"runs": [{"text": f"합성 영상 {i} "}, {"text": "#shorts" if short and i % 3 == 0 else "브이로그"}]},
+        "viewCountText": {"simpleText": view_text},
+        "publishedTimeText": {"simpleText": rng.choice(["3시간 전", "1일 전", "2일 전", "1주 전", "2 days ago"])},
+        "lengthText": {"simpleText": f"0:{rng.randint(10, 59)}" if short else f"{rng.randint(2, 30)}:{rng.randint(10, 59)}"},
+        "ownerText": {"runs": [{
+            "text": f"채널 {i % 97}",
+            "navigationEndpoint": {"browseEndpoint": {"browseId": f"UC{i % 97:022d}"}}
+        }]},
+        "thumbnail": {"thumbnails": [
+            {"url": f"https://i.ytimg.com/vi/v{i:010d}/default.jpg", "width": 120, "height": 90},
+            {"url": f"https://i.ytimg.com/vi/v{i:010d}/hq.jpg",
+             "width": 405 if short else 1280, "height": 720}
+        ]},
+        "navigationEndpoint": {"commandMetadata": {"webCommandMetadata": {
+            "url": f"/shorts/v{i:010d}" if short and i % 2 == 0 else f"/watch?v=v{i:010d}"
+        }}},
+        "detailedMetadataSnippets": [{"snippetText": {"runs": [{"text": "합성 설명 "}, {"text": "텍스트 " * 8}]}}],
+        "badges": [{"metadataBadgeRenderer": {"label": "새 동영상"}}],
+        "trackingParams": "x" * 60
+    }
+    return renderer
+
+
+def synthetic_reel(i, rng):
+    """reelItemRenderer 본문"""
+    return {
+        "videoId": f"r{i:010d}",
+        "headline": {"simpleText": f"합성 릴 {i}"},
+        "viewCountText": {"simpleText": f"조회수 {rng.randint(1, 999)}만회"},
+        "publishedTimeText": {"simpleText": rng.choice(["5시간 전", "1일 전", "4일 전"])},
+        "thumbnail": {"thumbnails": [{"url": f"https://i.ytimg.com/vi/r{i:010d}/frame0.jpg", "width": 405, "height": 720}]},
+        "trackingParams": "y" * 60
+    }
+
+
+def mixed_renderers(count, rng, grid=False):
+    """(렌더러 종류, 렌더러) 목록: 릴 30%, 쇼츠 영상 40%, 일반 영상 30%"""
+    items = []
+    video_key = "gridVideoRenderer" if grid else "videoRenderer"
+    for i in range(count):
+        roll = rng.random()
+        if roll < 0.3:
+            items.append(("reelItemRenderer", synthetic_reel(i, rng)))
+        elif roll < 0.7:
+            items.append((video_key, synthetic_video(i, rng, short=True)))
+        else:
+            items.append((video_key, synthetic_video(i, rng, short=False)))
+    return items
+
+
+def continuation_item(token):
+    return {CONTINUATION_RENDERER_KEY: {"continuationEndpoint": {"continuationCommand": {"token": token}}}}
+
+
+def build_payload(kind, count, seed=0):
+    """
+    kind 형태의 합성 페이지 데이터 생성
+
+    Returns:
+        (전체 데이터, process_items에 넘길 아이템 목록)
+    """
+    rng = random.Random(f"{kind}-{count}-{seed}")
+
+    if kind == "search":
+        # 검색: itemSectionRenderer 안에 영상과 릴 선반(reelShelfRenderer)이 섞여 있음
+        contents = []
+        shelf = []
+        for key, renderer in mixed_renderers(count, rng):
+            if key == "reelItemRenderer":
+                shelf.append({key: renderer})
+                if len(shelf) == 10:
+                    contents.append({"reelShelfRenderer": {"items": shelf}})
+                    shelf = []
+            else:
+                contents.append({key: renderer})
+        if shelf:
+            contents.append({"reelShelfRenderer": {"items": shelf}})
+        contents.append(continuation_item("search-token"))
+        data = {"contents": {"twoColumnSearchResultsRenderer": {"primaryContents": {
+            "sectionListRenderer": {"contents": [{"itemSectionRenderer": {"contents": contents}}]}
+        }}}}
+        return data, contents
+
+    if kind == "hashtag":
+        # 해시태그: richGridRenderer → richItemRenderer.content
+        contents = [{"richItemRenderer": {"content": {key: renderer}}} for key, renderer in mixed_renderers(count, rng)]
+        contents.append(continuation_item("hashtag-token"))
+        data = {"contents": {"twoColumnBrowseResultsRenderer": {"tabs": [{"tabRenderer": {
+            "content": {"richGridRenderer": {"contents": contents}}
+        }}]}}}
+        return data, contents
+
+    if kind == "channel":
+        # 채널 동영상 탭: gridRenderer 안의 gridVideoRenderer (릴 포함)
+        contents = [{key: renderer} for key, renderer in mixed_renderers(count, rng, grid=True)]
+        contents.append(continuation_item("channel-token"))
+        data = {"contents": {"twoColumnBrowseResultsRenderer": {"tabs": [
+            {"tabRenderer": {"title": "홈", "content": {}}},
+            {"tabRenderer": {"title": "동영상", "selected": True, "content": {"sectionListRenderer": {"contents": [
+                {"itemSectionRenderer": {"contents": [{"gridRenderer": {"items": contents}}]}}
+            ]}}}}
+        ]}}}
+        return data, contents
+
+    if kind == "continuation":
+        # 연속 페이지 AJAX 응답
+        contents = [{key: renderer} for key, renderer in mixed_renderers(count, rng)]
+        contents.append(continuation_item("next-token"))
+        data = {"onResponseReceivedCommands": [{"appendContinuationItemsAction": {"continuationItems": contents}}]}
+        return data, contents
+
+    raise ValueError(f"지원하지 않는 페이로드 종류입니다: {kind}")
+
+
+def build_stages(data, items):
+    """(단계 이름, 실행 함수, 처리 항목 수, 반복 전 초기화 함수) 목록"""
+    renderers = [(kind, payload) for kind, payload in walk_renderers(data) if kind != CONTINUATION_RENDERER_KEY]
+    videos = [payload for kind, payload in renderers if kind != "reelItemRenderer"]
+    shorts = [(payload, kind == "reelItemRenderer") for kind, payload in renderers
+              if kind == "reelItemRenderer" or detect_if_short(payload)]
+    view_texts = [payload.get("viewCountText", {}).get("simpleText", "") for _, payload in renderers]
+
+    def no_setup():
+        pass
+
+    return [
+        ("walk_renderers", lambda: sum(1 for _ in walk_renderers(data)), len(renderers), no_setup),
+        ("detect_if_short", lambda: [detect_if_short(video) for video in videos], len(videos), no_setup),
+        ("extract_video_info", lambda: [extract_video_info(video, is_reel) for video, is_reel in shorts],
+         len(shorts), no_setup),
+        ("parse_view_count_cold", lambda: [parse_view_count(text) for text in view_texts],
+         len(view_texts), parse_view_count.cache_clear),
+        ("parse_view_count_warm", lambda: [parse_view_count(text) for text in view_texts],
+         len(view_texts), no_setup),
+        ("extract_shorts_from_data", lambda: extract_shorts_from_data(data), len(renderers), no_setup),
+        ("process_items", lambda: process_items(items), len(renderers), no_setup),
+    ]
+
+
+def measure_stage(func, setup, repeat):
+    """(최소 ms, 평균 ms, 최대 메모리 KB) - 메모리는 시간 측정과 분리해 한 번 더 실행"""
+    timings = []
+    for _ in range(repeat):
+        setup()
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    setup()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings), sum(timings) / len(timings), peak / 1024
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, previous_path):
+    """이전 결과 파일과 단계별 최소 시간 비교 출력"""
+    with open(previous_path, "r", encoding="utf-8") as f:
+        previous = json.load(f)
+    before = {(r["payload"], r["size"], r["stage"]): r["best_ms"] for r in previous.get("results", [])}
+    print(f"\n이전 결과와 비교 ({previous_path}, {previous.get('meta', {}).get('git_revision')})")
+    for r in results:
+        old = before.get((r["payload"], r["size"], r["stage"]))
+        if old:
+            print(f"{r['payload']:<13} {r['size']:>6} {r['stage']:<26} {old:>9.2f} → {r['best_ms']:>9.2f}ms "
+                  f"({(r['best_ms'] - old) / old:+.0%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="페이지 파서 단계별 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="페이지당 렌더러 수 (기본값: 50 500 5000)")
+    parser.add_argument("--payloads", nargs="+", choices=PAYLOAD_KINDS, default=list(PAYLOAD_KINDS),
+                        help="페이로드 종류 (기본값: 전체)")
+    parser.add_argument("--repeat", type=int, default=5, help="단계별 반복 횟수 (기본값: 5)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/parsers_<시각>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'페이로드':<13} {'크기':>6} {'단계':<26} {'최소(ms)':>10} {'평균(ms)':>10} {'항목당(us)':>10} {'최대(KB)':>10}")
+    for kind in args.payloads:
+        for size in args.sizes:
+            data, items = build_payload(kind, size)
+            for stage, func, item_count, setup in build_stages(data, items):
+                best_ms, mean_ms, peak_kb = measure_stage(func, setup, max(1, args.repeat))
+                per_item_us = best_ms * 1000 / item_count if item_count else 0.0
+                results.append({
+                    "payload": kind,
+                    "size": size,
+                    "stage": stage,
+                    "items": item_count,
+                    "best_ms": round(best_ms, 4),
+                    "mean_ms": round(mean_ms, 4),
+                    "per_item_us": round(per_item_us, 3),
+                    "peak_kb": round(peak_kb, 1)
+                })
+                print(f"{kind:<13} {size:>6} {stage:<26} {best_ms:>10.2f} {mean_ms:>10.2f} {per_item_us:>10.2f} {peak_kb:>10.1f}")
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"parsers_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "meta": {
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "git_revision": git_revision(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "repeat": args.repeat,
+                "sizes": args.sizes
+            },
+            "results": results
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
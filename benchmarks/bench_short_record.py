@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+쇼츠 레코드 메모리 벤치마크
+합성 레코드 N개를 기존 dict 형태와 ShortRecord로 만들어 tracemalloc 기준 메모리와 변환 시간을 비교
+
+사용법:
+    python benchmarks/bench_short_record.py [--count N] [--channels N]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+# 상위 디렉토리 import를 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from youtube.l_short_record import ShortRecord
+
+
+def synthetic_fields(i, channel_count):
+    """실제 파싱 결과처럼 매번 새로 만들어진 문자열로 필드 구성 (채널은 channel_count개에서 반복)"""
+    channel = i % channel_count
+    return {
+        "video_id": f"vid{i:08d}",
+        "title": f"합성 쇼츠 제목 {i} #shorts #동물",
+        "view_count_text": f"조회수 {i % 97}.{i % 10}만회",
+        "views": (i % 97) * 10000 + (i % 10) * 1000,
+        "published_time": "".join([str(i % 7), "일 전"]),
+        "published_at": 1700000000.0 - (i % 7) * 86400,
+        "channel_name": "".join(["합성 채널 ", str(channel)]),
+        "channel_id": "".join(["UC", f"{channel:022d}"]),
+        "thumbnail_url": f"https://i.ytimg.com/vi/vid{i:08d}/hq720.jpg?sqp=-oaymwEXCNAFEJQDSFryq4qpAwkIARUAAIhCGAE=",
+        "description": f"합성 설명 텍스트 {i} " * 3,
+    }
+
+
+def build_dicts(count, channel_count):
+    records = []
+    for i in range(count):
+        fields = synthetic_fields(i, channel_count)
+        fields["video_url"] = f"https://www.youtube.com/shorts/{fields['video_id']}"
+        records.append(fields)
+    return records
+
+
+def build_records(count, channel_count):
+    return [ShortRecord(**synthetic_fields(i, channel_count)) for i in range(count)]
+
+
+def measure(builder, count, channel_count):
+    """(레코드 목록, 유지 메모리 바이트, 최대 메모리 바이트, 생성 시간 초)"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    records = builder(count, channel_count)
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return records, current, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="쇼츠 레코드 메모리 벤치마크")
+    parser.add_argument("--count", type=int, default=100000, help="레코드 수 (기본값: 100000)")
+    parser.add_argument("--channels", type=int, default=2000, help="서로 다른 채널 수 (기본값: 2000)")
+    args = parser.parse_args()
+
+    dicts, dict_current, dict_peak, dict_time = measure(build_dicts, args.count, args.channels)
+    del dicts
+    records, record_current, record_peak, record_time = measure(build_records, args.count, args.channels)
+
+    started = time.perf_counter()
+    converted = [record.to_dict() for record in records]
+    to_dict_time = time.perf_counter() - started
+    started = time.perf_counter()
+    restored = [ShortRecord.from_dict(data) for data in converted]
+    from_dict_time = time.perf_counter() - started
+    assert restored[-1] == records[-1]
+
+    mb = 1024 * 1024
+    print(f"레코드 {args.count:,}개 / 채널 {args.channels:,}개")
+    print(f"{'형태':<14} {'유지(MB)':>10} {'최대(MB)':>10} {'생성(s)':>10} {'레코드당(B)':>12}")
+    print(f"{'dict':<14} {dict_current / mb:>10.1f} {dict_peak / mb:>10.1f} {dict_time:>10.3f} {dict_current / args.count:>12.0f}")
+    print(f"{'ShortRecord':<14} {record_current / mb:>10.1f} {record_peak / mb:>10.1f} {record_time:>10.3f} {record_current / args.count:>12.0f}")
+    print(f"메모리 절감: {1 - record_current / dict_current:.0%}")
+    print(f"to_dict: {to_dict_time:.3f}s / from_dict: {from_dict_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
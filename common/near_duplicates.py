@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+유사 중복(재업로드) 탐지 모듈
+정규화한 제목+설명의 MinHash 서명을 LSH 버킷에 넣어, 레코드가 들어오는 대로
+전체 비교 없이 유사 중복 묶음(클러스터)을 만들고 묶음마다 대표 영상을 유지
+"""
+
+import re
+import array
+import hashlib
+import threading
+import unicodedata
+
+DEFAULT_NUM_PERM = 64  # MinHash 서명 길이
+DEFAULT_BANDS = 16  # LSH 밴드 수 (밴드당 행 수 = NUM_PERM / BANDS)
+DEFAULT_THRESHOLD = 0.7  # 같은 묶음으로 볼 추정 자카드 유사도
+DEFAULT_SHINGLE_SIZE = 3  # 문자 n-gram 크기 (띄어쓰기가 달라도 같은 조각이 나오도록 공백 제거 후)
+
+# 재업로드마다 붙었다 빠졌다 하는 일반 태그는 지문에서 제외
+GENERIC_TAGS = frozenset(["shorts", "short", "shortsvideo", "쇼츠", "youtubeshorts", "viral", "fyp"])
+
+
+def normalize_text(title, description=""):
+    """지문용 정규화 (NFKC, 소문자, 특수문자/이모지/일반 태그 제거, 공백 제거)"""
+    text = unicodedata.normalize("NFKC", f"{title or ''} {description or ''}").lower()
+    words = re.findall(r'[\w가-힣]+', text)
+    return "".join(word for word in words if word not in GENERIC_TAGS)
+
+
+def shingles(text, size=DEFAULT_SHINGLE_SIZE):
+    """문자 n-gram 집합 (글자가 size보다 적으면 전체 문자열 하나)"""
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class MinHasher:
+    """
+    MinHash 서명 계산기 (실행 간 같은 서명)
+
+    n-gram마다 SHAKE-128 출력 하나를 num_perm개의 32비트 해시값으로 나눠 쓰고
+    열별 최솟값을 서명으로 삼는다. 순열 num_perm개를 파이썬 반복문으로 계산하는 것보다
+    해시 한 번 + C 수준의 min으로 끝나 훨씬 빠르다.
+    """
+
+    def __init__(self, num_perm=DEFAULT_NUM_PERM, seed=1):
+        self.num_perm = num_perm
+        self._digest_size = num_perm * 4
+        self._salt = f"{seed}:".encode("utf-8")
+
+    def signature(self, shingle_set):
+        """n-gram 집합의 MinHash 서명 (빈 집합이면 None)"""
+        if not shingle_set:
+            return None
+        rows = [
+            array.array("I", hashlib.shake_128(self._salt + shingle.encode("utf-8")).digest(self._digest_size))
+            for shingle in shingle_set
+        ]
+        return tuple(map(min, zip(*rows)))
+
+
+def estimate_similarity(signature_a, signature_b):
+    """두 서명의 일치 비율 (자카드 유사도 추정치)"""
+    matches = sum(1 for x, y in zip(signature_a, signature_b) if x == y)
+    return matches / len(signature_a)
+
+
+# add() 결과
+NEW_CLUSTER = "new"  # 새 묶음의 첫 영상
+DUPLICATE = "duplicate"  # 기존 묶음에 들어갔고 대표는 그대로
+NEW_CANONICAL = "canonical"  # 기존 묶음에 들어가 대표가 됨 (조회수가 더 높음)
+
+
+class NearDuplicateIndex:
+    """
+    유사 중복 클러스터링 인덱스 (스레드 안전)
+
+    서명을 BANDS개 밴드로 나눠 밴드별 버킷에 넣고, 같은 버킷에 걸린 영상만
+    서명을 비교하므로 영상 수가 늘어도 비교 횟수는 거의 늘지 않는다.
+    추정 유사도가 threshold 이상인 영상이 있으면 그 영상의 묶음에 넣는다 (단일 연결).
+    묶음 ID는 첫 영상의 video_id이며, 대표는 묶음에서 조회수가 가장 높은 영상이다.
+    """
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, num_perm=DEFAULT_NUM_PERM, bands=DEFAULT_BANDS,
+                 shingle_size=DEFAULT_SHINGLE_SIZE):
+        if num_perm % bands:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})의 배수여야 합니다.")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self._hasher = MinHasher(num_perm)
+
+        self._lock = threading.Lock()
+        self._buckets = {}  # (밴드 번호, 밴드 값) -> [video_id]
+        self._signatures = {}  # video_id -> 서명
+        self._cluster_of = {}  # video_id -> 묶음 ID
+        self._clusters = {}  # 묶음 ID -> {"canonical": 레코드, "owner": 대표를 담은 결과 모음, "size": 영상 수}
+        self.comparisons = 0
+
+    def __len__(self):
+        return len(self._clusters)
+
+    def _band_keys(self, signature):
+        return [(band, signature[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+
+    def add(self, record):
+        """
+        레코드를 인덱스에 넣고 묶음 배정
+
+        Returns:
+            (묶음 ID, 상태, 이전 대표): 상태는 NEW_CLUSTER/DUPLICATE/NEW_CANONICAL,
+            이전 대표는 NEW_CANONICAL일 때 대표 자리를 내준 레코드 (그 외 None)
+        """
+        cluster_id, status, previous, _ = self.add_owned(record, None)
+        return cluster_id, status, previous
+
+    def add_owned(self, record, owner):
+        """
+        add()와 같되 대표를 담는 결과 모음(owner)도 기록
+
+        여러 키워드가 인덱스를 공유할 때 이전 대표가 어느 결과 모음에 들어갔는지 알려 준다.
+        이전 대표의 owner가 다르면 새 대표는 어느 결과에도 없으므로 owner를 None으로 둔다.
+
+        Returns:
+            (묶음 ID, 상태, 이전 대표, 이전 대표의 owner)
+        """
+        video_id = record.get("video_id", "")
+        signature = self._hasher.signature(shingles(
+            normalize_text(record.get("title", ""), record.get("description", "")), self.shingle_size
+        ))
+
+        with self._lock:
+            if video_id in self._cluster_of:
+                return self._cluster_of[video_id], DUPLICATE, None, None
+
+            # 같은 버킷에 걸린 후보 중 가장 비슷한 영상의 묶음으로
+            best_id, best_similarity = None, self.threshold
+            band_keys = self._band_keys(signature) if signature else []
+            if band_keys:
+                candidates = set()
+                for key in band_keys:
+                    candidates.update(self._buckets.get(key, ()))
+                for candidate in candidates:
+                    self.comparisons += 1
+                    similarity = estimate_similarity(signature, self._signatures[candidate])
+                    if similarity >= best_similarity:
+                        best_id, best_similarity = candidate, similarity
+                self._signatures[video_id] = signature
+
+            # 같은 묶음의 영상이 이미 있는 버킷에는 넣지 않음 (재업로드가 많아도 버킷이 커지지 않도록)
+            cluster_id = self._cluster_of[best_id] if best_id is not None else video_id
+            for key in band_keys:
+                bucket = self._buckets.setdefault(key, [])
+                if not any(self._cluster_of[member] == cluster_id for member in bucket):
+                    bucket.append(video_id)
+
+            # 제목/설명이 비어 있으면 비교할 수 없으므로 혼자 묶음
+            if best_id is None:
+                self._cluster_of[video_id] = video_id
+                self._clusters[video_id] = {"canonical": record, "owner": owner, "size": 1}
+                return video_id, NEW_CLUSTER, None, None
+
+            cluster = self._clusters[cluster_id]
+            self._cluster_of[video_id] = cluster_id
+            cluster["size"] += 1
+            previous = cluster["canonical"]
+            if record.get("views", 0) > previous.get("views", 0):
+                previous_owner = cluster["owner"]
+                cluster["canonical"] = record
+                cluster["owner"] = owner if previous_owner is owner else None
+                return cluster_id, NEW_CANONICAL, previous, previous_owner
+            return cluster_id, DUPLICATE, None, None
+
+    def cluster_of(self, video_id):
+        """영상이 속한 묶음 ID (모르는 영상이면 None)"""
+        with self._lock:
+            return self._cluster_of.get(video_id)
+
+    def canonical(self, cluster_id):
+        """묶음의 대표 레코드"""
+        with self._lock:
+            cluster = self._clusters.get(cluster_id)
+            return cluster["canonical"] if cluster else None
+
+    def clusters(self):
+        """[{"cluster_id", "canonical", "size"}] (묶음 크기 내림차순)"""
+        with self._lock:
+            items = [
+                {"cluster_id": cluster_id, "canonical": cluster["canonical"], "size": cluster["size"]}
+                for cluster_id, cluster in self._clusters.items()
+            ]
+        items.sort(key=lambda item: -item["size"])
+        return items
+
+    def stats(self):
+        """영상 수, 묶음 수, 유사 중복으로 묶인 영상 수, 서명 비교 횟수"""
+        with self._lock:
+            videos = len(self._cluster_of)
+            clusters = len(self._clusters)
+            return {
+                "videos": videos,
+                "clusters": clusters,
+                "near_duplicates": videos - clusters,
+                "comparisons": self.comparisons
+            }
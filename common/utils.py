@@ -1,5 +1,7 @@
 import os
 import json
+import time
+import threading
 from datetime import datetime
 
 today = datetime.now().strftime("%Y%m%d")
@@ -21,6 +23,12 @@ def check_file_exists(target):
     filename = f"{directory}/{target}_{today}.json"
     return filename
 
+def _to_json(value):
+    """레코드 객체(youtube.l_short_record.ShortRecord 등)를 JSON 저장용 dict로 변환"""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 def save_results(target, data):
     """검색 결과를 날짜 기반 디렉토리에 저장"""
     
@@ -33,7 +41,184 @@ def save_results(target, data):
     
     # 파일 저장
     with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        json.dump(data, f, ensure_ascii=False, indent=2, default=_to_json)
     
     print(f"✅ 결과가 '{filename}' 파일로 저장되었습니다.")
-    return filename
\ No newline at end of file
+    return filename
+
+
+def meta_filename_for(filename):
+    """결과 파일의 메타데이터 사이드카 경로 (x.jsonl -> x.meta.json)"""
+    if filename.endswith(".jsonl"):
+        return filename[:-len(".jsonl")] + ".meta.json"
+    return filename + ".meta.json"
+
+def load_superseded_ids(filename):
+    """사이드카에 기록된 무효 레코드(대표가 교체된 유사 중복) ID 집합 (없으면 빈 집합)"""
+    meta_filename = meta_filename_for(filename)
+    if not os.path.exists(meta_filename):
+        return set()
+    try:
+        with open(meta_filename, "r", encoding="utf-8") as f:
+            return set(json.load(f).get("superseded_ids", []))
+    except (OSError, ValueError, AttributeError):
+        return set()
+
+
+class ResultStream:
+    """
+    수집 결과를 JSONL(한 줄에 레코드 하나)로 바로바로 추가 기록
+    
+    flush_every개 또는 flush_interval초마다 파일에 내보내므로 크롤링이 중간에 죽어도
+    그때까지의 결과가 남고, 다음 단계가 파일을 먼저 읽기 시작할 수 있다.
+    메타데이터는 같은 이름의 .meta.json 사이드카 파일에 저장하며 close() 때 complete가 True가 된다.
+    이미 기록한 레코드를 retract()로 무효 표시하면 사이드카에 ID를 남기고(중간에 읽는 쪽은
+    load_superseded_ids로 건너뜀), close() 때 파일에서 제거한다.
+    """
+    
+    def __init__(self, filename, metadata=None, flush_every=10, flush_interval=5.0):
+        self.filename = filename
+        self.meta_filename = meta_filename_for(filename)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.count = 0
+        self.metadata = dict(metadata or {})
+        
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._superseded = set()  # retract()된 video_id
+        self._file = open(filename, "w", encoding="utf-8")
+        self._write_metadata(complete=False)
+    
+    def _write_metadata(self, complete):
+        metadata = dict(self.metadata, total_items=self.count, complete=complete)
+        if self._superseded:
+            metadata["superseded_ids"] = sorted(self._superseded)
+        with open(self.meta_filename, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, ensure_ascii=False, indent=2)
+    
+    def write(self, record):
+        """레코드 하나 추가"""
+        self.write_all([record])
+    
+    def write_all(self, records):
+        """레코드 여러 개 추가 (필요하면 flush)"""
+        lines = [json.dumps(record, ensure_ascii=False, default=_to_json) + "\n" for record in records]
+        if not lines:
+            return
+        with self._lock:
+            self._file.writelines(lines)
+            self.count += len(lines)
+            self._pending += len(lines)
+            now = time.monotonic()
+            if self._pending >= self.flush_every or now - self._last_flush >= self.flush_interval:
+                self._file.flush()
+                self._pending = 0
+                self._last_flush = now
+    
+    def retract(self, video_ids):
+        """이미 기록한 레코드를 무효로 표시 (유사 중복의 대표가 바뀐 경우 등)"""
+        video_ids = [video_id for video_id in video_ids if video_id]
+        if not video_ids:
+            return
+        with self._lock:
+            self._superseded.update(video_ids)
+            self._write_metadata(complete=False)
+    
+    def carry_over(self, filename):
+        """
+        이전 실행(체크포인트에서 재개한 실행)의 결과 파일 내용을 이 스트림에 이어서 기록
+        
+        이전 파일의 사이드카에 무효로 표시된 레코드는 빼고 무효 ID는 이 스트림이 이어받는다.
+        중단될 때 쓰다 만 마지막 줄은 건너뛴다.
+        
+        Returns:
+            int: 옮긴 레코드 수 (파일이 없거나 이 스트림의 파일이면 None)
+        """
+        if not filename or filename == self.filename or not os.path.exists(filename):
+            return None
+        superseded = load_superseded_ids(filename)
+        carried = 0
+        with self._lock, open(filename, "r", encoding="utf-8") as source:
+            for line in source:
+                try:
+                    video_id = json.loads(line).get("video_id")
+                except ValueError:
+                    continue
+                if video_id in superseded:
+                    continue
+                self._file.write(line if line.endswith("\n") else line + "\n")
+                carried += 1
+            self._file.flush()
+            self.count += carried
+            self._superseded.update(superseded)
+            self.metadata["resumed_from"] = filename
+            self._write_metadata(complete=False)
+        return carried
+    
+    def _compact(self):
+        """무효로 표시된 레코드를 뺀 파일로 교체"""
+        temp_path = f"{self.filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+        kept = 0
+        with open(self.filename, "r", encoding="utf-8") as source, open(temp_path, "w", encoding="utf-8") as target:
+            for line in source:
+                try:
+                    video_id = json.loads(line).get("video_id")
+                except ValueError:
+                    continue
+                if video_id in self._superseded:
+                    continue
+                target.write(line)
+                kept += 1
+            target.flush()
+            os.fsync(target.fileno())
+        os.replace(temp_path, self.filename)
+        self.count = kept
+    
+    def close(self, metadata=None):
+        """파일을 닫고 최종 메타데이터(complete=True) 기록, JSONL 파일 경로 반환"""
+        with self._lock:
+            if self._file.closed:
+                return self.filename
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            if self._superseded:
+                self._compact()
+            if metadata:
+                self.metadata.update(metadata)
+            self._write_metadata(complete=True)
+        print(f"✅ 결과가 '{self.filename}' 파일로 저장되었습니다. ({self.count}개)")
+        return self.filename
+
+
+def reserve_result_filename(target):
+    """
+    이번 실행 전용 JSONL 파일 경로를 만들어 선점
+    
+    같은 날 같은 대상의 결과(또는 사이드카)가 이미 있으면 덮어쓰지 않고
+    {target}_{today}_2.jsonl, _3 ... 순으로 비어 있는 이름을 쓴다.
+    동시에 실행돼도 겹치지 않도록 빈 파일을 배타적으로 만들어 둔다.
+    """
+    run = 1
+    while True:
+        suffix = f"_{run}" if run > 1 else ""
+        filename = f"{directory}/{target}_{today}{suffix}.jsonl"
+        run += 1
+        if os.path.exists(meta_filename_for(filename)):
+            continue
+        try:
+            os.close(os.open(filename, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            continue
+        return filename
+
+def open_result_stream(target, metadata=None, **kwargs):
+    """날짜 기반 디렉토리에 이번 실행 전용 JSONL 결과 스트림 생성 (이전 실행 파일은 덮어쓰지 않음)"""
+    
+    # 디렉토리가 없으면 생성
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    
+    return ResultStream(reserve_result_filename(target), metadata, **kwargs)
@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+영상 인덱스 모듈
+수집한 쇼츠를 SQLite에 누적 (최초/최근 발견 시각, 조회수 스냅샷, 키워드/채널/날짜별 조회)
+"""
+
+import os
+import time
+import sqlite3
+import threading
+
+DEFAULT_INDEX_PATH = "data/video_index.sqlite3"
+MAX_QUERY_PARAMS = 500  # IN 조회 한 번에 넣을 최대 ID 수 (SQLite 변수 개수 제한 아래로)
+
+# 레코드 dict와 같은 이름을 쓰는 컬럼
+RECORD_COLUMNS = (
+    "video_id", "title", "view_count_text", "views", "published_time", "published_at",
+    "channel_name", "channel_id", "thumbnail_url", "description"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    video_id TEXT PRIMARY KEY,
+    title TEXT,
+    view_count_text TEXT,
+    views INTEGER,
+    published_time TEXT,
+    published_at REAL,
+    channel_name TEXT,
+    channel_id TEXT,
+    thumbnail_url TEXT,
+    description TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS video_keywords (
+    video_id TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    PRIMARY KEY (video_id, keyword)
+);
+CREATE TABLE IF NOT EXISTS view_snapshots (
+    video_id TEXT NOT NULL,
+    seen_at REAL NOT NULL,
+    views INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_videos_channel ON videos (channel_id);
+CREATE INDEX IF NOT EXISTS idx_videos_first_seen ON videos (first_seen);
+CREATE INDEX IF NOT EXISTS idx_videos_published_at ON videos (published_at);
+CREATE INDEX IF NOT EXISTS idx_video_keywords_keyword ON video_keywords (keyword);
+CREATE INDEX IF NOT EXISTS idx_view_snapshots_video ON view_snapshots (video_id, seen_at);
+"""
+
+
+class VideoIndex:
+    """수집한 영상을 실행 간에 기억하는 SQLite 인덱스"""
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def known_ids(self):
+        """인덱스에 있는 모든 영상 ID 집합"""
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT video_id FROM videos")}
+
+    def known_among(self, video_ids):
+        """video_ids 중 인덱스에 있는 ID 집합 (페이지 단위 IN 조회, 테이블 전체를 읽지 않음)"""
+        video_ids = [video_id for video_id in dict.fromkeys(video_ids) if video_id]
+        known = set()
+        with self._lock:
+            for start in range(0, len(video_ids), MAX_QUERY_PARAMS):
+                chunk = video_ids[start:start + MAX_QUERY_PARAMS]
+                rows = self._conn.execute(
+                    f"SELECT video_id FROM videos WHERE video_id IN ({', '.join('?' for _ in chunk)})", chunk
+                )
+                known.update(row[0] for row in rows)
+        return known
+
+    def touch(self, observations, seen_at=None):
+        """
+        이미 인덱스에 있는 영상의 최근 발견 시각과 조회수만 한 트랜잭션으로 갱신
+
+        observations는 [(video_id, views)]이며, 조회수를 모르면(0) 발견 시각만 갱신하고
+        스냅샷은 남기지 않는다. 렌더러 단계에서 걸러져 레코드가 만들어지지 않은 영상용.
+        """
+        if not observations:
+            return
+        seen_at = seen_at or time.time()
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE videos SET last_seen = ?, views = CASE WHEN ? > 0 THEN ? ELSE views END WHERE video_id = ?",
+                    [(seen_at, views, views, video_id) for video_id, views in observations]
+                )
+                self._conn.executemany(
+                    "INSERT INTO view_snapshots (video_id, seen_at, views) "
+                    "SELECT ?, ?, ? WHERE EXISTS (SELECT 1 FROM videos WHERE video_id = ?)",
+                    [(video_id, seen_at, views, video_id) for video_id, views in observations if views > 0]
+                )
+
+    def record_page(self, seen_shorts, accepted_shorts, keyword=None, seen_at=None):
+        """
+        한 페이지 처리 결과를 한 트랜잭션으로 반영
+
+        accepted_shorts(필터 통과)는 새로 넣거나 최신 정보로 갱신하고 키워드와 연결한다.
+        나머지 seen_shorts 중 이미 인덱스에 있는 영상은 최근 발견 시각과 조회수만 갱신한다.
+        두 경우 모두 조회수 스냅샷을 남긴다.
+        """
+        if not seen_shorts and not accepted_shorts:
+            return
+        seen_at = seen_at or time.time()
+        accepted_ids = {short.get("video_id") for short in accepted_shorts}
+
+        upserts = [
+            tuple(short.get(column) for column in RECORD_COLUMNS) + (seen_at, seen_at)
+            for short in accepted_shorts if short.get("video_id")
+        ]
+        touches = [
+            (seen_at, short.get("views", 0), short.get("video_id"))
+            for short in seen_shorts
+            if short.get("video_id") and short.get("video_id") not in accepted_ids
+        ]
+        snapshots = [
+            (short.get("video_id"), seen_at, short.get("views", 0), short.get("video_id"))
+            for short in list(accepted_shorts) + [s for s in seen_shorts if s.get("video_id") not in accepted_ids]
+            if short.get("video_id")
+        ]
+
+        placeholders = ", ".join("?" for _ in RECORD_COLUMNS)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in RECORD_COLUMNS if column != "video_id")
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    f"INSERT INTO videos ({', '.join(RECORD_COLUMNS)}, first_seen, last_seen) "
+                    f"VALUES ({placeholders}, ?, ?) "
+                    f"ON CONFLICT(video_id) DO UPDATE SET {updates}, last_seen = excluded.last_seen",
+                    upserts
+                )
+                if keyword:
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO video_keywords (video_id, keyword, first_seen) VALUES (?, ?, ?)",
+                        [(row[0], keyword, seen_at) for row in upserts]
+                    )
+                self._conn.executemany(
+                    "UPDATE videos SET last_seen = ?, views = ? WHERE video_id = ?", touches
+                )
+                self._conn.executemany(
+                    "INSERT INTO view_snapshots (video_id, seen_at, views) "
+                    "SELECT ?, ?, ? WHERE EXISTS (SELECT 1 FROM videos WHERE video_id = ?)",
+                    snapshots
+                )
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params).fetchall()]
+
+    def videos_by_keyword(self, keyword, limit=None):
+        """키워드로 수집된 영상 (조회수 높은 순)"""
+        sql = ("SELECT v.* FROM videos v JOIN video_keywords k ON k.video_id = v.video_id "
+               "WHERE k.keyword = ? ORDER BY v.views DESC")
+        params = [keyword]
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._query(sql, params)
+
+    def videos_by_channel(self, channel_id, limit=None):
+        """채널별 수집된 영상 (최근 발견 순)"""
+        sql = "SELECT * FROM videos WHERE channel_id = ? ORDER BY last_seen DESC"
+        params = [channel_id]
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._query(sql, params)
+
+    def videos_first_seen_between(self, start, end=None):
+        """기간 내에 처음 발견된 영상 (epoch 초)"""
+        end = end if end is not None else time.time()
+        return self._query(
+            "SELECT * FROM videos WHERE first_seen BETWEEN ? AND ? ORDER BY first_seen", (start, end)
+        )
+
+    def videos_published_between(self, start, end=None):
+        """기간 내에 게시된 것으로 추정되는 영상 (epoch 초)"""
+        end = end if end is not None else time.time()
+        return self._query(
+            "SELECT * FROM videos WHERE published_at BETWEEN ? AND ? ORDER BY published_at", (start, end)
+        )
+
+    def view_history(self, video_id):
+        """영상의 조회수 스냅샷 목록 (시간순)"""
+        return self._query(
+            "SELECT seen_at, views FROM view_snapshots WHERE video_id = ? ORDER BY seen_at", (video_id,)
+        )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+테스트 공용 픽스처
+네트워크 대신 결정적인 가짜 YouTube 전송 객체를 f_http_client.set_transport로 주입하고,
+상대 경로(data/...)에 쓰는 캐시/체크포인트/통계 파일이 테스트마다 임시 디렉토리에 생기도록 격리
+"""
+
+import os
+import sys
+import json
+import random
+import hashlib
+import threading
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from youtube import f_http_client, g_response_cache, j_rate_limiter, o_keyword_expansion  # noqa: E402
+
+TITLE_WORDS = ["고양이", "강아지", "햄스터", "앵무새", "거북이", "토끼", "여우", "수달", "판다", "펭귄",
+               "기린", "코끼리", "하마", "사자", "호랑이", "다람쥐", "고슴도치", "너구리", "알파카", "미어캣"]
+
+
+class FakeResponse:
+    """requests.Response에서 크롤러가 쓰는 속성만 가진 응답"""
+
+    def __init__(self, url, body, status_code=200, headers=None):
+        self.url = url
+        self.status_code = status_code
+        self.content = body.encode("utf-8") if isinstance(body, str) else body
+        self.encoding = "utf-8"
+        self.headers = dict(headers or {})
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding)
+
+    def json(self):
+        return json.loads(self.content)
+
+
+def video_renderer(video_id, title=None, views_text="조회수 50만회", published="1일 전", channel_id="UCfake"):
+    """검색 결과의 쇼츠 videoRenderer 한 개"""
+    if title is None:
+        words = random.Random(video_id).sample(TITLE_WORDS, 6)
+        title = f"{' '.join(words)} {video_id} #shorts"
+    return {"videoRenderer": {
+        "videoId": video_id,
+        "title": {"runs": [{"text": title}]},
+        "viewCountText": {"simpleText": views_text},
+        "publishedTimeText": {"simpleText": published},
+        "ownerText": {"runs": [{"text": f"채널 {channel_id}",
+                                "navigationEndpoint": {"browseEndpoint": {"browseId": channel_id}}}]},
+        "navigationEndpoint": {"commandMetadata": {"webCommandMetadata": {"url": f"/shorts/{video_id}"}}},
+        "thumbnail": {"thumbnails": [{"url": f"https://i.ytimg.com/vi/{video_id}/frame0.jpg", "width": 405, "height": 720}]}
+    }}
+
+
+def continuation_item(token):
+    return {"continuationItemRenderer": {"continuationEndpoint": {"continuationCommand": {"token": token}}}}
+
+
+def search_page(videos, token=None):
+    """ytInitialData를 담은 검색 결과 HTML"""
+    contents = [{"itemSectionRenderer": {"contents": videos}}]
+    if token:
+        contents.append(continuation_item(token))
+    data = {"contents": {"twoColumnSearchResultsRenderer": {"primaryContents": {
+        "sectionListRenderer": {"contents": contents}
+    }}}}
+    return f"<html><script>var ytInitialData = {json.dumps(data, ensure_ascii=False)};</script></html>"
+
+
+def continuation_page(videos, token=None):
+    """연속 페이지(browse_ajax) JSON 응답"""
+    items = videos + [continuation_item(token)] if token else videos
+    return json.dumps({"onResponseReceivedActions": [{"appendContinuationItemsAction": {"continuationItems": items}}]},
+                      ensure_ascii=False)
+
+
+class FakeYouTube:
+    """
+    URL만으로 응답이 정해지는 가짜 YouTube
+
+    검색/해시태그 페이지마다 videos_per_page개의 쇼츠와 연속 토큰("{페이지 키}.1")을 주고,
+    연속 페이지는 토큰의 깊이가 pages_per_strategy에 닿을 때까지 다음 토큰을 준다.
+    영상 ID는 "{페이지 키}p{깊이}v{순번}"이라 어느 요청에서 나온 영상인지 알 수 있다.
+    renderers에 페이지 키/토큰 -> 렌더러 목록을 넣으면 그 페이지만 바꿀 수 있고,
+    statuses에 URL 일부 -> 상태 코드 목록을 넣으면 그 URL에 차례로 그 상태를 돌려준다.
+    """
+
+    def __init__(self, pages_per_strategy=3, videos_per_page=5, views_text="조회수 50만회", published="1일 전"):
+        self.pages_per_strategy = pages_per_strategy
+        self.videos_per_page = videos_per_page
+        self.views_text = views_text
+        self.published = published
+        self.renderers = {}
+        self.statuses = {}
+        self.publish_dates = {}
+        self.on_request = None  # 요청마다 호출할 함수 (url) - 중단 시점 조절용
+        self.calls = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def page_key(url):
+        return hashlib.md5(url.encode("utf-8")).hexdigest()[:6]
+
+    def videos(self, key, depth):
+        return [video_renderer(f"{key}p{depth}v{index}", views_text=self.views_text, published=self.published)
+                for index in range(self.videos_per_page)]
+
+    def requests_for(self, fragment):
+        with self._lock:
+            return [url for url in self.calls if fragment in url]
+
+    def get(self, url, headers=None, timeout=None):
+        with self._lock:
+            self.calls.append(url)
+            for fragment, statuses in self.statuses.items():
+                if fragment in url and statuses:
+                    return FakeResponse(url, "", statuses.pop(0))
+        if self.on_request is not None:
+            self.on_request(url)
+
+        parsed = urlparse(url)
+        if "suggestqueries" in parsed.netloc:
+            if "google" in parsed.netloc:
+                return FakeResponse(url, json.dumps(["", []]))
+            return FakeResponse(url, 'google.sbox.p50(["", []])')
+
+        if parsed.path.startswith("/shorts/"):
+            video_id = parsed.path[len("/shorts/"):]
+            publish_date = self.publish_dates.get(video_id)
+            body = f'<html>"publishDate":"{publish_date}"</html>' if publish_date else "<html></html>"
+            return FakeResponse(url, body)
+
+        if parsed.path == "/browse_ajax":
+            token = parse_qs(parsed.query)["continuation"][0]
+            key, depth = token.rsplit(".", 1)
+            depth = int(depth)
+            items = self.renderers.get(token)
+            if items is None:
+                items = self.videos(key, depth)
+            next_token = f"{key}.{depth + 1}" if depth + 1 < self.pages_per_strategy else None
+            return FakeResponse(url, continuation_page(items, next_token))
+
+        key = self.page_key(url)
+        items = self.renderers.get(key)
+        if items is None:
+            items = self.videos(key, 0)
+        next_token = f"{key}.1" if self.pages_per_strategy > 1 else None
+        return FakeResponse(url, search_page(items, next_token))
+
+
+@pytest.fixture(autouse=True)
+def isolated(tmp_path, monkeypatch):
+    """
+    작업 디렉토리를 임시 디렉토리로 바꾸고 공유 객체(응답 캐시, 속도 제한기, 연관 검색어 확장기)를
+    테스트용으로 교체 (끝나면 원래대로)
+    """
+    monkeypatch.chdir(tmp_path)
+    previous_cache = g_response_cache.set_response_cache(None)
+    previous_limiter = j_rate_limiter.set_rate_limiter(j_rate_limiter.AdaptiveRateLimiter(
+        initial_rate=1e6, max_rate=1e6, burst=1e6, throttle_penalty=0.0, error_penalty=0.0, jitter=0.0
+    ))
+    previous_expander = o_keyword_expansion.set_keyword_expander(
+        o_keyword_expansion.KeywordExpander(max_depth=1, cache_path=None)
+    )
+    yield tmp_path
+    g_response_cache.set_response_cache(previous_cache)
+    j_rate_limiter.set_rate_limiter(previous_limiter)
+    o_keyword_expansion.set_keyword_expander(previous_expander)
+
+
+@pytest.fixture(autouse=True)
+def fake_youtube(isolated):
+    """모든 요청을 받는 가짜 YouTube (테스트가 실제 네트워크에 나가지 않도록 항상 설치)"""
+    fake = FakeYouTube()
+    previous = f_http_client.set_transport(fake)
+    yield fake
+    f_http_client.set_transport(previous)
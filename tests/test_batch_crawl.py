@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""여러 키워드 동시 크롤링 테스트 (youtube.a_keyword.crawl_keywords)"""
+
+import json
+import threading
+
+from conftest import video_renderer
+from youtube.a_keyword import crawl_keywords
+from youtube.e_data_filters import SharedIdSet, RunIdSet, claim_id
+
+
+def read_ids(filename):
+    with open(filename, "r", encoding="utf-8") as f:
+        return [json.loads(line)["video_id"] for line in f]
+
+
+def test_shared_id_set_claims_each_id_once_across_threads():
+    shared = SharedIdSet()
+    claimed = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(8)
+
+    def claim():
+        barrier.wait()
+        mine = [video_id for video_id in range(1000) if claim_id(shared, video_id)]
+        with lock:
+            claimed.extend(mine)
+
+    threads = [threading.Thread(target=claim) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(claimed) == list(range(1000))
+
+
+def test_run_id_set_tracks_only_this_run():
+    shared = SharedIdSet({"other"})
+    run_ids = RunIdSet(shared)
+
+    assert "other" in run_ids and not run_ids.claim("other")
+    assert run_ids.claim("mine")
+    run_ids.update(["restored"])
+    assert set(run_ids) == {"mine", "restored"} and len(run_ids) == 2
+    assert shared == {"other", "mine", "restored"}
+
+
+def test_keywords_do_not_collect_the_same_video_twice(fake_youtube):
+    # 어느 키워드로 검색해도 같은 영상이 나오는 페이지
+    fake_youtube.videos = lambda key, depth: [video_renderer(f"shared{depth}v{index}") for index in range(5)]
+
+    summary = crawl_keywords(["고양이", "강아지", "고양이 "], max_results=50, max_workers=2)
+
+    assert set(summary["files"]) == {"고양이", "강아지"}
+    per_keyword = [read_ids(filename) for filename in summary["files"].values()]
+    all_ids = [video_id for ids in per_keyword for video_id in ids]
+    assert len(all_ids) == len(set(all_ids)) == 15
+    assert sorted(read_ids(summary["merged_file"])) == sorted(all_ids)
+    assert sum(stats["total_items"] for stats in summary["stats"].values()) == 15
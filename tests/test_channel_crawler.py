@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""채널 후속 탐색 테스트 (youtube.q_channel_crawler)"""
+
+import datetime
+
+from youtube.q_channel_crawler import ChannelFrontier, crawl_channels, channel_shorts_url
+
+
+def reel_renderer(video_id, views_text="조회수 50만회"):
+    """채널 쇼츠 탭의 릴 (게시 시간 문구와 채널 정보가 없음)"""
+    return {"reelItemRenderer": {
+        "videoId": video_id,
+        "headline": {"simpleText": f"릴 {video_id}"},
+        "viewCountText": {"simpleText": views_text},
+        "thumbnail": {"thumbnails": [{"url": f"https://i.ytimg.com/vi/{video_id}/frame0.jpg"}]}
+    }}
+
+
+def test_frontier_orders_by_video_count_then_yield():
+    frontier = ChannelFrontier()
+    frontier.push("low", {"video_count": 1}, "u1")
+    frontier.push("high_slow", {"video_count": 5}, "u2", filter_yield=0.2)
+    frontier.push("high_fast", {"video_count": 5}, "u3", filter_yield=0.8)
+    frontier.push("high_fast_later", {"video_count": 5}, "u4", filter_yield=0.8)
+
+    assert [frontier.pop()["channel_id"] for _ in range(len(frontier))] == [
+        "high_fast", "high_fast_later", "high_slow", "low"
+    ]
+
+
+def test_reels_get_publish_dates_and_undated_reels_stay_unseen(fake_youtube):
+    fake_youtube.renderers[fake_youtube.page_key(channel_shorts_url("UCa"))] = [
+        reel_renderer("new"), reel_renderer("old"), reel_renderer("unknown"), reel_renderer("low", "조회수 10회")
+    ]
+    fake_youtube.publish_dates = {"new": datetime.date.today().isoformat(), "old": "2020-01-01"}
+    channels = {"UCa": {"name": "채널 A", "video_count": 3}}
+    results, existing_ids = [], set()
+
+    added = crawl_channels(channels, results, existing_ids, 100000, 3, max_results=100, max_channel_depth=1)
+
+    reels = [short for short in results if short["video_id"] in ("new", "old", "unknown", "low")]
+    assert [short["video_id"] for short in reels] == ["new"]
+    assert reels[0]["published_time"] and reels[0]["published_at"]
+    assert (reels[0]["channel_id"], reels[0]["channel_name"]) == ("UCa", "채널 A")
+    assert {"old", "low"} <= existing_ids and "unknown" not in existing_ids
+    # 통과한 영상이 있었으므로 연속 페이지 하나를 더 따라감
+    assert added == len(results) == 1 + fake_youtube.videos_per_page
+    assert channels["UCa"]["video_count"] == 3 + added
+    assert len(fake_youtube.requests_for("/shorts/")) == 3
+
+
+def test_channels_are_requested_in_priority_order_until_max_results(fake_youtube):
+    channels = {channel_id: {"name": channel_id, "video_count": count}
+                for channel_id, count in [("UCa", 1), ("UCb", 7), ("UCc", 4), ("UCd", 0)]}
+    results, processed_urls = [], {channel_shorts_url("UCc")}
+
+    added = crawl_channels(channels, results, set(), 100000, 3, max_results=6, max_channels=3,
+                           max_channel_depth=0, max_workers=1, processed_urls=processed_urls)
+
+    assert fake_youtube.requests_for("/channel/") == [channel_shorts_url("UCb"), channel_shorts_url("UCa")]
+    assert added == len(results) == 2 * fake_youtube.videos_per_page
+    assert channel_shorts_url("UCd") not in processed_urls
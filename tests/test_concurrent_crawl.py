@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""동시 전략 크롤링 테스트 (youtube.b_crowling)"""
+
+import time
+import threading
+
+from youtube.b_crowling import get_shorts_by_keyword, HostConcurrencyLimiter
+
+
+def crawl(**kwargs):
+    return get_shorts_by_keyword("동물", 100000, 3, use_scheduler=False, relaxation_schedule=(), **kwargs)
+
+
+def test_concurrent_mode_collects_same_results_as_sequential(fake_youtube):
+    sequential = crawl(max_results=1000)
+    sequential_pages = sorted(fake_youtube.requests_for("www.youtube.com"))
+    fake_youtube.calls.clear()
+    concurrent = crawl(max_results=1000, concurrent=True, max_workers=4)
+
+    concurrent_ids = [short["video_id"] for short in concurrent]
+    assert len(concurrent_ids) == len(set(concurrent_ids))
+    assert set(concurrent_ids) == {short["video_id"] for short in sequential}
+    # 같은 페이지를 한 번씩만 요청 (연관 검색어는 확장기 캐시에서)
+    assert sorted(fake_youtube.requests_for("www.youtube.com")) == sequential_pages
+
+
+def test_concurrent_mode_stops_at_max_results(fake_youtube):
+    results = crawl(max_results=12, concurrent=True, max_workers=4)
+    assert len(results) == 12
+    assert not results.partial
+
+
+def test_host_limiter_caps_in_flight_requests(fake_youtube):
+    lock = threading.Lock()
+    in_flight = {"now": 0, "max": 0}
+
+    def on_request(url):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        time.sleep(0.05)
+        with lock:
+            in_flight["now"] -= 1
+    fake_youtube.on_request = on_request
+
+    limiter = HostConcurrencyLimiter(per_host_limit=2)
+    urls = [f"https://www.youtube.com/results?search_query=q{index}" for index in range(8)]
+    threads = [threading.Thread(target=limiter.fetch, args=(url,)) for url in urls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert in_flight["max"] == 2
+    assert len(fake_youtube.calls) == 8
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""체크포인트 저장/재개 테스트 (youtube.t_crawl_checkpoint)"""
+
+import json
+import threading
+
+from common.utils import open_result_stream
+from youtube.b_crowling import get_shorts_by_keyword
+from youtube.e_data_filters import SharedIdSet
+from youtube.r_crawl_deadline import STOP_CANCELLED
+from youtube.t_crawl_checkpoint import CrawlCheckpoint
+
+
+def crawl(checkpoint, **kwargs):
+    options = dict(max_results=200, use_scheduler=False, relaxation_schedule=(), checkpoint=checkpoint)
+    options.update(kwargs)
+    return get_shorts_by_keyword("동물", 100000, 3, **options)
+
+
+def interrupt_on_first_continuation(fake_youtube):
+    """첫 연속 페이지 요청이 들어오면 중단 요청"""
+    stop_event = threading.Event()
+
+    def on_request(url):
+        if "browse_ajax" in url:
+            stop_event.set()
+    fake_youtube.on_request = on_request
+    return stop_event
+
+
+def test_interrupted_crawl_saves_checkpoint(fake_youtube):
+    checkpoint = CrawlCheckpoint.for_keyword("동물", 100000, 3)
+    stop_event = interrupt_on_first_continuation(fake_youtube)
+
+    results = crawl(checkpoint, stop_event=stop_event)
+
+    assert results.partial and results.stop_reason == STOP_CANCELLED
+    with open(checkpoint.path, "r", encoding="utf-8") as f:
+        state = json.load(f)
+    assert len(state["in_progress"]) == 1
+    assert state["in_progress"][0]["token"]
+    assert set(state["existing_ids"]) >= {short["video_id"] for short in results}
+
+
+def test_resume_continues_from_saved_token(fake_youtube):
+    checkpoint = CrawlCheckpoint.for_keyword("동물", 100000, 3)
+    first = crawl(checkpoint, stop_event=interrupt_on_first_continuation(fake_youtube))
+    with open(checkpoint.path, "r", encoding="utf-8") as f:
+        saved = json.load(f)
+    entry = saved["in_progress"][0]
+
+    fake_youtube.on_request = None
+    fake_youtube.calls.clear()
+    resumed = crawl(CrawlCheckpoint.for_keyword("동물", 100000, 3), resume=True)
+
+    # 이어받은 전략의 첫 페이지와 이미 받은 연속 페이지는 다시 요청하지 않음
+    assert entry["strategy"]["url"] not in fake_youtube.calls
+    assert all(url not in fake_youtube.calls for url in saved["processed_urls"])
+    continuations = fake_youtube.requests_for("browse_ajax")
+    assert f"continuation={entry['token']}&" in continuations[0]
+
+    # 이전 실행의 결과를 포함하고 중복 없이 끝까지 진행 (정상 종료 시 체크포인트 삭제)
+    resumed_ids = [short["video_id"] for short in resumed]
+    assert len(resumed_ids) == len(set(resumed_ids))
+    assert {short["video_id"] for short in first} <= set(resumed_ids)
+    assert not resumed.partial
+    assert not checkpoint.load("동물", 100000, 3)
+
+
+def test_checkpoint_saves_only_this_run_ids(fake_youtube):
+    shared_ids = SharedIdSet({f"other{index}" for index in range(50)})
+    checkpoint = CrawlCheckpoint.for_keyword("동물", 100000, 3)
+
+    crawl(checkpoint, existing_ids=shared_ids, stop_event=interrupt_on_first_continuation(fake_youtube))
+
+    with open(checkpoint.path, "r", encoding="utf-8") as f:
+        saved_ids = set(json.load(f)["existing_ids"])
+    assert saved_ids
+    assert not any(video_id.startswith("other") for video_id in saved_ids)
+    # 공유 집합에는 이번 실행이 본 ID도 들어감 (다른 키워드와의 중복 제거용)
+    assert saved_ids <= shared_ids
+
+
+def test_resume_carries_over_previous_result_stream(fake_youtube):
+    checkpoint = CrawlCheckpoint.for_keyword("동물", 100000, 3)
+    first_output = open_result_stream("동물")
+    crawl(checkpoint, top_k=3, output=first_output, stop_event=interrupt_on_first_continuation(fake_youtube))
+    first_output.close()
+    with open(first_output.filename, "r", encoding="utf-8") as f:
+        first_ids = [json.loads(line)["video_id"] for line in f]
+
+    fake_youtube.on_request = None
+    second_output = open_result_stream("동물")
+    crawl(CrawlCheckpoint.for_keyword("동물", 100000, 3), top_k=3, output=second_output, resume=True)
+    second_output.close()
+
+    assert second_output.filename != first_output.filename
+    with open(second_output.filename, "r", encoding="utf-8") as f:
+        second_ids = [json.loads(line)["video_id"] for line in f]
+    # 상위 K개(3개) 밖으로 밀려난 이전 실행 결과도 새 파일에 남음
+    assert len(first_ids) > 3
+    assert second_ids[:len(first_ids)] == first_ids
+    assert len(second_ids) == len(set(second_ids))
+    assert second_output.metadata["resumed_from"] == first_output.filename
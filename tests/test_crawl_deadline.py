@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""시간 예산 크롤링 테스트 (youtube.r_crawl_deadline)"""
+
+import time
+
+import pytest
+
+from youtube.b_crowling import get_shorts_by_keyword
+from youtube.e_data_filters import SharedIdSet
+from youtube.r_crawl_deadline import (CrawlDeadline, DeadlineExceeded, request_timeout, MIN_REQUEST_TIMEOUT,
+                                      STOP_DEADLINE, STOP_BUDGET)
+
+
+def slow_pages(fake_youtube, latency):
+    def on_request(url):
+        if "suggestqueries" not in url:
+            time.sleep(latency)
+    fake_youtube.on_request = on_request
+
+
+def test_unlimited_deadline_runs_directly():
+    clock = CrawlDeadline()
+    assert not clock.limited and clock.remaining() is None
+    assert clock.allows(100) and not clock.expired()
+    assert clock.timeout(10) == 10 and request_timeout(10) == 10
+    assert clock.run(lambda value: value * 2, 21) == 42
+
+
+def test_run_abandons_call_past_deadline():
+    clock = CrawlDeadline(time_budget=0.1)
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        clock.run(time.sleep, 1.0)
+    assert time.monotonic() - started < 0.5
+    assert clock.abandoned == 1
+    assert clock.expired() and not clock.allows()
+    assert request_timeout(10, clock) == MIN_REQUEST_TIMEOUT
+
+
+def test_allows_uses_observed_page_time():
+    clock = CrawlDeadline(time_budget=5.0)
+    assert clock.allows(4) and not clock.allows(6)
+    clock.observe(0.5)
+    assert clock.allows(9)
+    assert clock.timeout(10) <= 5.0
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_budget_returns_partial_best_so_far(fake_youtube, concurrent):
+    slow_pages(fake_youtube, 0.3)
+    existing_ids = SharedIdSet()
+
+    started = time.monotonic()
+    results = get_shorts_by_keyword("동물", 100000, 3, max_results=500, use_scheduler=False, relaxation_schedule=(),
+                                    time_budget=2.5, concurrent=concurrent, existing_ids=existing_ids)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 4.0
+    assert results.partial
+    assert results.stop_reason in (STOP_DEADLINE, STOP_BUDGET)
+    assert 0 < len(results) < 500
+    assert results.timings["time_budget"] == 2.5
+    assert results.timings["partial"]
+
+    # 버린 요청이 반환 후에 끝나도 공유 상태(본 영상 ID)를 바꾸지 않음
+    seen = len(existing_ids)
+    time.sleep(0.5)
+    assert len(existing_ids) == seen
+
+
+def test_budget_not_partial_when_target_reached(fake_youtube):
+    results = get_shorts_by_keyword("동물", 100000, 3, max_results=10, use_scheduler=False, relaxation_schedule=(),
+                                    time_budget=30)
+    assert len(results) == 10
+    assert not results.partial and results.stop_reason is None
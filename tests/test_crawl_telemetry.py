@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""크롤링 지표 테스트 (youtube.n_crawl_telemetry)"""
+
+import json
+from types import SimpleNamespace
+
+from common.utils import directory, today
+from youtube.b_crowling import get_shorts_by_keyword
+from youtube.n_crawl_telemetry import CrawlTelemetry
+
+
+def prefilter(detected, duplicates=0, rejected_date=0, rejected_views=0, accepted=0):
+    return SimpleNamespace(detected=detected, duplicates=duplicates, rejected_date=rejected_date,
+                           rejected_views=rejected_views, accepted=accepted)
+
+
+def test_pages_are_summed_per_strategy_and_depth():
+    telemetry = CrawlTelemetry("동물")
+    search = {"type": "search", "description": "기본 검색"}
+    telemetry.record_page(search, 0, {"bytes": 100, "renderers": 5, "latency": 0.2}, prefilter(5, 1, 1, 0, 3), 2)
+    telemetry.record_page(search, 1, {"bytes": 50, "latency": 0.4, "from_cache": True}, prefilter(4, accepted=4), 4)
+    telemetry.record_page({"type": "shorts"}, 0, {"error": "timeout", "latency": 1.0})
+
+    summary = telemetry.summary()
+    strategy = summary["strategies"]["search"]
+    assert strategy["description"] == "기본 검색"
+    assert set(strategy["by_depth"]) == {"0", "1"}
+    assert strategy["by_depth"]["0"]["rejected_other"] == 1
+    totals = strategy["totals"]
+    assert (totals["requests"], totals["bytes"], totals["cache_hits"], totals["passed"]) == (2, 150, 1, 6)
+    assert totals["max_latency_seconds"] == 0.4
+    assert totals["avg_latency_seconds"] == 0.3
+    assert totals["pass_rate"] == round(6 / 9, 3)
+    assert summary["totals"]["requests"] == 3
+    assert summary["totals"]["error_kinds"] == {"timeout": 1}
+
+
+def test_prometheus_text_has_labels_per_page_group():
+    telemetry = CrawlTelemetry('따옴표"키워드')
+    telemetry.record_page({"type": "search"}, 2, {"bytes": 10})
+
+    text = telemetry.to_prometheus()
+    assert "# TYPE youtube_crawl_requests_total counter" in text
+    assert 'youtube_crawl_bytes_total{keyword="따옴표\\"키워드",strategy="search",depth="2"} 10' in text
+    assert text.endswith("\n")
+
+
+def test_crawl_saves_json_summary_and_prometheus_file(fake_youtube):
+    results = get_shorts_by_keyword("동물", 100000, 3, max_results=15, use_scheduler=False, relaxation_schedule=())
+
+    with open(f"{directory}/telemetry_동물_{today}.json", "r", encoding="utf-8") as f:
+        summary = json.load(f)
+    assert summary["keyword"] == "동물"
+    assert summary["totals"]["passed"] == len(results)
+    assert summary["totals"]["requests"] == len(fake_youtube.requests_for("www.youtube.com"))
+    with open(f"{directory}/telemetry_동물_{today}.prom", "r", encoding="utf-8") as f:
+        assert "youtube_crawl_passed_total" in f.read()
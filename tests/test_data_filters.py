@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""사전 필터와 결과 필터 테스트 (youtube.e_data_filters)"""
+
+from conftest import video_renderer, continuation_item
+from common.near_duplicates import NearDuplicateIndex
+from common.utils import open_result_stream
+from youtube.b_crowling import get_shorts_by_keyword
+from youtube.d_page_parser import extract_shorts_and_token
+from youtube.e_data_filters import RendererPrefilter, CandidatePool
+
+
+def page(*renderers):
+    return {"contents": list(renderers) + [continuation_item("next")]}
+
+
+def test_prefilter_rejects_on_raw_renderers_and_stages_until_commit():
+    existing_ids, pool = {"seen"}, CandidatePool()
+    prefilter = RendererPrefilter(existing_ids, 100000, 3, pool)
+    data = page(video_renderer("seen"), video_renderer("ok"),
+                video_renderer("old", published="2주 전"), video_renderer("low", views_text="조회수 5천회"))
+
+    shorts, token = extract_shorts_and_token(data, prefilter)
+
+    assert [short["video_id"] for short in shorts] == ["ok"] and token == "next"
+    assert (prefilter.detected, prefilter.duplicates, prefilter.rejected_date, prefilter.rejected_views,
+            prefilter.accepted) == (4, 1, 1, 1, 1)
+    # 페이지를 쓰기 전(마감으로 버릴 수도 있는 동안)에는 공유 상태를 바꾸지 않음
+    assert existing_ids == {"seen"} and len(pool) == 0
+
+    prefilter.commit()
+    assert existing_ids == {"seen", "old", "low"}
+    assert len(pool) == 1
+
+
+def test_prefilter_skips_ids_rejected_earlier_on_same_page():
+    prefilter = RendererPrefilter(set(), 100000, 3)
+    data = page(video_renderer("low", views_text="조회수 10회"), video_renderer("low", views_text="조회수 10회"))
+
+    extract_shorts_and_token(data, prefilter)
+
+    assert prefilter.rejected_views == 1 and prefilter.duplicates == 1
+
+
+def test_candidate_pool_relaxes_highest_views_first():
+    pool = CandidatePool()
+    for video_id, views in [("a", 40000), ("b", 90000), ("c", 70000), ("d", 10000)]:
+        pool.add_record({"video_id": video_id, "views": views})
+    results = []
+
+    assert pool.relax(50000, results, max_results=1) == 1
+    assert pool.relax(50000, results, max_results=5) == 1
+    assert [short["video_id"] for short in results] == ["b", "c"]
+    assert len(pool) == 2
+
+
+def test_relaxation_recovers_candidates_without_refetching(fake_youtube):
+    fake_youtube.views_text = "조회수 6만회"
+    index = NearDuplicateIndex()
+    output = open_result_stream("동물")
+
+    results = get_shorts_by_keyword("동물", 100000, 3, max_results=20, use_scheduler=False, output=output,
+                                    near_duplicates=index)
+    output.close()
+
+    assert len(results) == 20
+    assert all(short["views"] == 60000 for short in results)
+    page_requests = fake_youtube.requests_for("www.youtube.com")
+    assert len(page_requests) == len(set(page_requests))
+    # 복구한 후보도 유사 중복 인덱스와 결과 스트림을 거침
+    assert index.stats()["videos"] == 20
+    with open(output.filename, "r", encoding="utf-8") as f:
+        assert len(f.readlines()) == 20
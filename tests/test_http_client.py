@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""공유 HTTP 전송/재시도 테스트 (youtube.f_http_client)"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from youtube.f_http_client import HttpTransport, http_get, set_transport, get_transport
+from youtube.j_rate_limiter import get_rate_limiter
+
+
+@pytest.fixture
+def local_server():
+    """차례로 statuses의 상태 코드를 돌려주는 로컬 서버 (다 쓰면 200)"""
+    statuses = []
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_seen.append(self.path)
+            status = statuses.pop(0) if statuses else 200
+            body = b"ok" if status == 200 else b"error"
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", statuses, requests_seen
+    server.shutdown()
+    server.server_close()
+
+
+def test_5xx_is_retried_through_the_rate_limiter(local_server):
+    address, statuses, requests_seen = local_server
+    statuses.extend([503, 503])
+    transport = HttpTransport(max_retries=3, backoff_factor=0, host_overrides={"www.youtube.com": address})
+    set_transport(transport)
+
+    response = http_get("https://www.youtube.com/results?search_query=test")
+
+    # 세션은 상태 코드를 재시도하지 않으므로 세 번의 요청이 모두 속도 제한기를 거침
+    assert response.status_code == 200 and response.text == "ok"
+    assert len(requests_seen) == 3
+    metrics = get_rate_limiter().metrics()["www.youtube.com"]
+    assert metrics["requests"] == 3 and metrics["errors"] == 2
+    transport.close()
+
+
+def test_gives_up_after_max_retries(local_server):
+    address, statuses, requests_seen = local_server
+    statuses.extend([429] * 5)
+    set_transport(HttpTransport(max_retries=2, backoff_factor=0, host_overrides={"www.youtube.com": address}))
+
+    response = http_get("https://www.youtube.com/results?search_query=test")
+
+    assert response.status_code == 429
+    assert len(requests_seen) == 3
+    assert get_rate_limiter().metrics()["www.youtube.com"]["throttled"] == 3
+
+
+def test_transport_without_max_retries_is_not_retried(fake_youtube):
+    fake_youtube.statuses["/results"] = [503]
+
+    response = http_get("https://www.youtube.com/results?search_query=test")
+
+    assert response.status_code == 503
+    assert len(fake_youtube.calls) == 1
+
+
+def test_set_transport_returns_previous(fake_youtube):
+    replacement = HttpTransport()
+    assert set_transport(replacement) is fake_youtube
+    assert get_transport() is replacement
+    assert replacement.resolve_url("https://www.youtube.com/x") == "https://www.youtube.com/x"
+    replacement.close()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""HTTP 응답 녹화/재생 테스트 (youtube.m_http_fixtures)"""
+
+import time
+
+import pytest
+
+from youtube.b_crowling import get_shorts_by_keyword
+from youtube.f_http_client import http_get
+from youtube.m_http_fixtures import RecordingTransport, ReplayTransport, install_fixtures
+
+OPTIONS = dict(max_results=12, use_scheduler=False, relaxation_schedule=())
+
+
+def test_replay_reproduces_recorded_crawl(fake_youtube):
+    install_fixtures("record", "fixtures/동물", transport=fake_youtube)
+    recorded = get_shorts_by_keyword("동물", 100000, 3, **OPTIONS)
+    live_requests = len(fake_youtube.calls)
+
+    replay = install_fixtures("replay", "fixtures/동물", strict=True)
+    replayed = get_shorts_by_keyword("동물", 100000, 3, **OPTIONS)
+
+    assert len(recorded) == 12
+    assert [short["video_id"] for short in replayed] == [short["video_id"] for short in recorded]
+    assert len(fake_youtube.calls) == live_requests
+    assert replay.stats() == {"served": live_requests, "missing": []}
+
+
+def test_same_url_replays_in_recorded_order(fake_youtube):
+    fake_youtube.statuses["results?search_query=retry"] = [503]
+    recorder = RecordingTransport("fixtures/retry", transport=fake_youtube)
+    url = "https://www.youtube.com/results?search_query=retry"
+    assert [recorder.get(url).status_code for _ in range(2)] == [503, 200]
+
+    replay = ReplayTransport("fixtures/retry")
+    assert [replay.get(url).status_code for _ in range(3)] == [503, 200, 200]
+    assert replay.get(url).text == fake_youtube.get(url).text
+
+
+def test_unrecorded_requests(fake_youtube):
+    RecordingTransport("fixtures/one", transport=fake_youtube).get("https://www.youtube.com/shorts/a")
+
+    lenient = ReplayTransport("fixtures/one")
+    assert lenient.get("https://www.youtube.com/shorts/b").status_code == 404
+    assert lenient.stats()["missing"] == ["https://www.youtube.com/shorts/b"]
+    with pytest.raises(LookupError):
+        ReplayTransport("fixtures/one", strict=True).get("https://www.youtube.com/shorts/b")
+    with pytest.raises(FileNotFoundError):
+        ReplayTransport("fixtures/none")
+    with pytest.raises(ValueError):
+        install_fixtures("live", "fixtures/one")
+
+
+def test_replay_latency_is_simulated(fake_youtube):
+    RecordingTransport("fixtures/one", transport=fake_youtube).get("https://www.youtube.com/shorts/a")
+    install_fixtures("replay", "fixtures/one", latency=0.05)
+
+    started = time.monotonic()
+    response = http_get("https://www.youtube.com/shorts/a")
+    assert response.status_code == 200
+    assert time.monotonic() - started >= 0.05
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""ytInitialData 추출 테스트 (youtube.h_initial_data)"""
+
+import json
+
+import pytest
+
+from youtube.h_initial_data import extract_initial_data, find_initial_data_start
+
+DATA = {"contents": {"text": "고양이 </b> \"따옴표\" ; 세미콜론"}, "items": [1, 2, 3]}
+
+
+@pytest.mark.parametrize("assignment", [
+    "var ytInitialData = {};",
+    'window["ytInitialData"] = {};',
+    "window['ytInitialData']={};",
+    "ytInitialData =\n  {};",
+])
+def test_assignment_forms(assignment):
+    script = assignment.replace("{}", json.dumps(DATA, ensure_ascii=False))
+    body = f"<html><script>{script}</script></html>"
+    assert extract_initial_data(body) == DATA
+    assert extract_initial_data(body.encode("utf-8")) == DATA
+
+
+def test_skips_references_before_assignment():
+    body = ("<script>if (ytInitialData.contents) {}</script>"
+            f"<script>var ytInitialData = {json.dumps(DATA)};</script>").encode("utf-8")
+    start = find_initial_data_start(body)
+    assert body[start:start + 1] == b"{"
+    assert extract_initial_data(body) == DATA
+
+
+def test_script_end_inside_string_falls_back_to_full_body():
+    data = {"text": "a;</script>b"}
+    body = f"<script>var ytInitialData = {json.dumps(data)};</script>".encode("utf-8")
+    assert extract_initial_data(body) == data
+
+
+def test_missing_and_corrupt_data():
+    assert extract_initial_data(b"<html>no data</html>") is None
+    with pytest.raises(json.JSONDecodeError):
+        extract_initial_data(b"<script>var ytInitialData = {\"a\": ;</script>")
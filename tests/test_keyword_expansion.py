@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""연관 검색어 확장 테스트 (youtube.o_keyword_expansion)"""
+
+import json
+
+from conftest import FakeResponse
+from youtube.o_keyword_expansion import (
+    KeywordExpander, normalize_keyword, fetch_youtube_suggestions, fetch_google_suggestions
+)
+
+SUGGESTIONS = {
+    "고양이": ["고양이 영상", "고양이 ", "아기 고양이"],
+    "고양이 영상": ["고양이 영상 웃긴", "아기 고양이"],
+    "아기 고양이": ["아기 고양이 울음"],
+}
+
+
+class Source:
+    """요청한 키워드를 기록하는 가짜 자동완성 소스"""
+
+    def __init__(self, suggestions=SUGGESTIONS):
+        self.suggestions = suggestions
+        self.calls = []
+
+    def __call__(self, keyword):
+        self.calls.append(keyword)
+        return list(self.suggestions.get(keyword, []))
+
+
+def test_normalize_keyword():
+    assert normalize_keyword("  ＡＢＣ   고양이\t") == "abc 고양이"
+    assert normalize_keyword(None) == ""
+
+
+def test_expands_breadth_first_with_scores():
+    source = Source()
+    expander = KeywordExpander(max_depth=2, cache_path=None, sources=[("fake", source)])
+
+    frontier = expander.expand("고양이")
+
+    assert [item["keyword"] for item in frontier] == ["고양이 영상", "아기 고양이", "고양이 영상 웃긴", "아기 고양이 울음"]
+    # 두 부모에서 나온 검색어는 점수가 더해짐
+    assert frontier[1]["score"] == round(1 / 3 + 1.0 * 0.5 / 2, 4)
+    assert (frontier[2]["depth"], frontier[2]["parent"]) == (2, "고양이 영상")
+    assert sorted(source.calls) == ["고양이", "고양이 영상", "아기 고양이"]
+
+
+def test_stops_expanding_once_the_limit_is_reached():
+    source = Source()
+    expander = KeywordExpander(max_depth=2, cache_path=None, sources=[("fake", source)])
+
+    assert expander.frontier("고양이", limit=2) == ["고양이 영상", "아기 고양이"]
+    assert source.calls == ["고양이"]
+
+
+def test_cache_is_keyed_by_settings_and_persisted(tmp_path):
+    cache_path = str(tmp_path / "cache" / "expansion.json")
+    source = Source()
+    expander = KeywordExpander(max_depth=1, cache_path=cache_path, sources=[("fake", source)])
+
+    first = expander.expand("고양이")
+    assert expander.expand(" 고양이 ") == first
+    assert expander.expand("고양이", max_keywords=1) == first[:1]
+    assert source.calls == ["고양이", "고양이"]
+
+    # 다른 설정의 확장기는 같은 파일을 써도 기존 항목을 재사용하지 않음
+    reloaded = KeywordExpander(max_depth=1, cache_path=cache_path, sources=[("fake", source)])
+    assert reloaded.expand("고양이") == first
+    KeywordExpander(max_depth=2, cache_path=cache_path, sources=[("fake", source)]).expand("고양이")
+    assert source.calls.count("고양이") == 3
+    with open(cache_path, "r", encoding="utf-8") as f:
+        assert len(json.load(f)) == 3
+
+
+def test_failing_source_does_not_break_expansion():
+    def broken(keyword):
+        raise ValueError("잘못된 응답")
+
+    expander = KeywordExpander(max_depth=1, cache_path=None, sources=[("broken", broken), ("fake", Source())])
+    assert expander.frontier("고양이") == ["고양이 영상", "아기 고양이"]
+
+
+def test_suggestion_responses_are_parsed(fake_youtube):
+    fake_youtube.get = lambda url, headers=None, timeout=None: FakeResponse(url, (
+        'google.sbox.p50(["고양이", [["고양이 영상", 0], ["아기 고양이", 0]], {}])'
+        if "youtube" in url else json.dumps(["고양이", ["고양이 간식"]])
+    ))
+
+    assert fetch_youtube_suggestions("고양이") == ["고양이 영상", "아기 고양이"]
+    assert fetch_google_suggestions("고양이") == ["고양이 간식"]
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""유사 중복 묶기와 결과 스트림 무효 표시 테스트 (common.near_duplicates)"""
+
+import json
+
+from conftest import FakeYouTube, video_renderer
+from common.near_duplicates import NearDuplicateIndex, NEW_CLUSTER, DUPLICATE, NEW_CANONICAL
+from common.utils import open_result_stream, load_superseded_ids
+from youtube.b_crowling import get_shorts_by_keyword
+from youtube.c_strategies import create_strategies
+from youtube.e_data_filters import filter_and_add_shorts
+
+
+def record(video_id, title, views):
+    return {"video_id": video_id, "title": title, "views": views, "published_time": "1일 전"}
+
+
+def read_ids(filename):
+    with open(filename, "r", encoding="utf-8") as f:
+        return [json.loads(line)["video_id"] for line in f]
+
+
+def test_reupload_joins_cluster_and_higher_views_become_canonical():
+    index = NearDuplicateIndex()
+    original = record("a", "귀여운 고양이가 상자에 들어가는 영상 #shorts", 1000)
+    reupload = record("b", "귀여운 고양이가 상자에 들어가는 영상!! #쇼츠", 5000)
+    smaller = record("c", "귀여운 고양이가 상자에 들어가는 영상", 10)
+    other = record("d", "강아지 산책 브이로그 한강 공원", 3000)
+
+    assert index.add(original)[1] == NEW_CLUSTER
+    cluster_id, status, previous = index.add(reupload)
+    assert (cluster_id, status, previous) == ("a", NEW_CANONICAL, original)
+    assert index.add(smaller)[1] == DUPLICATE
+    assert index.add(other)[1] == NEW_CLUSTER
+    assert index.canonical("a") is reupload
+    assert index.stats()["clusters"] == 2
+
+
+def test_replaced_canonical_is_retracted_from_stream():
+    index = NearDuplicateIndex()
+    results, existing_ids = [], set()
+    output = open_result_stream("동물", flush_every=1)
+    title = "귀여운 고양이가 상자에 들어가는 영상"
+
+    filter_and_add_shorts([record("a", title, 200000)], results, existing_ids, 100000, 3,
+                          output=output, near_duplicates=index)
+    filter_and_add_shorts([record("b", title + " #shorts", 900000)], results, existing_ids, 100000, 3,
+                          output=output, near_duplicates=index)
+
+    # 쓰는 중에는 사이드카에 무효 ID를 남기고, 닫을 때 파일에서 제거
+    assert [short["video_id"] for short in results] == ["b"]
+    assert load_superseded_ids(output.filename) == {"a"}
+    assert read_ids(output.filename) == ["a", "b"]
+    output.close()
+    assert read_ids(output.filename) == ["b"]
+    assert output.count == 1
+
+
+def test_crawl_retracts_reupload_found_on_later_page(fake_youtube):
+    fake_youtube.pages_per_strategy = 2
+    first_url = create_strategies("동물", related_keywords=[])[0]["url"]
+    key = FakeYouTube.page_key(first_url)
+    original_id = f"{key}p0v0"
+    title = video_renderer(original_id)["videoRenderer"]["title"]["runs"][0]["text"]
+    fake_youtube.renderers[f"{key}.1"] = [video_renderer("reupload", title=title, views_text="조회수 90만회")]
+
+    output = open_result_stream("동물")
+    results = get_shorts_by_keyword("동물", 100000, 3, max_results=200, use_scheduler=False, relaxation_schedule=(),
+                                    output=output, near_duplicates=NearDuplicateIndex())
+    output.close()
+
+    result_ids = {short["video_id"] for short in results}
+    assert "reupload" in result_ids and original_id not in result_ids
+    written = read_ids(output.filename)
+    assert "reupload" in written and original_id not in written
+    assert len(written) == len(set(written)) == len(result_ids)
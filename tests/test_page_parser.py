@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""렌더러 순회와 페이지 파싱 테스트 (youtube.d_page_parser)"""
+
+from conftest import FakeYouTube, video_renderer, continuation_item
+from youtube.c_strategies import create_url
+from youtube.d_page_parser import walk_renderers, extract_shorts_and_token, extract_shorts_from_page_with_token
+
+SEARCH_URL = "https://www.youtube.com/results?search_query=test+shorts"
+
+
+def reel(video_id):
+    return {"reelItemRenderer": {"videoId": video_id, "headline": {"simpleText": f"릴 {video_id}"},
+                                 "viewCountText": {"simpleText": "조회수 3만회"}}}
+
+
+def long_video(video_id):
+    return {"videoRenderer": {"videoId": video_id, "title": {"runs": [{"text": "긴 영상"}]},
+                              "lengthText": {"simpleText": "12:34"},
+                              "thumbnail": {"thumbnails": [{"url": "x", "width": 1280, "height": 720}]}}}
+
+
+def test_walker_finds_renderers_in_document_order_at_any_depth():
+    data = {"contents": [
+        {"richItemRenderer": {"content": video_renderer("a")}},
+        {"shelf": {"items": [reel("b"), {"gridVideoRenderer": {"videoId": "c"}}]}},
+        continuation_item("first"),
+        {"nested": [continuation_item("second"), video_renderer("d")]},
+    ]}
+
+    found = [(kind, payload if isinstance(payload, str) else payload["videoId"]) for kind, payload in walk_renderers(data)]
+
+    assert found == [("videoRenderer", "a"), ("reelItemRenderer", "b"), ("gridVideoRenderer", "c"),
+                     ("continuationItemRenderer", "first"), ("continuationItemRenderer", "second"),
+                     ("videoRenderer", "d")]
+
+
+def test_extract_keeps_shorts_and_first_token():
+    data = {"items": [video_renderer("a"), long_video("long"), reel("b"), continuation_item("first"),
+                      continuation_item("second")]}
+    metrics = {}
+
+    shorts, token = extract_shorts_and_token(data, metrics=metrics)
+
+    assert [short["video_id"] for short in shorts] == ["a", "b"]
+    assert shorts[1]["title"] == "릴 b" and shorts[1]["views"] == 30000
+    assert token == "first"
+    assert metrics["renderers"] == 3
+
+
+def test_search_and_continuation_pages(fake_youtube):
+    metrics = {}
+    shorts, token = extract_shorts_from_page_with_token(SEARCH_URL, metrics=metrics)
+
+    key = FakeYouTube.page_key(SEARCH_URL)
+    assert [short["video_id"] for short in shorts] == [f"{key}p0v{index}" for index in range(5)]
+    assert shorts[0]["views"] == 500000 and shorts[0]["channel_id"] == "UCfake"
+    assert shorts[0]["published_at"] is not None
+    assert token == f"{key}.1"
+    assert metrics["status_code"] == 200 and metrics["bytes"] > 0 and metrics["error"] is None
+
+    more, next_token = extract_shorts_from_page_with_token(create_url(SEARCH_URL, token))
+    assert [short["video_id"] for short in more] == [f"{key}p1v{index}" for index in range(5)]
+    assert next_token == f"{key}.2"
+
+
+def test_error_status_returns_empty_page(fake_youtube):
+    fake_youtube.statuses["/results"] = [500]
+    metrics = {}
+    assert extract_shorts_from_page_with_token(SEARCH_URL, metrics=metrics) == ([], None)
+    assert metrics["error"] == "http_500"
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""연속 페이지 미리 받기 테스트 (youtube.b_crowling.prefetch_continuations)"""
+
+import time
+import threading
+
+from conftest import FakeYouTube
+from youtube.b_crowling import prefetch_continuations
+from youtube.e_data_filters import RendererPrefilter
+
+SEARCH_URL = "https://www.youtube.com/results?search_query=test+shorts"
+KEY = FakeYouTube.page_key(SEARCH_URL)
+
+
+def make_prefilter():
+    return RendererPrefilter(set(), 100000, 3)
+
+
+def test_pages_arrive_in_depth_order_until_tokens_run_out(fake_youtube):
+    fake_youtube.pages_per_strategy = 4
+
+    pages = list(prefetch_continuations(SEARCH_URL, f"{KEY}.1", 10, make_prefilter))
+
+    assert [(depth, token) for depth, _, _, _, token in pages] == [(1, f"{KEY}.2"), (2, f"{KEY}.3"), (3, None)]
+    assert [short["video_id"] for short in pages[1][1]] == [f"{KEY}p2v{index}" for index in range(5)]
+
+
+def test_stops_at_max_depth_and_resumes_from_start_depth(fake_youtube):
+    fake_youtube.pages_per_strategy = 10
+
+    pages = list(prefetch_continuations(SEARCH_URL, f"{KEY}.3", 5, make_prefilter, start_depth=2))
+
+    assert [depth for depth, *_ in pages] == [3, 4, 5]
+    assert len(fake_youtube.requests_for("browse_ajax")) == 3
+
+
+def test_next_page_is_fetched_while_caller_processes(fake_youtube):
+    fake_youtube.pages_per_strategy = 4
+    fake_youtube.on_request = lambda url: time.sleep(0.1)
+
+    started = time.monotonic()
+    for _ in prefetch_continuations(SEARCH_URL, f"{KEY}.1", 10, make_prefilter):
+        time.sleep(0.1)  # 필터링/출력에 걸리는 시간
+    elapsed = time.monotonic() - started
+
+    # 겹치지 않으면 요청 3 x 0.1초 + 처리 3 x 0.1초
+    assert elapsed < 0.55
+
+
+def test_closing_early_stops_the_producer(fake_youtube):
+    fake_youtube.pages_per_strategy = 50
+    pages = prefetch_continuations(SEARCH_URL, f"{KEY}.1", 50, make_prefilter, prefetch_size=1)
+    next(pages)
+    pages.close()
+    time.sleep(0.3)
+
+    # 소비한 페이지 + 큐 한 칸 + 넣으려고 기다리던 페이지 이상은 요청하지 않음
+    assert len(fake_youtube.requests_for("browse_ajax")) <= 3
+
+
+def test_stop_event_prevents_further_requests(fake_youtube):
+    fake_youtube.pages_per_strategy = 50
+    stop_event = threading.Event()
+    stop_event.set()
+
+    assert list(prefetch_continuations(SEARCH_URL, f"{KEY}.1", 50, make_prefilter, stop_event=stop_event)) == []
+    assert fake_youtube.requests_for("browse_ajax") == []
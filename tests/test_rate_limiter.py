@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""적응형 속도 제한기 테스트 (youtube.j_rate_limiter)"""
+
+import time
+
+import pytest
+
+from conftest import FakeResponse
+from youtube.j_rate_limiter import (AdaptiveRateLimiter, classify_response, retry_after_seconds,
+                                    OK, THROTTLED, BLOCKED, ERROR)
+
+URL = "https://www.youtube.com/results?search_query=test"
+
+
+@pytest.mark.parametrize("response, expected", [
+    (FakeResponse(URL, "ok"), OK),
+    (FakeResponse(URL, "", 429), THROTTLED),
+    (FakeResponse(URL, "", 503), ERROR),
+    (FakeResponse("https://consent.youtube.com/m?continue=x", "동의"), BLOCKED),
+    (FakeResponse("https://www.google.com/sorry/index?continue=x", "캡차"), BLOCKED),
+])
+def test_classify_response(response, expected):
+    assert classify_response(response) == expected
+
+
+def test_retry_after_seconds():
+    assert retry_after_seconds(FakeResponse(URL, "", 429, {"Retry-After": "7"})) == 7.0
+    assert retry_after_seconds(FakeResponse(URL, "", 429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) is None
+    assert retry_after_seconds(FakeResponse(URL, "", 429)) is None
+
+
+def test_acquire_spaces_requests_by_rate():
+    limiter = AdaptiveRateLimiter(initial_rate=20, burst=1, jitter=0)
+    assert limiter.acquire(URL) == 0.0
+    started = time.monotonic()
+    waited = limiter.acquire(URL)
+    assert waited == pytest.approx(0.05, abs=0.03)
+    assert time.monotonic() - started >= 0.04
+    assert limiter.metrics()["www.youtube.com"]["requests"] == 2
+
+
+def test_throttle_backs_off_and_honours_retry_after():
+    limiter = AdaptiveRateLimiter(initial_rate=20.0, min_rate=0.5, jitter=0)
+    limiter.acquire(URL)
+
+    assert limiter.record(URL, FakeResponse(URL, "", 429, {"Retry-After": "0.2"})) == THROTTLED
+    metrics = limiter.metrics()["www.youtube.com"]
+    assert metrics["rate"] == 10.0 and metrics["throttled"] == 1
+    assert 0.1 < metrics["blocked_for"] <= 0.2
+
+    started = time.monotonic()
+    limiter.acquire(URL)
+    assert time.monotonic() - started >= 0.15
+
+
+def test_ok_responses_increase_rate_up_to_max():
+    limiter = AdaptiveRateLimiter(initial_rate=1.0, max_rate=1.25, increase_step=0.1)
+    for _ in range(5):
+        assert limiter.record(URL, FakeResponse(URL, "ok")) == OK
+    assert limiter.metrics()["www.youtube.com"]["rate"] == 1.25
+
+
+def test_connection_errors_count_as_errors():
+    limiter = AdaptiveRateLimiter(error_penalty=0)
+    assert limiter.record(URL, error=ConnectionError("끊김")) == ERROR
+    assert limiter.metrics()["www.youtube.com"]["errors"] == 1
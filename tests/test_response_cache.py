@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""디스크 응답 캐시 테스트 (youtube.g_response_cache)"""
+
+import pytest
+
+from conftest import FakeResponse
+from youtube.d_page_parser import fetch_publish_time
+from youtube.f_http_client import http_get
+from youtube.g_response_cache import ResponseCache, set_response_cache, normalize_url, ttl_for_url
+
+SEARCH_URL = "https://www.youtube.com/results?search_query=test&sp=CAM"
+
+
+@pytest.fixture
+def cache():
+    response_cache = ResponseCache("data/cache/test.sqlite3")
+    set_response_cache(response_cache)
+    yield response_cache
+    response_cache.close()
+
+
+def test_second_request_is_served_from_cache(fake_youtube, cache):
+    first = http_get(SEARCH_URL)
+    # 쿼리 순서가 달라도 같은 캐시 항목
+    second = http_get("https://WWW.youtube.com/results?sp=CAM&search_query=test#top")
+
+    assert len(fake_youtube.calls) == 1
+    assert second.from_cache and second.content == first.content
+    assert cache.stats()["hits"] == 1 and cache.stats()["entries"] == 1
+
+
+def test_error_and_interstitial_responses_are_not_cached(fake_youtube, cache, monkeypatch):
+    fake_youtube.statuses["/results"] = [503]
+    assert http_get(SEARCH_URL).status_code == 503
+
+    # 동의 페이지로 리다이렉트된 200 응답
+    with monkeypatch.context() as patch:
+        consent = FakeResponse("https://consent.youtube.com/m?continue=x", "<html>동의</html>")
+        patch.setattr(fake_youtube, "get", lambda url, headers=None, timeout=None: consent)
+        assert http_get(SEARCH_URL).status_code == 200
+
+    assert cache.stats()["entries"] == 0
+    assert http_get(SEARCH_URL).status_code == 200
+    assert cache.stats()["entries"] == 1
+
+
+def test_publish_date_pages_bypass_cache(fake_youtube, cache):
+    fake_youtube.publish_dates["abc"] = "2024-05-01"
+
+    assert fetch_publish_time("abc") == "2024년 5월 1일"
+    assert fetch_publish_time("abc") == "2024년 5월 1일"
+
+    assert len(fake_youtube.requests_for("/shorts/abc")) == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_expired_entries_are_misses():
+    cache = ResponseCache("data/cache/expired.sqlite3", endpoint_ttls=[("youtube.com", "/", -1)])
+    cache.put(SEARCH_URL, FakeResponse(SEARCH_URL, "page"))
+    assert cache.get(SEARCH_URL) is None
+    assert cache.stats()["misses"] == 1
+    cache.close()
+
+
+def test_least_recently_used_entries_are_evicted_over_max_bytes():
+    cache = ResponseCache("data/cache/small.sqlite3", max_bytes=10)
+    cache.put("https://www.youtube.com/results?q=a", FakeResponse("", "aaaa"))
+    cache.put("https://www.youtube.com/results?q=b", FakeResponse("", "bbbb"))
+    cache.get("https://www.youtube.com/results?q=a")
+    cache.put("https://www.youtube.com/results?q=c", FakeResponse("", "cccc"))
+
+    assert cache.get("https://www.youtube.com/results?q=b") is None
+    assert cache.get("https://www.youtube.com/results?q=a").text == "aaaa"
+    assert cache.get("https://www.youtube.com/results?q=c").text == "cccc"
+    cache.close()
+
+
+def test_endpoint_ttls():
+    assert ttl_for_url("http://suggestqueries.google.com/complete/search?q=x") == 24 * 60 * 60
+    assert ttl_for_url("https://www.youtube.com/browse_ajax?ctoken=x") == 30 * 60
+    assert ttl_for_url("https://www.youtube.com/hashtag/x") == 2 * 60 * 60
+    assert normalize_url("HTTPS://WWW.YOUTUBE.COM?b=2&a=1#x") == "https://www.youtube.com/?a=1&b=2"
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""JSONL 결과 스트림 테스트 (common.utils)"""
+
+import os
+import json
+import threading
+
+from common.utils import open_result_stream, reserve_result_filename, meta_filename_for, directory, today
+from youtube.l_short_record import ShortRecord
+
+
+def read_lines(filename):
+    with open(filename, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def read_meta(filename):
+    with open(meta_filename_for(filename), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_records_are_flushed_while_crawling_and_completed_on_close():
+    output = open_result_stream("동물", {"keyword": "동물"}, flush_every=2, flush_interval=60)
+    output.write({"video_id": "a"})
+    output.write(ShortRecord(video_id="b", views=3))
+
+    assert [line["video_id"] for line in read_lines(output.filename)] == ["a", "b"]
+    assert read_meta(output.filename) == {"keyword": "동물", "total_items": 0, "complete": False}
+
+    output.write({"video_id": "c"})
+    assert output.close({"partial": False}) == output.filename
+    assert len(read_lines(output.filename)) == 3
+    assert read_lines(output.filename)[1]["video_url"] == "https://www.youtube.com/shorts/b"
+    assert read_meta(output.filename) == {"keyword": "동물", "partial": False, "total_items": 3, "complete": True}
+
+
+def test_each_run_gets_its_own_file_on_the_same_day():
+    first = open_result_stream("동물")
+    first.write({"video_id": "a"})
+    first.close()
+    second = open_result_stream("동물")
+    second.close()
+
+    assert first.filename == f"{directory}/동물_{today}.jsonl"
+    assert second.filename == f"{directory}/동물_{today}_2.jsonl"
+    assert len(read_lines(first.filename)) == 1
+
+
+def test_leftover_sidecar_is_not_reused():
+    os.makedirs(directory, exist_ok=True)
+    with open(f"{directory}/동물_{today}.meta.json", "w", encoding="utf-8") as f:
+        f.write("{}")
+    assert reserve_result_filename("동물") == f"{directory}/동물_{today}_2.jsonl"
+
+
+def test_concurrent_runs_reserve_distinct_files():
+    os.makedirs(directory, exist_ok=True)
+    filenames = []
+    lock = threading.Lock()
+
+    def reserve():
+        filename = reserve_result_filename("동물")
+        with lock:
+            filenames.append(filename)
+
+    threads = [threading.Thread(target=reserve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(filenames)) == 8
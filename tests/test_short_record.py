@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""쇼츠 레코드 테스트 (youtube.l_short_record)"""
+
+import json
+
+import pytest
+
+from common.utils import _to_json
+from youtube.l_short_record import ShortRecord
+
+DATA = {
+    "video_id": "abc", "title": "고양이 #shorts", "view_count_text": "조회수 1만회", "views": 10000,
+    "published_time": "1일 전", "published_at": 1000.0, "channel_name": "채널", "channel_id": "UC1",
+    "thumbnail_url": "https://i.ytimg.com/x.jpg", "description": "",
+}
+
+
+def test_round_trips_through_json():
+    record = ShortRecord.from_dict(dict(DATA, video_url="ignored", extra="ignored"))
+
+    data = record.to_dict()
+    assert data == dict(DATA, video_url="https://www.youtube.com/shorts/abc")
+    assert list(data) == list(DATA) + ["video_url"]
+    assert ShortRecord.from_dict(json.loads(json.dumps(record, default=_to_json))) == record
+    assert ShortRecord.from_dict(record) is record
+
+
+def test_reads_and_writes_like_a_dict():
+    record = ShortRecord.from_dict(DATA)
+
+    assert record["views"] == record.get("views") == 10000
+    assert record.get("missing", "기본값") == "기본값"
+    assert "video_url" in record and "missing" not in record
+    assert dict(record)["video_url"] == record.video_url
+    assert record == record.to_dict()
+
+    record["published_at"] = 2000.0
+    assert record.published_at == 2000.0
+    with pytest.raises(KeyError):
+        record["video_url"] = "x"
+    with pytest.raises(KeyError):
+        record["missing"]
+
+
+def test_channel_strings_are_shared_and_records_have_no_dict():
+    first = ShortRecord(channel_id="".join(["UC", "shared"]))
+    second = ShortRecord.from_dict({"channel_id": "".join(["UC", "shared"])})
+
+    assert first.channel_id is second.channel_id
+    assert not hasattr(first, "__dict__")
+    with pytest.raises(AttributeError):
+        first.unknown = 1
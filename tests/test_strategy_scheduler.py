@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""전략 스케줄러 테스트 (youtube.k_strategy_scheduler)"""
+
+import random
+import threading
+
+from youtube.b_crowling import get_shorts_by_keyword
+from youtube.k_strategy_scheduler import StrategyScheduler
+
+STRATEGIES = [{"type": "weak", "url": "w"}, {"type": "strong", "url": "s"}, {"type": "new", "url": "n"},
+              {"type": "dead", "url": "d"}, {"url": "untyped"}]
+
+
+def scheduler(**kwargs):
+    return StrategyScheduler(path="data/strategy_stats.json", rng=random.Random(0), **kwargs)
+
+
+def test_orders_untried_first_then_by_yield_and_skips_dead_types():
+    stats = scheduler(exploration=0.1, skip_explore_rate=0.0)
+    stats.record("weak", 10, 2, 5.0)
+    stats.record("strong", 10, 30, 5.0)
+    stats.record("dead", 10, 0, 5.0)
+
+    ordered = [strategy["url"] for strategy in stats.order(STRATEGIES)]
+
+    assert ordered == ["n", "untyped", "s", "w"]
+
+
+def test_stats_persist_between_runs():
+    first = scheduler()
+    first.record("strong", 4, 8, 2.0)
+    first.record("strong", 1, 2, 0.5)
+    first.save()
+
+    second = scheduler()
+    assert second.stats["strong"] == {"runs": 2, "requests": 5, "passes": 10, "seconds": 2.5}
+    assert second.yield_of("strong") == {"per_request": 2.0, "per_second": 4.0, "requests": 5}
+    assert second.yield_of("unknown") is None
+
+
+def test_reads_are_consistent_while_other_threads_record():
+    stats = scheduler()
+    stop = threading.Event()
+
+    def record(strategy_type):
+        while not stop.is_set():
+            stats.record("strong", 1, 1, 0.1)
+            stats.record(strategy_type, 1, 0, 0.1)
+
+    writers = [threading.Thread(target=record, args=(f"type{index}",)) for index in range(2)]
+    for writer in writers:
+        writer.start()
+    try:
+        for _ in range(200):
+            stats.order(STRATEGIES)
+            assert stats.summary()["strong"]["per_request"] == 1.0
+    finally:
+        stop.set()
+        for writer in writers:
+            writer.join()
+
+
+def test_crawl_records_yield_per_strategy_type(fake_youtube):
+    stats = scheduler()
+    get_shorts_by_keyword("동물", 100000, 3, max_results=1000, scheduler=stats, relaxation_schedule=())
+
+    # 전략마다 페이지 3개 x 쇼츠 5개가 모두 통과
+    observed = stats.yield_of("search_popular")
+    assert (observed["per_request"], observed["requests"]) == (5.0, 3)
+    assert StrategyScheduler(path="data/strategy_stats.json").stats == stats.stats
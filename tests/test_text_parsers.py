@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""게시 시간/조회수 파서 테스트 (youtube.i_text_parsers)"""
+
+from datetime import datetime
+
+import pytest
+
+from youtube.e_data_filters import is_within_days
+from youtube.i_text_parsers import parse_time_text, parse_view_count, published_timestamp, parser_cache_info
+
+NOW = 1_700_000_000.0
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("3일 전", ("day", 3)),
+    ("스트리밍 시간: 5시간 전", ("hour", 5)),
+    ("2 weeks ago", ("week", 2)),
+    ("1개월 전", ("month", 1)),
+    ("방금", ("second", 0)),
+    ("오늘", ("hour", 12)),
+    ("Today", ("hour", 12)),
+    ("어제", ("hour", 24)),
+    ("just  now", ("second", 0)),
+    ("", None),
+    ("알 수 없음", None),
+    ("2024년 13월 1일", None),
+])
+def test_parse_time_text(text, expected):
+    assert parse_time_text(text) == expected
+
+
+def test_absolute_dates_and_timestamps():
+    assert parse_time_text("2024년 5월 1일") == ("date", datetime(2024, 5, 1).timestamp())
+    assert published_timestamp("2시간 전", NOW) == NOW - 2 * 3600
+    assert published_timestamp("무슨 말", NOW) is None
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("조회수 1.5만회", 15000),
+    ("조회수 1,234회", 1234),
+    ("조회수 3억회", 300000000),
+    ("1.2M views", 1200000),
+    ("15K views", 15000),
+    ("12,345 views", 12345),
+    ("", 0),
+    ("조회수 없음", 0),
+])
+def test_parse_view_count(text, expected):
+    assert parse_view_count(text) == expected
+
+
+def test_is_within_days():
+    assert is_within_days("2일 전", 3, NOW)
+    assert not is_within_days("5일 전", 3, NOW)
+    assert is_within_days("오늘", 1, NOW)
+    assert not is_within_days("", 3, NOW)
+
+
+def test_results_are_memoized():
+    parse_view_count("조회수 7.7만회")
+    before = parser_cache_info()["views"]["hits"]
+    parse_view_count("조회수 7.7만회")
+    assert parser_cache_info()["views"]["hits"] == before + 1
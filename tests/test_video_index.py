@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""영구 영상 인덱스 테스트 (common.video_index)"""
+
+import pytest
+
+from common.video_index import VideoIndex
+from youtube.b_crowling import get_shorts_by_keyword
+
+
+@pytest.fixture
+def video_index():
+    index = VideoIndex("data/video_index.sqlite3")
+    yield index
+    index.close()
+
+
+def short(video_id, views, channel_id="UC1"):
+    return {"video_id": video_id, "title": f"영상 {video_id}", "views": views, "channel_id": channel_id,
+            "published_at": 1000.0}
+
+
+def test_record_page_upserts_accepted_and_touches_known(video_index):
+    video_index.record_page([short("a", 100), short("b", 5)], [short("a", 100)], keyword="동물", seen_at=10)
+    video_index.record_page([short("a", 300), short("b", 7)], [], keyword="고양이", seen_at=20)
+
+    assert video_index.known_among(["a", "b", "a", ""]) == {"a"}
+    [row] = video_index.videos_by_keyword("동물")
+    assert (row["video_id"], row["views"], row["first_seen"], row["last_seen"]) == ("a", 300, 10, 20)
+    assert video_index.videos_by_keyword("고양이") == []
+    assert [snapshot["views"] for snapshot in video_index.view_history("a")] == [100, 300]
+    assert video_index.view_history("b") == []
+
+
+def test_touch_updates_only_known_videos(video_index):
+    video_index.record_page([], [short("a", 100)], seen_at=10)
+    video_index.touch([("a", 150), ("unknown", 99), ("a", 0)], seen_at=30)
+
+    assert video_index.known_ids() == {"a"}
+    assert video_index.videos_by_channel("UC1")[0]["last_seen"] == 30
+    assert [snapshot["views"] for snapshot in video_index.view_history("a")] == [100, 150]
+
+
+def test_skip_known_does_not_collect_indexed_videos_again(fake_youtube, video_index):
+    options = dict(max_results=1000, use_scheduler=False, relaxation_schedule=(), video_index=video_index)
+    first = get_shorts_by_keyword("동물", 100000, 3, **options)
+    assert video_index.known_ids() == {record["video_id"] for record in first}
+
+    second = get_shorts_by_keyword("동물", 100000, 3, skip_known=True, **options)
+    without_skip = get_shorts_by_keyword("동물", 100000, 3, **options)
+
+    assert len(second) == 0
+    assert len(without_skip) == len(first)
+    assert len(video_index.videos_by_keyword("동물")) == len(first)
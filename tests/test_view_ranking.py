@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""상위 K개 순위 테스트 (youtube.s_view_ranking)"""
+
+import pytest
+
+from common.near_duplicates import NearDuplicateIndex
+from youtube.e_data_filters import filter_and_add_shorts
+from youtube.s_view_ranking import TopKRanking, RANK_BY_VIEWS, age_hours, rank_results
+
+NOW = 1_700_000_000.0
+
+
+def short(video_id, views, hours=10, title=None):
+    return {"video_id": video_id, "title": title or f"영상 {video_id}", "views": views,
+            "published_at": NOW - hours * 3600, "published_time": "1일 전"}
+
+
+def ids(records):
+    return [record["video_id"] for record in records]
+
+
+def test_keeps_top_k_by_velocity_and_counts_every_admission():
+    ranking = TopKRanking(3, now=NOW)
+    # 조회수는 낮아도 방금 올라온 영상이 시간당 조회수로는 위
+    ranking.extend([short("old", 900000, hours=100), short("new", 50000, hours=1),
+                    short("mid", 100000, hours=5), short("slow", 10000, hours=50)])
+
+    assert len(ranking) == 4
+    assert ids(ranking.ranked()) == ["new", "mid", "old"]
+    assert ranking.min_score() == pytest.approx(9000.0)
+
+
+def test_rank_by_views():
+    shorts = [short("a", 10), short("b", 30), short("c", 20)]
+    assert ids(rank_results(shorts, k=2, rank_by=RANK_BY_VIEWS, now=NOW)) == ["b", "c"]
+    with pytest.raises(ValueError):
+        TopKRanking(3, rank_by="likes")
+
+
+def test_today_is_not_ranked_as_just_uploaded():
+    # "오늘"은 정확한 시각을 모르므로 방금 올라온 영상(1시간)처럼 점수가 부풀지 않도록 반나절로 계산
+    assert age_hours({"published_time": "오늘"}, now=NOW) == pytest.approx(12.0)
+
+
+def test_replace_with_evicted_previous_only_adds_the_new_record():
+    ranking = TopKRanking(2, rank_by=RANK_BY_VIEWS, now=NOW)
+    evicted = short("evicted", 10)
+    ranking.extend([evicted, short("a", 100), short("b", 200)])
+    assert ids(ranking.ranked()) == ["b", "a"]
+
+    assert ranking.replace(evicted, short("reupload", 150))
+    assert ids(ranking.ranked()) == ["b", "reupload"]
+    assert len(ranking) == 3
+
+
+def test_replace_removes_previous_that_is_still_kept():
+    ranking = TopKRanking(3, rank_by=RANK_BY_VIEWS, now=NOW)
+    previous = short("previous", 100)
+    ranking.extend([previous, short("a", 50)])
+
+    ranking.replace(previous, short("reupload", 300))
+    assert ids(ranking.ranked()) == ["reupload", "a"]
+    assert len(ranking) == 2
+
+
+def test_canonical_owned_by_another_ranking_is_not_replaced():
+    index = NearDuplicateIndex()
+    title = "귀여운 고양이가 상자에 들어가는 영상"
+    other_keyword = TopKRanking(5, rank_by=RANK_BY_VIEWS, now=NOW)
+    this_keyword = TopKRanking(2, rank_by=RANK_BY_VIEWS, now=NOW)
+    this_keyword.extend([short("a", 500000), short("b", 400000)])
+
+    # 다른 키워드의 결과에 들어간 대표보다 조회수가 높은 재업로드
+    filter_and_add_shorts([short("original", 200000, title=title)], other_keyword, set(), 100000, 3,
+                          near_duplicates=index)
+    added = filter_and_add_shorts([short("reupload", 300000, title=title + " #shorts")], this_keyword, set(),
+                                  100000, 3, near_duplicates=index)
+
+    # 이 순위에 없던 이전 대표를 빼거나 결과 수를 바꾸지 않음
+    assert added == 0
+    assert ids(this_keyword.ranked()) == ["a", "b"]
+    assert len(this_keyword) == 2
+    assert ids(other_keyword.ranked()) == ["original"]
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""분산 크롤링 작업 큐 테스트 (youtube.p_work_queue)"""
+
+import time
+
+import pytest
+
+from youtube.p_work_queue import WorkQueue, coordinate, process_task, PENDING, LEASED, DONE, FAILED
+
+STRATEGY = {"type": "search_popular", "description": "테스트 전략"}
+URL = "https://www.youtube.com/results?search_query=%EB%8F%99%EB%AC%BC+shorts&sp=CAMSAhAB"
+
+
+@pytest.fixture
+def work_queue(tmp_path):
+    queue = WorkQueue(str(tmp_path / "queue.sqlite3"), lease_seconds=0.05, max_attempts=2)
+    yield queue
+    queue.close()
+
+
+def test_expired_lease_is_retaken_then_fails_after_max_attempts(work_queue):
+    job_id = work_queue.create_job("동물", 100000, 3)
+    work_queue.enqueue(job_id, STRATEGY, URL)
+
+    first = work_queue.lease("worker-a")
+    assert first is not None and work_queue.lease("worker-b") is None
+    time.sleep(0.1)
+
+    # 하트비트 없이 임대가 만료되면 다른 작업자가 다시 가져가고, 늦게 끝난 결과는 버림
+    second = work_queue.lease("worker-b")
+    assert second["task_id"] == first["task_id"]
+    assert not work_queue.heartbeat(first["task_id"], "worker-a")
+    assert not work_queue.complete(first, "worker-a", [], 0, None)
+    assert work_queue.counts(job_id)[LEASED] == 1
+    time.sleep(0.1)
+
+    # 최대 시도 횟수만큼 임대된 작업이 또 만료되면 다시 임대하지 않고 실패로 기록
+    assert work_queue.lease("worker-c") is None
+    assert work_queue.counts(job_id) == {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 1}
+    assert work_queue.results_after(job_id) == []
+
+
+def test_fail_requeues_until_max_attempts(work_queue):
+    job_id = work_queue.create_job("동물", 100000, 3)
+    work_queue.enqueue(job_id, STRATEGY, URL)
+
+    work_queue.fail(work_queue.lease("worker-a"), "worker-a", RuntimeError("연결 끊김"))
+    assert work_queue.counts(job_id)[PENDING] == 1
+    work_queue.fail(work_queue.lease("worker-a"), "worker-a", RuntimeError("연결 끊김"))
+    assert work_queue.counts(job_id)[FAILED] == 1
+
+
+def test_complete_stores_results_and_enqueues_next_page(work_queue):
+    job_id = work_queue.create_job("동물", 100000, 3, max_search_depth=1)
+    assert work_queue.enqueue(job_id, STRATEGY, URL)
+    assert not work_queue.enqueue(job_id, STRATEGY, URL)
+
+    task = work_queue.lease("worker-a")
+    shorts, detected, next_token = process_task(task)
+    assert detected == 5 and next_token
+    assert work_queue.complete(task, "worker-a", shorts, detected, next_token)
+
+    # 다음 연속 페이지는 깊이 1로 추가되고, 최대 깊이에서는 더 추가하지 않음
+    continuation = work_queue.lease("worker-a")
+    assert (continuation["token"], continuation["depth"]) == (next_token, 1)
+    shorts, detected, next_token = process_task(continuation)
+    assert work_queue.complete(continuation, "worker-a", shorts, detected, next_token)
+    assert work_queue.lease("worker-a") is None
+
+    results = work_queue.results_after(job_id)
+    assert [result["task_id"] for result in results] == [task["task_id"], continuation["task_id"]]
+    assert work_queue.results_after(job_id, results[0]["result_id"]) == results[1:]
+
+
+def test_coordinate_merges_local_worker_results(fake_youtube):
+    shorts = coordinate("동물", max_results=30, queue_path="data/queue/test.sqlite3", max_search_depth=1,
+                        local_workers=2, use_scheduler=False, poll_interval=0.01, timeout=30)
+
+    video_ids = [short["video_id"] for short in shorts]
+    assert len(video_ids) == 30
+    assert len(set(video_ids)) == 30
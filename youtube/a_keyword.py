@@ -1,8 +1,19 @@
 import json
 import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from youtube.b_crowling import get_shorts_by_keyword
-from common.utils import format_number, save_results, check_file_exists
+from youtube.k_strategy_scheduler import StrategyScheduler
+from common.utils import format_number, check_file_exists, open_result_stream
+from common.video_index import VideoIndex
+from common.near_duplicates import NearDuplicateIndex
+from youtube.s_view_ranking import rank_results, view_velocity
+from youtube.t_crawl_checkpoint import CrawlCheckpoint
+from youtube.e_data_filters import SharedIdSet
+
+DEFAULT_BATCH_WORKERS = 3  # 동시에 크롤링할 키워드 수
 
 
 def setting():
@@ -14,6 +25,10 @@ def setting():
         min_views_input = 100000
         days_input = 5
         results_input = 5
+        skip_known = False  # True면 지난 실행에서 이미 수집한 영상은 건너뜀
+        collapse_near_duplicates = False  # True면 재업로드 등 유사 중복은 대표 영상 하나만 수집
+        time_budget = None  # 크롤링 최대 시간 (초, 지나면 그때까지의 결과를 부분 결과로 반환)
+        resume = True  # True면 중단된 지난 실행의 체크포인트에서 이어서 진행
 
         if not keyword:
             print("키워드를 입력해야 합니다.")
@@ -56,13 +71,38 @@ def setting():
         print(f"- 최근 기간: {max_days}일 이내")
         print(f"- 최대 결과 수: {max_results}개")
         
+        # 결과는 필터를 통과하는 즉시 JSONL 파일에 기록 (메타데이터는 .meta.json 사이드카)
+        output = open_result_stream(f"youtube_{keyword}_shorts", {
+            "keyword": keyword,
+            "min_views": min_views,
+            "max_days": max_days
+        })
+        
         # 쇼츠 데이터 가져오기 - 이미 필터링된 결과만 반환됨
-        shorts_data = get_shorts_by_keyword(
-            keyword=keyword,
-            min_views=min_views,
-            max_days=max_days,
-            max_results=max_results
-        )
+        video_index = VideoIndex()
+        checkpoint = CrawlCheckpoint.for_keyword(keyword, min_views, max_days)
+        shorts_data = []
+        try:
+            shorts_data = get_shorts_by_keyword(
+                keyword=keyword,
+                min_views=min_views,
+                max_days=max_days,
+                max_results=max_results,
+                video_index=video_index,
+                skip_known=skip_known,
+                output=output,
+                near_duplicates=NearDuplicateIndex() if collapse_near_duplicates else None,
+                time_budget=time_budget,
+                checkpoint=checkpoint,
+                resume=resume
+            )
+        except BaseException:
+            # Ctrl-C나 오류로 멈추면 그때까지의 상태를 저장해 다음 실행에서 이어서 진행
+            save_checkpoint(checkpoint)
+            raise
+        finally:
+            video_index.close()
+            filename = output.close(crawl_metadata(shorts_data))
         
         if not shorts_data:
             print(f"필터 조건을 만족하는 '{keyword}' 관련 쇼츠를 찾을 수 없습니다.")
@@ -78,25 +118,12 @@ def setting():
             formatted_views = format_number(views)
             
             print(f"{i}. {short.get('title', '제목 없음')}")
-            print(f"   조회수: {short.get('view_count_text', '정보 없음')} ({formatted_views})")
+            print(f"   조회수: {short.get('view_count_text', '정보 없음')} ({formatted_views}, 시간당 {format_number(int(view_velocity(short)))})")
             print(f"   게시일: {short.get('published_time', '정보 없음')}")
             print(f"   채널: {short.get('channel_name', '정보 없음')}")
             print(f"   URL: {short.get('video_url', '')}")
             print("-" * 60)
         
-        # 메타데이터를 포함한 데이터 구성
-        meta_data = {
-            "shorts": shorts_data,
-            "metadata": {
-                "keyword": keyword,
-                "min_views": min_views,
-                "max_days": max_days,
-                "total_items": len(shorts_data)
-            }
-        }
-        
-        # 결과 저장
-        filename = save_results(f"youtube_{keyword}_shorts", meta_data)
         return filename
         
     except KeyboardInterrupt:
@@ -106,4 +133,179 @@ def setting():
         print(f"오류 발생: {str(e)}")
         import traceback
         traceback.print_exc()  # 상세 오류 추적
-        return None
\ No newline at end of file
+        return None
+
+
+def save_checkpoint(checkpoint):
+    """중단된 크롤링 상태 저장 (저장 실패는 알리기만 하고 원래 예외 처리를 방해하지 않음)"""
+    try:
+        path = checkpoint.save()
+    except OSError as e:
+        print(f"체크포인트 저장 실패: {e}")
+        return None
+    if path:
+        print(f"진행 상황을 체크포인트에 저장했습니다: {path} (다음 실행에서 이어서 진행)")
+    return path
+
+
+def crawl_metadata(shorts_data):
+    """결과 파일 메타데이터에 남길 부분 결과 여부와 시간 예산 사용 내역"""
+    return {
+        "partial": getattr(shorts_data, "partial", False),
+        "timings": getattr(shorts_data, "timings", {})
+    }
+
+
+def crawl_keywords(keywords, min_views=100000, max_days=3, max_results=50, max_workers=DEFAULT_BATCH_WORKERS,
+                   skip_known=False, collapse_near_duplicates=False, time_budget=None, resume=True):
+    """
+    여러 키워드를 동시에 크롤링하고 키워드별 파일과 통합 파일 저장
+    
+    모든 키워드가 하나의 영상 ID 집합을 공유하므로 앞서 다른 키워드에서 수집된
+    영상은 다시 담지 않으며, 요청 속도 제한기(j_rate_limiter)와 전략 스케줄러도 공유한다.
+    
+    Args:
+        keywords: 검색 키워드 목록
+        min_views: 최소 조회수 (기본값: 10만)
+        max_days: 최근 며칠 이내의 쇼츠만 가져올지 (기본값: 3일)
+        max_results: 키워드별 가져올 최대 결과 수 (기본값: 50개)
+        max_workers: 동시에 크롤링할 키워드 수 (기본값: 3)
+        skip_known: True면 영상 인덱스에 이미 있는 영상은 건너뜀 (기본값: False)
+        collapse_near_duplicates: True면 키워드 전체에서 유사 중복(재업로드)은 대표 영상 하나만 수집 (기본값: False)
+        time_budget: 일괄 검색 전체에 쓸 최대 시간 (초, 모든 키워드가 같은 마감 시각을 공유, 기본값: 제한 없음)
+        resume: True면 키워드별 체크포인트가 남아 있는 키워드(지난 실행에서 중단/실패)는 이어서 진행 (기본값: True)
+    
+    Returns:
+        dict: {"files": {키워드: 파일 경로}, "merged_file": 통합 파일 경로, "stats": {키워드: 통계}}
+    """
+    keywords = [keyword.strip() for keyword in keywords if keyword and keyword.strip()]
+    keywords = list(dict.fromkeys(keywords))  # 순서 유지 중복 제거
+    if not keywords:
+        print("키워드를 입력해야 합니다.")
+        return None
+    
+    shared_ids = SharedIdSet()  # 키워드 간 공유 중복 추적 (확인과 추가를 잠금 안에서)
+    scheduler = StrategyScheduler()
+    video_index = VideoIndex()
+    near_duplicates = NearDuplicateIndex() if collapse_near_duplicates else None  # 키워드 간 공유
+    deadline = time.time() + time_budget if time_budget is not None else None  # 키워드 간 공유 마감 시각
+    results = {}
+    files = {}  # 키워드별 결과 파일 (수집 중 바로 기록)
+    stats = {}
+    stats_lock = threading.Lock()
+    stop_event = threading.Event()  # Ctrl-C 시 실행 중인 키워드에 중단 알림
+    checkpoints = {}  # 실행 중인 키워드 -> 체크포인트 (중단 시 메인 스레드에서 저장)
+    
+    print(f"\n일괄 검색 설정: 키워드 {len(keywords)}개, 동시 작업 {max_workers}개")
+    print(f"- 키워드: {', '.join(keywords)}")
+    print(f"- 최소 조회수: {min_views:,}회 이상 / 최근 {max_days}일 이내 / 키워드별 최대 {max_results}개")
+    
+    def crawl(keyword):
+        started = time.monotonic()
+        output = open_result_stream(f"youtube_{keyword}_shorts", {
+            "keyword": keyword,
+            "min_views": min_views,
+            "max_days": max_days
+        })
+        checkpoint = CrawlCheckpoint.for_keyword(keyword, min_views, max_days)
+        checkpoints[keyword] = checkpoint
+        shorts_data = []
+        try:
+            shorts_data = get_shorts_by_keyword(
+                keyword=keyword,
+                min_views=min_views,
+                max_days=max_days,
+                max_results=max_results,
+                scheduler=scheduler,
+                existing_ids=shared_ids,
+                video_index=video_index,
+                skip_known=skip_known,
+                output=output,
+                near_duplicates=near_duplicates,
+                deadline=deadline,
+                checkpoint=checkpoint,
+                resume=resume,
+                stop_event=stop_event
+            )
+        except BaseException:
+            save_checkpoint(checkpoint)
+            raise
+        finally:
+            checkpoints.pop(keyword, None)
+            files[keyword] = output.close(crawl_metadata(shorts_data))
+        elapsed = time.monotonic() - started
+        with stats_lock:
+            stats[keyword] = {
+                "total_items": len(shorts_data),
+                "wall_time": round(elapsed, 2),
+                "items_per_minute": round(len(shorts_data) / elapsed * 60, 2) if elapsed else 0.0,
+                "partial": getattr(shorts_data, "partial", False)
+            }
+        return shorts_data
+    
+    started = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=max(1, int(max_workers)))
+    try:
+        futures = {executor.submit(crawl, keyword): keyword for keyword in keywords}
+        for future in as_completed(futures):
+            keyword = futures[future]
+            try:
+                results[keyword] = future.result()
+            except Exception as e:
+                print(f"'{keyword}' 크롤링 중 오류 발생: {str(e)}")
+                results[keyword] = []
+    except KeyboardInterrupt:
+        # Ctrl-C는 메인 스레드에만 전달되므로 여기서 작업자에 중단을 알리고 키워드별 상태를 저장.
+        # 실행 중인 키워드는 다음 페이지 전에 멈추며 체크포인트를 다시 저장한다 (기다리지 않음,
+        # 영상 인덱스는 멈추는 중인 작업자가 아직 쓰므로 닫지 않음)
+        stop_event.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        for checkpoint in list(checkpoints.values()):
+            save_checkpoint(checkpoint)
+        print("\n사용자에 의해 일괄 검색이 중단되었습니다.")
+        raise
+    executor.shutdown()
+    video_index.close()
+    total_elapsed = time.monotonic() - started
+    
+    for keyword in keywords:
+        if not results.get(keyword):
+            print(f"필터 조건을 만족하는 '{keyword}' 관련 쇼츠를 찾을 수 없습니다.")
+    
+    # 통합 결과 저장 (키워드 정보를 붙이고 혹시 모를 중복은 한 번 더 제거)
+    merged = []
+    merged_ids = set()
+    for keyword in keywords:
+        for short in results.get(keyword, []):
+            if short.get("video_id") in merged_ids:
+                continue
+            merged_ids.add(short.get("video_id"))
+            merged.append(dict(short, keyword=keyword))
+    merged = rank_results(merged)  # 키워드별 결과와 같은 기준(시간당 조회수)으로 순위화
+    
+    merged_file = None
+    if merged:
+        merged_output = open_result_stream("youtube_batch_shorts", {
+            "keywords": keywords,
+            "min_views": min_views,
+            "max_days": max_days
+        })
+        merged_output.write_all(merged)
+        merged_file = merged_output.close({
+            "wall_time": round(total_elapsed, 2),
+            "per_keyword": stats
+        })
+    
+    # 키워드별 소요 시간 / 처리량 보고
+    print(f"\n📊 일괄 검색 결과 (총 {total_elapsed:.1f}초, 통합 {len(merged)}개)")
+    print("-" * 60)
+    for keyword in keywords:
+        keyword_stats = stats.get(keyword)
+        if not keyword_stats:
+            print(f"{keyword}: 실패")
+            continue
+        print(f"{keyword}: {keyword_stats['total_items']}개, {keyword_stats['wall_time']}초 "
+              f"(분당 {keyword_stats['items_per_minute']}개){' - 부분 결과' if keyword_stats['partial'] else ''}")
+    print("-" * 60)
+    
+    return {"files": files, "merged_file": merged_file, "stats": stats}
@@ -7,114 +7,390 @@ YouTube 쇼츠 검색 엔진 - 핵심 모듈
 """
 
 import time
-import random
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlparse
 from youtube.c_strategies import create_strategies, create_url
 from youtube.d_page_parser import extract_shorts_from_page_with_token
-from youtube.e_data_filters import filter_and_add_shorts, is_within_days
+from youtube.e_data_filters import filter_and_add_shorts, RendererPrefilter, RunIdSet, CandidatePool, DEFAULT_RELAXATION_SCHEDULE
+from youtube.g_response_cache import get_response_cache
+from youtube.j_rate_limiter import get_rate_limiter
+from youtube.k_strategy_scheduler import StrategyScheduler
+from youtube.n_crawl_telemetry import CrawlTelemetry
+from youtube.q_channel_crawler import crawl_channels, DEFAULT_MAX_CHANNELS
+from youtube.r_crawl_deadline import CrawlDeadline, CrawlResults, DeadlineExceeded, STOP_DEADLINE, STOP_BUDGET, STOP_CANCELLED
+from youtube.s_view_ranking import TopKRanking, RANK_BY_VELOCITY
 
-def get_shorts_by_keyword(keyword, min_views=100000, max_days=3, max_results=50):
+# 동시 크롤링 기본 설정
+DEFAULT_MAX_WORKERS = 4  # 동시에 실행할 전략 수
+DEFAULT_PER_HOST_LIMIT = 2  # 호스트당 동시 요청 수 제한
+DEFAULT_PREFETCH_SIZE = 2  # 처리 전에 미리 받아둘 연속 페이지 수
+CANCEL_POLL_INTERVAL = 0.5  # 동시 모드에서 외부 중단 요청을 확인하는 간격 (초)
+
+
+class HostConcurrencyLimiter:
+    """호스트별 동시 요청 수 제한 (세마포어 기반)"""
+
+    def __init__(self, per_host_limit=DEFAULT_PER_HOST_LIMIT):
+        self.per_host_limit = max(1, int(per_host_limit))
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    def _get_semaphore(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._semaphores[host]
+
+    def fetch(self, url, prefilter=None, metrics=None, deadline=None):
+        """호스트 슬롯을 확보한 뒤 페이지 데이터 가져오기"""
+        with self._get_semaphore(url):
+            return extract_shorts_from_page_with_token(url, prefilter, metrics, deadline)
+
+
+def collect_channels(shorts, discovered_channels):
+    """채널 정보 수집 (후속 검색용)"""
+    for short in shorts:
+        channel_id = short.get("channel_id")
+        channel_name = short.get("channel_name")
+        if channel_id and channel_name and channel_id not in discovered_channels:
+            discovered_channels[channel_id] = {
+                "name": channel_name,
+                "video_count": 1
+            }
+        elif channel_id in discovered_channels:
+            discovered_channels[channel_id]["video_count"] += 1
+
+
+def prefetch_continuations(url, next_token, max_search_depth, make_prefilter,
+                           fetch=extract_shorts_from_page_with_token, stop_event=None,
+                           prefetch_size=DEFAULT_PREFETCH_SIZE, deadline=None, start_depth=0):
+    """
+    연속 페이지를 미리 받아오며 (depth, shorts, prefilter, metrics, next_token)을 순서대로 생성
+
+    생산자 스레드가 페이지를 받아 디코딩하자마자 다음 토큰으로 바로 다음 페이지를
+    요청하고, 결과는 크기 제한 큐(prefetch_size)에 넣는다. 호출자는 필터링/출력을
+    하는 동안 다음 페이지 네트워크 대기가 겹쳐서 진행된다.
+    호출자가 순회를 멈추거나(max_results 도달) stop_event가 설정되거나
+    max_search_depth/토큰이 소진되면 생산자도 다음 요청 전에 멈춘다.
+    deadline(CrawlDeadline)을 넘기면 남은 시간이 한 페이지 예상 소요 시간보다 짧을 때
+    다음 요청을 보내지 않고, 마감 시각이 지나면 받는 중인 페이지를 기다리지 않는다.
+    next_token은 그 페이지 다음 연속 페이지의 토큰이며(체크포인트용), start_depth는
+    next_token이 가리키는 페이지 바로 앞의 깊이다 (체크포인트에서 이어받을 때 사용).
+    """
+    stop_event = stop_event or threading.Event()
+    closed = threading.Event()
+    pages = queue.Queue(maxsize=max(1, prefetch_size))
+    done = object()
+
+    def should_stop():
+        return closed.is_set() or stop_event.is_set()
+
+    def produce():
+        token = next_token
+        depth = start_depth
+        try:
+            while token and depth < max_search_depth and not should_stop():
+                if deadline is not None and not deadline.allows():
+                    deadline.mark_partial(STOP_BUDGET)
+                    break
+                depth += 1
+                prefilter = make_prefilter()
+                metrics = {}
+                started = time.monotonic()
+                shorts, token = fetch(create_url(url, token), prefilter, metrics, deadline=deadline)
+                if deadline is not None:
+                    deadline.observe(time.monotonic() - started)
+                item = (depth, shorts, prefilter, metrics, token)
+
+                # 큐가 가득 차면 소비자를 기다리되 중단 신호는 계속 확인
+                while not should_stop():
+                    try:
+                        pages.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+
+                if not prefilter.detected:
+                    break
+        finally:
+            while True:
+                try:
+                    pages.put(done, timeout=0.1)
+                    break
+                except queue.Full:
+                    if closed.is_set():
+                        break
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            try:
+                item = pages.get(timeout=deadline.remaining() if deadline is not None else None)
+            except queue.Empty:
+                deadline.mark_partial(STOP_DEADLINE)
+                deadline.abandon()
+                break
+            if item is done:
+                break
+            yield item
+    finally:
+        closed.set()
+        # 마감이 지났으면 받는 중인 요청은 백그라운드에서 끝나도록 두고 결과는 버림
+        producer.join(deadline.remaining() if deadline is not None else None)
+
+
+def get_shorts_by_keyword(keyword, min_views=100000, max_days=3, max_results=50,
+                          concurrent=False, max_workers=DEFAULT_MAX_WORKERS,
+                          per_host_limit=DEFAULT_PER_HOST_LIMIT, use_scheduler=True, scheduler=None,
+                          relaxation_schedule=DEFAULT_RELAXATION_SCHEDULE, existing_ids=None,
+                          video_index=None, skip_known=False, output=None, telemetry=None,
+                          channel_followup=False, max_channels=DEFAULT_MAX_CHANNELS, near_duplicates=None,
+                          time_budget=None, deadline=None, top_k=None, rank_by=RANK_BY_VELOCITY,
+                          checkpoint=None, resume=False, stop_event=None):
     """
     키워드로 YouTube 쇼츠 데이터 추출 - 대폭 강화된 검색 전략 적용
-    
+
     Args:
         keyword: 검색 키워드
         min_views: 최소 조회수 (기본값: 10만)
         max_days: 최근 며칠 이내의 쇼츠만 가져올지 (기본값: 3일)
         max_results: 가져올 최대 결과 수 (기본값: 50개)
+        concurrent: True면 여러 전략과 연속 페이지를 동시에 크롤링 (기본값: False)
+        max_workers: 동시 크롤링 시 동시에 실행할 전략 수 (기본값: 4)
+        per_host_limit: 동시 크롤링 시 호스트당 동시 요청 수 제한 (기본값: 2)
+        use_scheduler: 지난 실행의 전략별 수확량으로 전략 순서를 정할지 여부 (기본값: True)
+        scheduler: 사용할 StrategyScheduler (기본값: data/strategy_stats.json 기반)
+        relaxation_schedule: 결과가 부족할 때 차례로 적용할 조회수 기준 비율 (기본값: (0.5,))
+        existing_ids: 이미 수집한 영상 ID 집합 (여러 키워드가 공유하면 키워드 간 중복 제거)
+        video_index: 수집 결과를 누적할 common.video_index.VideoIndex (기본값: 사용 안 함)
+        skip_known: True면 video_index에 이미 있는 영상은 파싱/저장하지 않고 건너뜀 (기본값: False)
+        output: 통과한 쇼츠를 찾는 즉시 기록할 common.utils.ResultStream (기본값: 사용 안 함)
+        telemetry: 전략/깊이별 지표를 모을 CrawlTelemetry (기본값: 새로 만들고 실행 후 저장)
+        channel_followup: 검색 후 결과가 부족하면 발견된 채널의 쇼츠 탭을 추가로 탐색할지 여부
+            (기본값: False - 쇼츠 탭 릴은 게시일을 영상마다 따로 조회해야 하므로 녹화 픽스처로 확인 후 사용)
+        max_channels: 채널 후속 탐색에서 확인할 최대 채널 수 (기본값: 10)
+        near_duplicates: 재업로드 등 유사 중복을 묶을 common.near_duplicates.NearDuplicateIndex
+            (묶음마다 대표 영상 하나만 결과에 남김, 여러 키워드가 공유 가능, 기본값: 사용 안 함)
+        time_budget: 크롤링에 쓸 최대 시간 (초, 기본값: 제한 없음)
+        deadline: 크롤링을 끝낼 시각 (time.time() 기준, time_budget과 함께 주면 이른 쪽, 기본값: 제한 없음)
+        top_k: 보관/반환할 상위 결과 수 (기본값: max_results). 수집은 max_results개까지 계속하고
+            메모리에는 상위 top_k개만 유지한다 (나머지는 output 스트림에만 기록)
+        rank_by: 순위 기준 - "velocity"(시간당 조회수, 기본값) 또는 "views"(조회수)
+        checkpoint: 진행 상태를 주기적으로 저장할 t_crawl_checkpoint.CrawlCheckpoint
+            (정상 종료 시 삭제, 시간 예산 때문에 멈추면 남겨 둠, 기본값: 사용 안 함)
+        resume: True면 checkpoint에 저장된 상태(처리한 URL, 전략별 연속 토큰, 이 실행이 본 영상 ID,
+            수집한 쇼츠)를 이어받아 재개 (기본값: False)
+        stop_event: 설정되면 다음 페이지/전략 전에 멈추고 부분 결과로 반환 (체크포인트는 남김,
+            채널 후속 탐색과 조회수 기준 완화는 건너뜀, 기본값: 사용 안 함)
+    
+    Returns:
+        CrawlResults: 순위 기준 내림차순 쇼츠 목록 (list). 시간 예산 때문에 목표 수를 채우기 전에
+        멈췄으면 partial=True이며, timings에 단계별 소요 시간과 예산 사용 내역이 담긴다.
     """
-    filtered_shorts = []  # 조회수와 날짜 필터를 모두 통과한 결과
-    existing_ids = set()  # 중복 추적
+    def cancelled():
+        return stop_event is not None and stop_event.is_set()
+    
+    # 조회수와 날짜 필터를 모두 통과한 결과 (통과하는 즉시 상위 K개 힙에서 순위 경쟁)
+    filtered_shorts = TopKRanking(top_k or max_results, rank_by)
+    if existing_ids is None:
+        existing_ids = set()  # 중복 추적
     
     # 검색 효율을 위한 추적
     processed_urls = set()  # 이미 검색한 URL
     discovered_channels = {}  # 발견된 채널 {id: {name, video_count}}
+    candidate_pool = CandidatePool()  # 날짜는 통과했지만 조회수가 부족한 후보 (기준 완화용)
+    if telemetry is None:
+        telemetry = CrawlTelemetry(keyword)  # 전략/깊이별 지연, 크기, 파싱 시간, 필터 사유
+    clock = CrawlDeadline(time_budget, deadline)  # 시간 예산 (없으면 제한 없음)
+    
+    # 지난 실행에서 이미 수집한 영상은 페이지마다 인덱스를 조회해 렌더러 단계에서 바로 제외
+    if video_index is not None and skip_known:
+        print("영상 인덱스에 이미 있는 영상은 건너뜁니다.")
+    
+    # 중단된 실행의 상태 이어받기 (이미 받은 페이지는 다시 요청하지 않음)
+    resume_tokens = {}  # 전략 URL -> {"strategy", "token", "depth"}
+    if checkpoint is not None:
+        # 체크포인트에는 이번 실행(키워드)이 본 ID만 저장 (공유 집합은 그대로 갱신)
+        existing_ids = RunIdSet(existing_ids)
+        state = checkpoint.load(keyword, min_views, max_days) if resume else None
+        if state is not None:
+            processed_urls.update(state["processed_urls"])
+            existing_ids.update(state["existing_ids"])
+            discovered_channels.update(state["discovered_channels"])
+            filtered_shorts.restore(state["shorts"], state["admitted"])
+            # 새 결과 파일에도 이전 실행의 결과를 포함 (이전 파일이 남아 있으면 상위 K개 밖의 결과와
+            # 무효 표시까지 그대로 이어받고, 없으면 체크포인트의 상위 K개만)
+            if output is not None and output.carry_over(state.get("output_file")) is None:
+                output.write_all(state["shorts"])
+            resume_tokens = {entry["strategy"]["url"]: entry for entry in state["in_progress"]}
+            print(f"체크포인트에서 재개: 처리한 URL {len(state['processed_urls'])}개, "
+                  f"이어받을 전략 {len(resume_tokens)}개, 수집한 쇼츠 {len(filtered_shorts)}개")
+        checkpoint.bind(keyword, min_views, max_days, processed_urls, existing_ids, filtered_shorts, discovered_channels,
+                        output)
     
     print(f"'{keyword}' 키워드로 YouTube 쇼츠 데이터 추출 시작...")
     print(f"필터: 최근 {max_days}일 이내 + 조회수 {min_views:,}회 이상")
     print(f"목표: {max_results}개 수집")
+    if clock.limited:
+        print(f"시간 예산: {clock.budget:.1f}초")
     
     # 전략 1: 다양한 검색 매개변수 및 키워드 조합 활용
-    search_strategies = create_strategies(keyword)
+    # (연관 검색어 확장이 마감까지 끝나지 않으면 연관 검색어 없이 기본 전략만 사용)
+    try:
+        search_strategies = clock.run(create_strategies, keyword)
+    except DeadlineExceeded:
+        clock.mark_partial(STOP_DEADLINE)
+        print("⏱️ 연관 검색어 확장이 마감 시각까지 끝나지 않아 기본 전략만 사용합니다.")
+        search_strategies = create_strategies(keyword, related_keywords=[])
+    
+    # 전략 종류별 과거 수확량으로 순서 재정렬 (밴딧 정책)
+    if use_scheduler and scheduler is None:
+        scheduler = StrategyScheduler()
+    if scheduler is not None:
+        search_strategies = scheduler.order(search_strategies)
+    
+    # 체크포인트에서 이어받을 전략을 먼저 (이번 실행의 전략 목록에 없어도 저장된 전략 정보로 진행)
+    if resume_tokens:
+        search_strategies = [entry["strategy"] for entry in resume_tokens.values()] + \
+            [strategy for strategy in search_strategies if strategy["url"] not in resume_tokens]
+    
+    clock.lap("setup")
     
     # 검색 루프
     strategy_index = 0
     max_strategies = len(search_strategies)
     max_search_depth = 5  # 검색 깊이 제한 (더 깊게 검색)
     
-    while len(filtered_shorts) < max_results and strategy_index < max_strategies:
+    if concurrent:
+        crawl_strategies_concurrently(
+            search_strategies, filtered_shorts, existing_ids, processed_urls, discovered_channels,
+            min_views, max_days, max_results, max_search_depth,
+            max_workers=max_workers, per_host_limit=per_host_limit, scheduler=scheduler,
+            candidate_pool=candidate_pool, video_index=video_index, skip_known=skip_known,
+            keyword=keyword, output=output, telemetry=telemetry, near_duplicates=near_duplicates, deadline=clock,
+            checkpoint=checkpoint, resume_tokens=resume_tokens, cancel_event=stop_event
+        )
+        strategy_index = max_strategies
+    
+    while len(filtered_shorts) < max_results and strategy_index < max_strategies and not cancelled():
         current_strategy = search_strategies[strategy_index]
         url = current_strategy["url"]
         description = current_strategy["description"]
         
-        # 이미 처리한 URL은 건너뛰기
-        if url in processed_urls:
+        # 이미 처리한 URL은 건너뛰기 (체크포인트에서 이어받을 연속 페이지가 남은 전략은 제외)
+        resume_entry = resume_tokens.pop(url, None)
+        if url in processed_urls and resume_entry is None:
             strategy_index += 1
             continue
+        
+        # 남은 시간으로 첫 페이지도 받기 어려우면 새 전략을 시작하지 않음
+        if not clock.allows():
+            clock.mark_partial(STOP_DEADLINE if clock.expired() else STOP_BUDGET)
+            print(f"\n⏱️ 남은 시간({clock.remaining():.1f}초)이 부족해 나머지 전략을 건너뜁니다.")
+            break
             
-        processed_urls.add(url)
         print(f"\n전략 {strategy_index+1}/{max_strategies}: {description}")
         print(f"URL: {url}")
         
-        # 페이지 데이터 가져오기
-        shorts_from_url, next_token = extract_shorts_from_page_with_token(url)
+        # 전략별 수확량 측정 (요청 수, 필터 통과 수, 소요 시간)
+        strategy_started = time.monotonic()
+        strategy_requests = 0 if resume_entry is not None else 1
+        strategy_passes = 0
         
-        if not shorts_from_url:
-            print("이 전략에서 데이터를 찾지 못했습니다.")
-            strategy_index += 1
-            continue
-            
-        print(f"검색 결과: {len(shorts_from_url)}개 쇼츠 발견")
-        
-        # 필터링 및 중복 제거
-        filtered_count = filter_and_add_shorts(shorts_from_url, filtered_shorts, existing_ids, min_views, max_days)
-        print(f"필터 통과: {filtered_count}개 (누적 {len(filtered_shorts)}개/{max_results}개)")
-        
-        # 채널 정보 수집 (후속 검색용)
-        for short in shorts_from_url:
-            channel_id = short.get("channel_id")
-            channel_name = short.get("channel_name")
-            if channel_id and channel_name and channel_id not in discovered_channels:
-                discovered_channels[channel_id] = {
-                    "name": channel_name, 
-                    "video_count": 1
-                }
-            elif channel_id in discovered_channels:
-                discovered_channels[channel_id]["video_count"] += 1
-        
-        # 전략 2: 연속 토큰을 사용하여 더 많은 결과 로드 (YouTube 무한 스크롤 시뮬레이션)
-        depth = 0
-        while next_token and len(filtered_shorts) < max_results and depth < max_search_depth:
-            depth += 1
-            print(f"  ↳ 연속 페이지 {depth}/{max_search_depth} 로드 중...")
-            
-            # 페이지 사이 짧은 딜레이
-            time.sleep(random.uniform(1.5, 3.0))
+        if resume_entry is not None:
+            # 체크포인트에서 이어받은 전략: 첫 페이지와 이미 받은 연속 페이지는 다시 요청하지 않음
+            next_token, start_depth = resume_entry["token"], resume_entry["depth"]
+            print(f"체크포인트에서 이어서 연속 페이지 {start_depth + 1}부터 로드합니다.")
+        else:
+            start_depth = 0
+            # 페이지 데이터 가져오기 (렌더러 단계에서 중복/날짜/조회수 사전 필터링)
+            prefilter = RendererPrefilter(existing_ids, min_views, max_days, candidate_pool, video_index, skip_known)
+            page_metrics = {}
+            try:
+                shorts_from_url, next_token = clock.fetch(extract_shorts_from_page_with_token, url, prefilter, page_metrics,
+                                                          deadline=clock)
+            except DeadlineExceeded:
+                clock.mark_partial(STOP_DEADLINE)
+                print("⏱️ 마감 시각이 지나 진행 중인 요청을 버리고 검색을 마칩니다.")
+                break
+            processed_urls.add(url)
             
-            # 연속 토큰으로 다음 페이지 로드
-            next_url = create_url(url, next_token)
-            more_shorts, next_token = extract_shorts_from_page_with_token(next_url)
+            if not prefilter.detected:
+                print("이 전략에서 데이터를 찾지 못했습니다.")
+                telemetry.record_page(current_strategy, 0, page_metrics, prefilter)
+                if scheduler is not None:
+                    scheduler.record(current_strategy.get("type"), strategy_requests, 0, time.monotonic() - strategy_started)
+                strategy_index += 1
+                continue
             
-            if not more_shorts:
-                print("  ↳ 더 이상 결과가 없습니다.")
-                break
-                
-            print(f"  ↳ {len(more_shorts)}개 추가 쇼츠 발견")
+            print(f"검색 결과: {prefilter.detected}개 쇼츠 발견")
             
-            # 필터링 및 중복 제거
-            filtered_count = filter_and_add_shorts(more_shorts, filtered_shorts, existing_ids, min_views, max_days)
-            print(f"  ↳ 필터 통과: {filtered_count}개 (누적 {len(filtered_shorts)}개/{max_results}개)")
+            # 필터링 및 중복 제거 (렌더러 단계에서 걸러진 영상은 이 페이지를 쓸 때 반영)
+            prefilter.commit()
+            filtered_count = filter_and_add_shorts(shorts_from_url, filtered_shorts, existing_ids, min_views, max_days, candidate_pool,
+                                                       video_index=video_index, keyword=keyword, output=output,
+                                                       near_duplicates=near_duplicates)
+            strategy_passes += filtered_count
+            telemetry.record_page(current_strategy, 0, page_metrics, prefilter, filtered_count)
+            print(f"필터 통과: {filtered_count}개 (누적 {len(filtered_shorts)}개/{max_results}개)")
             
             # 채널 정보 수집 (후속 검색용)
-            for short in more_shorts:
-                channel_id = short.get("channel_id")
-                channel_name = short.get("channel_name")
-                if channel_id and channel_name and channel_id not in discovered_channels:
-                    discovered_channels[channel_id] = {
-                        "name": channel_name, 
-                        "video_count": 1
-                    }
-                elif channel_id in discovered_channels:
-                    discovered_channels[channel_id]["video_count"] += 1
+            collect_channels(shorts_from_url, discovered_channels)
+            
+            # 진행 상황 기록 (남은 연속 토큰, 주기적으로 파일에 저장)
+            if checkpoint is not None:
+                checkpoint.track(current_strategy, next_token, 0, max_search_depth)
+                checkpoint.maybe_save()
+        
+        # 전략 2: 연속 토큰을 사용하여 더 많은 결과 로드 (YouTube 무한 스크롤 시뮬레이션)
+        # 다음 페이지는 미리 받아오고, 여기서는 받은 페이지를 필터링만 한다
+        # (페이지 사이 간격은 공유 속도 제한기(j_rate_limiter)가 조절)
+        if len(filtered_shorts) < max_results:
+            continuation_pages = prefetch_continuations(
+                url, next_token, max_search_depth,
+                lambda: RendererPrefilter(existing_ids, min_views, max_days, candidate_pool, video_index, skip_known),
+                stop_event=stop_event, deadline=clock, start_depth=start_depth
+            )
+            for depth, more_shorts, prefilter, page_metrics, next_token in continuation_pages:
+                strategy_requests += 1
+                print(f"  ↳ 연속 페이지 {depth}/{max_search_depth} 로드 완료")
+                
+                if not prefilter.detected:
+                    print("  ↳ 더 이상 결과가 없습니다.")
+                    telemetry.record_page(current_strategy, depth, page_metrics, prefilter)
+                    if checkpoint is not None:
+                        checkpoint.finish(current_strategy)
+                    break
+                    
+                print(f"  ↳ {prefilter.detected}개 추가 쇼츠 발견")
+                
+                # 필터링 및 중복 제거
+                prefilter.commit()
+                filtered_count = filter_and_add_shorts(more_shorts, filtered_shorts, existing_ids, min_views, max_days, candidate_pool,
+                                                   video_index=video_index, keyword=keyword, output=output,
+                                                   near_duplicates=near_duplicates)
+                strategy_passes += filtered_count
+                telemetry.record_page(current_strategy, depth, page_metrics, prefilter, filtered_count)
+                print(f"  ↳ 필터 통과: {filtered_count}개 (누적 {len(filtered_shorts)}개/{max_results}개)")
+                
+                # 채널 정보 수집 (후속 검색용)
+                collect_channels(more_shorts, discovered_channels)
+                
+                if checkpoint is not None:
+                    checkpoint.track(current_strategy, next_token, depth, max_search_depth)
+                    checkpoint.maybe_save()
+                
+                # 충분한 결과를 얻으면 미리 받기 중단
+                if len(filtered_shorts) >= max_results:
+                    break
+            continuation_pages.close()
+        
+        if scheduler is not None:
+            scheduler.record(current_strategy.get("type"), strategy_requests, strategy_passes, time.monotonic() - strategy_started)
         
         # 다음 전략으로 이동
         strategy_index += 1
@@ -123,58 +399,48 @@ def get_shorts_by_keyword(keyword, min_views=100000, max_days=3, max_results=50)
         if len(filtered_shorts) >= max_results:
             break
     
+    if cancelled():
+        clock.mark_partial(STOP_CANCELLED)
+        print("\n⏹️ 중단 요청을 받아 검색을 마칩니다.")
+    clock.lap("search")
+    
+    # 전략 3: 발견된 채널의 쇼츠 탭 후속 탐색 (통과 영상이 많았던 채널부터)
+    if channel_followup and discovered_channels and len(filtered_shorts) < max_results and not clock.expired() \
+            and not cancelled():
+        channel_fetch = HostConcurrencyLimiter(per_host_limit).fetch
+        crawl_channels(
+            discovered_channels, filtered_shorts, existing_ids, min_views, max_days, max_results,
+            max_channels=max_channels, max_workers=max_workers, fetch=channel_fetch,
+            processed_urls=processed_urls, candidate_pool=candidate_pool, video_index=video_index, skip_known=skip_known,
+            keyword=keyword, output=output, telemetry=telemetry, near_duplicates=near_duplicates,
+            deadline=clock
+        )
+    clock.lap("channels")
+    
     # 전략 4: 조회수 필터 동적 조정 (결과가 매우 부족한 경우에만)
-    if len(filtered_shorts) < max_results * 0.3:  # 목표의 30% 미만
-        print(f"\n결과가 너무 적습니다 ({len(filtered_shorts)}개/{max_results}개). 조회수 기준을 일시적으로 낮춰 추가 검색을 시도합니다...")
+    # 재요청 없이, 날짜 필터를 통과했던 후보 풀에 낮춘 기준을 차례로 적용 (마감 후에도 실행)
+    if len(filtered_shorts) < max_results * 0.3 and not cancelled():  # 목표의 30% 미만
+        print(f"\n결과가 너무 적습니다 ({len(filtered_shorts)}개/{max_results}개). 조회수 기준을 일시적으로 낮춰 후보 {len(candidate_pool)}개를 다시 확인합니다...")
         
-        # 조회수 기준 낮추기 (원래의 50%)
-        adjusted_min_views = min_views // 2
-        print(f"조회수 임계값 조정: {min_views:,} → {adjusted_min_views:,}")
-        
-        # 이미 처리된 URL 재사용 (다른 조회수 기준으로)
         original_size = len(filtered_shorts)
         
-        for url in list(processed_urls)[:10]:  # 처음 10개 URL만 재시도
+        for ratio in relaxation_schedule:
             if len(filtered_shorts) >= max_results:
                 break
-                
-            print(f"URL 재시도 (낮은 조회수 기준): {url}")
-            shorts_from_url, _ = extract_shorts_from_page_with_token(url)
             
-            if not shorts_from_url:
-                continue
-                
-            # 낮은 조회수 기준으로 필터링
-            for short in shorts_from_url:
-                video_id = short.get("video_id", "")
-                
-                # 중복 건너뛰기
-                if video_id in existing_ids:
-                    continue
-                    
-                # ID 추적에 추가
-                existing_ids.add(video_id)
-                
-                # 시간 필터
-                if not is_within_days(short.get("published_time", ""), max_days):
-                    continue
-                    
-                # 조정된 조회수 필터
-                views = short.get("views", 0)
-                if views < adjusted_min_views:
-                    continue
-                    
-                # 필터를 통과한 결과 추가
-                filtered_shorts.append(short)
-                
-                # 목표 달성시 중단
-                if len(filtered_shorts) >= max_results:
-                    break
-            
-            time.sleep(random.uniform(1.0, 2.0))
+            adjusted_min_views = int(min_views * ratio)
+            recovered_shorts = []
+            candidate_pool.relax(adjusted_min_views, recovered_shorts, max_results - len(filtered_shorts))
+            # 복구한 후보도 다른 결과와 같은 경로로 (인덱스 기록, 유사 중복 묶기, 결과 스트림)
+            # 후보의 ID는 거부될 때 이미 existing_ids에 들어갔으므로 중복 검사는 이 묶음 안에서만
+            recovered = filter_and_add_shorts(recovered_shorts, filtered_shorts, set(), adjusted_min_views, max_days,
+                                              video_index=video_index, keyword=keyword, output=output,
+                                              near_duplicates=near_duplicates)
+            print(f"조회수 임계값 조정: {min_views:,} → {adjusted_min_views:,} ({recovered}개 복구)")
         
         added = len(filtered_shorts) - original_size
         print(f"조회수 기준 조정으로 {added}개 추가 데이터 확보 (총 {len(filtered_shorts)}개)")
+    clock.lap("relaxation")
     
 
 
@@ -187,7 +453,198 @@ def get_shorts_by_keyword(keyword, min_views=100000, max_days=3, max_results=50)
         print(f"\n⚠️ 최대한의 노력을 했으나 목표인 {max_results}개보다 적은 {len(filtered_shorts)}개만 찾았습니다.")
         print("조건을 충족하는 쇼츠가 충분하지 않은 것 같습니다.")
     
-    # 조회수 기준 정렬
-    filtered_shorts.sort(key=lambda x: x.get("views", 0), reverse=True)
+    # 응답 캐시 통계
+    cache = get_response_cache()
+    if cache is not None:
+        cache_stats = cache.stats()
+        print(f"응답 캐시: 적중 {cache_stats['hits']}회 / 실패 {cache_stats['misses']}회 (적중률 {cache_stats['hit_rate']:.0%})")
+    
+    # 속도 제한 지표
+    for host, host_metrics in get_rate_limiter().metrics().items():
+        print(f"요청 속도 [{host}]: 초당 {host_metrics['rate']}회, 요청 {host_metrics['requests']}회, "
+              f"누적 대기 {host_metrics['total_wait']:.1f}초, 429 {host_metrics['throttled']}회, 차단 페이지 {host_metrics['blocked']}회")
+    
+    # 전략/깊이별 지표 보고 및 저장 (JSON 요약 + Prometheus 텍스트)
+    telemetry.print_report()
+    try:
+        telemetry.save()
+    except OSError as e:
+        print(f"크롤링 지표 저장 실패: {e}")
+    
+    # 전략별 수확량 저장 (다음 실행의 전략 순서에 반영)
+    if scheduler is not None:
+        try:
+            scheduler.save()
+        except OSError as e:
+            print(f"전략 통계 저장 실패: {e}")
+    
+    # 시간 예산 사용 내역 (목표를 채웠으면 예산 때문에 건너뛴 작업이 있어도 부분 결과가 아님)
+    clock.lap("report")
+    partial = clock.partial and len(filtered_shorts) < max_results
+    timings = clock.summary()
+    timings["partial"] = partial
+    if clock.limited:
+        phases = ", ".join(f"{name} {seconds:.1f}초" for name, seconds in timings["phases"].items())
+        print(f"⏱️ 시간 예산 {timings['time_budget']:.1f}초 중 {timings['elapsed']:.1f}초 사용 ({phases})")
+        if partial:
+            print(f"⏱️ 시간 예산 때문에 멈춘 부분 결과입니다 (사유: {clock.stop_reason}, 버린 작업 {timings['abandoned']}개)")
+    
+    # 체크포인트: 끝까지 마쳤으면 삭제, 시간 예산 때문에 멈췄으면 다음 실행이 이어받도록 남김
+    if checkpoint is not None:
+        try:
+            if partial:
+                checkpoint.save()
+                print(f"진행 상황을 체크포인트에 저장했습니다: {checkpoint.path}")
+            else:
+                checkpoint.clear()
+        except OSError as e:
+            print(f"체크포인트 저장/삭제 실패: {e}")
     
-    return filtered_shorts
\ No newline at end of file
+    # 힙에 남은 상위 K개만 순위대로 (전체 정렬 없음)
+    return CrawlResults(filtered_shorts.ranked(), partial, clock.stop_reason if partial else None, timings)
+
+
+def crawl_strategies_concurrently(search_strategies, filtered_shorts, existing_ids, processed_urls,
+                                  discovered_channels, min_views, max_days, max_results, max_search_depth,
+                                  max_workers=DEFAULT_MAX_WORKERS, per_host_limit=DEFAULT_PER_HOST_LIMIT,
+                                  scheduler=None, candidate_pool=None, video_index=None, skip_known=False, keyword=None,
+                                  output=None, telemetry=None, near_duplicates=None, deadline=None,
+                                  checkpoint=None, resume_tokens=None, cancel_event=None):
+    """
+    여러 검색 전략과 각 전략의 연속 페이지 체인을 동시에 크롤링
+
+    전략 하나(첫 페이지 + 연속 페이지들)를 작업 하나로 스레드 풀에 올리고,
+    호스트별 동시 요청 수는 HostConcurrencyLimiter로 제한한다.
+    중복 제거/필터링/채널 수집은 순차 모드와 같은 함수를 잠금 안에서 호출하므로
+    결과 의미는 동일하며, max_results에 도달하면 대기 중인 작업은 취소되고
+    실행 중인 작업은 다음 요청 전에 중단된다.
+    deadline(CrawlDeadline)이 지나면 실행 중인 작업을 기다리지 않고 돌아가며,
+    늦게 끝난 작업의 결과는 반영하지 않는다.
+    checkpoint가 있으면 페이지를 반영할 때마다 전략별 남은 연속 토큰을 기록하고,
+    resume_tokens(전략 URL -> 체크포인트 항목)에 있는 전략은 첫 페이지 없이 저장된 토큰부터 이어간다.
+    cancel_event가 설정되면 목표 달성 때처럼 모든 전략에 중단을 알리고 부분 결과로 표시한다.
+    """
+    resume_tokens = resume_tokens or {}
+    limiter = HostConcurrencyLimiter(per_host_limit)
+    state_lock = threading.Lock()
+    stop_event = threading.Event()
+    max_strategies = len(search_strategies)
+
+    def record(strategy, depth, metrics, prefilter, passed=0):
+        if telemetry is not None:
+            telemetry.record_page(strategy, depth, metrics, prefilter, passed)
+
+    def absorb(shorts, prefilter, prefix, tally, strategy, depth, metrics, next_token):
+        """필터링 결과를 공유 상태에 반영하고 목표 달성 여부 반환"""
+        with state_lock:
+            if stop_event.is_set():
+                record(strategy, depth, metrics, prefilter)
+                return True
+            prefilter.commit()
+            filtered_count = filter_and_add_shorts(shorts, filtered_shorts, existing_ids, min_views, max_days, candidate_pool,
+                                                   video_index=video_index, keyword=keyword, output=output,
+                                                   near_duplicates=near_duplicates)
+            tally["passes"] += filtered_count
+            record(strategy, depth, metrics, prefilter, filtered_count)
+            collect_channels(shorts, discovered_channels)
+            if checkpoint is not None:
+                checkpoint.track(strategy, next_token, depth, max_search_depth)
+                checkpoint.maybe_save()
+            print(f"{prefix} {prefilter.detected}개 발견, 필터 통과: {filtered_count}개 (누적 {len(filtered_shorts)}개/{max_results}개)")
+            if len(filtered_shorts) >= max_results:
+                stop_event.set()
+            return stop_event.is_set()
+
+    def run_strategy(index, strategy):
+        url = strategy["url"]
+        label = f"[전략 {index+1}/{max_strategies}]"
+        if stop_event.is_set():
+            return
+
+        # 전략별 수확량 측정 (요청 수, 필터 통과 수, 소요 시간)
+        tally = {"requests": 0, "passes": 0}
+        started = time.monotonic()
+        if deadline is not None and not deadline.allows():
+            deadline.mark_partial(STOP_BUDGET)
+            return
+        try:
+            resume_entry = resume_tokens.get(url)
+            if resume_entry is not None:
+                # 체크포인트에서 이어받은 전략: 첫 페이지와 이미 받은 연속 페이지는 다시 요청하지 않음
+                next_token, start_depth = resume_entry["token"], resume_entry["depth"]
+                print(f"{label} 체크포인트에서 이어서 연속 페이지 {start_depth + 1}부터 로드합니다.")
+            else:
+                start_depth = 0
+                tally["requests"] += 1
+                prefilter = RendererPrefilter(existing_ids, min_views, max_days, candidate_pool, video_index, skip_known)
+                metrics = {}
+                shorts_from_url, next_token = limiter.fetch(url, prefilter, metrics, deadline)
+                if deadline is not None:
+                    deadline.observe(time.monotonic() - started)
+                with state_lock:
+                    processed_urls.add(url)
+                if not prefilter.detected:
+                    print(f"{label} 이 전략에서 데이터를 찾지 못했습니다.")
+                    record(strategy, 0, metrics, prefilter)
+                    return
+                if absorb(shorts_from_url, prefilter, label, tally, strategy, 0, metrics, next_token):
+                    return
+
+            continuation_pages = prefetch_continuations(
+                url, next_token, max_search_depth,
+                lambda: RendererPrefilter(existing_ids, min_views, max_days, candidate_pool, video_index, skip_known),
+                fetch=limiter.fetch, stop_event=stop_event, deadline=deadline, start_depth=start_depth
+            )
+            try:
+                for depth, more_shorts, prefilter, metrics, next_token in continuation_pages:
+                    tally["requests"] += 1
+                    if not prefilter.detected:
+                        print(f"{label} ↳ 더 이상 결과가 없습니다.")
+                        record(strategy, depth, metrics, prefilter)
+                        if checkpoint is not None:
+                            checkpoint.finish(strategy)
+                        return
+                    if absorb(more_shorts, prefilter, f"{label} ↳ 연속 페이지 {depth}/{max_search_depth}:", tally,
+                              strategy, depth, metrics, next_token):
+                        return
+            finally:
+                continuation_pages.close()
+        finally:
+            if scheduler is not None:
+                scheduler.record(strategy.get("type"), tally["requests"], tally["passes"], time.monotonic() - started)
+
+    print(f"\n동시 크롤링 모드: 작업자 {max_workers}개, 호스트당 동시 요청 {per_host_limit}개")
+
+    executor = ThreadPoolExecutor(max_workers=max(1, int(max_workers)))
+    pending = set()
+    scheduled = set()
+    try:
+        # 처리한 URL에는 첫 페이지를 받은 뒤 추가 (체크포인트에 예약만 된 전략이 처리됨으로 남지 않도록)
+        for index, strategy in enumerate(search_strategies):
+            url = strategy["url"]
+            if url in scheduled or (url in processed_urls and url not in resume_tokens):
+                continue
+            scheduled.add(url)
+            print(f"전략 {index+1}/{max_strategies} 예약: {strategy['description']}")
+            pending.add(executor.submit(run_strategy, index, strategy))
+
+        while pending and not stop_event.is_set():
+            timeout = deadline.remaining() if deadline is not None else None
+            if cancel_event is not None:
+                timeout = CANCEL_POLL_INTERVAL if timeout is None else min(timeout, CANCEL_POLL_INTERVAL)
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception():
+                    print(f"전략 실행 중 오류: {future.exception()}")
+            if pending and deadline is not None and deadline.expired():
+                deadline.mark_partial(STOP_DEADLINE)
+                deadline.abandon(len(pending))
+                print(f"⏱️ 마감 시각이 지나 진행 중인 전략 {len(pending)}개의 결과를 버립니다.")
+                break
+            if pending and cancel_event is not None and cancel_event.is_set():
+                print(f"⏹️ 중단 요청을 받아 진행 중인 전략 {len(pending)}개를 멈춥니다.")
+                break
+    finally:
+        # 목표 달성 시 대기 중인 작업 취소 (마감이 지났으면 실행 중인 작업도 기다리지 않음)
+        stop_event.set()
+        executor.shutdown(wait=deadline is None or not deadline.expired(), cancel_futures=True)
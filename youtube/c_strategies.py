@@ -7,12 +7,17 @@ YouTube 쇼츠 검색 전략 모듈
 """
 from urllib.parse import quote, parse_qs, urlparse
 import time
-import requests
-import json
-import re
+from youtube.o_keyword_expansion import fetch_youtube_suggestions, fetch_google_suggestions, get_keyword_expander
 
-def create_strategies(keyword):
-    """다양한 검색 전략 생성"""
+DEFAULT_RELATED_STRATEGIES = 5  # 연관 검색어 프론티어에서 검색 전략으로 만들 상위 키워드 수
+
+def create_strategies(keyword, related_keywords=None, max_related=DEFAULT_RELATED_STRATEGIES):
+    """
+    다양한 검색 전략 생성
+    
+    related_keywords를 주지 않으면 공유 연관 검색어 확장기(o_keyword_expansion)의
+    순위별 프론티어를 사용하고, 상위 max_related개는 인기순 검색 전략으로 추가한다.
+    """
     strategies = []
     encoded_keyword = quote(keyword)
     
@@ -20,77 +25,76 @@ def create_strategies(keyword):
     base_strategies = [
         {
             "url": f"https://www.youtube.com/results?search_query={encoded_keyword}+shorts&sp=CAMSAhAB",
-            "description": f"'{keyword}' + shorts (인기순 정렬)"
+            "description": f"'{keyword}' + shorts (인기순 정렬)",
+            "type": "search_popular"
         },
         {
             "url": f"https://www.youtube.com/results?search_query={encoded_keyword}+shorts&sp=CAISAhAB",
-            "description": f"'{keyword}' + shorts (최신순 정렬)"
+            "description": f"'{keyword}' + shorts (최신순 정렬)",
+            "type": "search_latest"
         },
         {
             "url": f"https://www.youtube.com/results?search_query={encoded_keyword}+shorts&sp=CAASAhAB",
-            "description": f"'{keyword}' + shorts (조회순 정렬)"
+            "description": f"'{keyword}' + shorts (조회순 정렬)",
+            "type": "search_relevance"
         },
         {
             "url": f"https://www.youtube.com/results?search_query={encoded_keyword}&sp=EgIYAQ%253D%253D",
-            "description": f"'{keyword}' (쇼츠 필터)"
+            "description": f"'{keyword}' (쇼츠 필터)",
+            "type": "search_shorts_filter"
         },
         {
             "url": f"https://www.youtube.com/results/search?q={encoded_keyword}",
-            "description": f"쇼츠 직접 검색 '{keyword}'"
+            "description": f"쇼츠 직접 검색 '{keyword}'",
+            "type": "search_direct"
         }
     ]
 
     strategies.extend(base_strategies)
 
-    # 2. 연관 검색어 가져오기
-    related_keywords = get_related_keywords(keyword)
+    # 2. 연관 검색어 가져오기 (동시 조회 + 다단계 확장 + 시드별 캐시, 전략으로 쓸 개수만큼만 확장)
+    if related_keywords is None:
+        related_keywords = get_keyword_expander().frontier(keyword, limit=max_related)
+        if related_keywords:
+            print(f"연관 검색어 프론티어 {len(related_keywords)}개: {', '.join(related_keywords[:10])}")
 
-    # 연관 검색어 기반 전략 추가 (기본 검색과 동일한 방식으로)
-    for related in related_keywords:
+    # 3. 연관 검색어 기반 전략 추가 (프론티어 순위가 높은 키워드부터, 인기순 정렬만)
+    for related in related_keywords[:max_related]:
         encoded_related = quote(related)
-        # 연관 검색어에 대해 기본 검색과 동일한 전략 적용
-        related_strategies = [
-            # {
-            #     "url": f"https://www.youtube.com/results?search_query={encoded_related}+shorts&sp=CAMSAhAB",
-            #     "description": f"연관검색어 '{related}' + shorts (인기순 정렬)"
-            # },
-            # {
-            #     "url": f"https://www.youtube.com/results?search_query={encoded_related}+shorts&sp=CAISAhAB", 
-            #     "description": f"연관검색어 '{related}' + shorts (최신순 정렬)"
-            # },
-            # {
-            #     "url": f"https://www.youtube.com/results?search_query={encoded_related}+shorts&sp=CAASAhAB",
-            #     "description": f"연관검색어 '{related}' + shorts (조회순 정렬)"
-            # },
-            # {
-            #     "url": f"https://www.youtube.com/results?search_query={encoded_related}&sp=EgIYAQ%253D%253D",
-            #     "description": f"연관검색어 '{related}' (쇼츠 필터)"
-            # },
-            # {
-            #     "url": f"https://www.youtube.com/results/search?q={encoded_related}",
-            #     "description": f"연관검색어 쇼츠 직접 검색 '{related}'"
-            # }
-        ]
-        strategies.extend(related_strategies)
-        
-        # 4. 해시태그 검색
-        strategies.append({
-            "url": f"https://www.youtube.com/hashtag/{encoded_keyword}",
-            "description": f"해시태그 #{keyword}"
-        })
-        
-        # 5. 기간 필터 추가
-        strategies.append({
-            "url": f"https://www.youtube.com/results?search_query={encoded_keyword}+shorts&sp=EgIIAw%253D%253D",
-            "description": f"'{keyword}' + shorts (오늘 업로드)"
-        })
-        
         strategies.append({
-            "url": f"https://www.youtube.com/results?search_query={encoded_keyword}+shorts&sp=EgQIAhAB",
-            "description": f"'{keyword}' + shorts (이번 주 업로드)"
+            "url": f"https://www.youtube.com/results?search_query={encoded_related}+shorts&sp=CAMSAhAB",
+            "description": f"연관검색어 '{related}' + shorts (인기순 정렬)",
+            "type": "related_popular"
         })
-        
-    return strategies
+    
+    # 4. 해시태그 검색
+    strategies.append({
+        "url": f"https://www.youtube.com/hashtag/{encoded_keyword}",
+        "description": f"해시태그 #{keyword}",
+        "type": "hashtag"
+    })
+    
+    # 5. 기간 필터 추가
+    strategies.append({
+        "url": f"https://www.youtube.com/results?search_query={encoded_keyword}+shorts&sp=EgIIAw%253D%253D",
+        "description": f"'{keyword}' + shorts (오늘 업로드)",
+        "type": "search_today"
+    })
+    
+    strategies.append({
+        "url": f"https://www.youtube.com/results?search_query={encoded_keyword}+shorts&sp=EgQIAhAB",
+        "description": f"'{keyword}' + shorts (이번 주 업로드)",
+        "type": "search_this_week"
+    })
+    
+    # 연관 검색어가 시드와 같은 URL을 만들면 하나만 유지
+    unique_strategies = []
+    seen_urls = set()
+    for strategy in strategies:
+        if strategy["url"] not in seen_urls:
+            seen_urls.add(strategy["url"])
+            unique_strategies.append(strategy)
+    return unique_strategies
 
 def create_url(original_url, token):
     """연속 토큰을 사용하여 다음 페이지 URL 생성"""
@@ -109,55 +113,24 @@ def create_url(original_url, token):
     return continuation_url
 
 def get_related_keywords(keyword):
-    """YouTube 검색창의 자동완성 검색어(연관 검색어) 가져오기"""
+    """
+    YouTube 검색창의 자동완성 검색어(연관 검색어) 가져오기 (한 단계, 캐시 없음)
+    
+    다단계 확장/캐시가 필요하면 o_keyword_expansion.KeywordExpander를 사용한다.
+    """
     try:
-        # 검색어 인코딩
-        encoded_keyword = quote(keyword)
-        
-        # YouTube 자동완성 API URL (변경된 엔드포인트)
-        url = f"https://suggestqueries-clients6.youtube.com/complete/search?client=youtube&hl=ko&gl=kr&ds=yt&q={encoded_keyword}&callback=google.sbox.p50"
-        
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-            "Referer": "https://www.youtube.com/"
-        }
-        
-        response = requests.get(url, headers=headers, timeout=5)
-        
-        if response.status_code == 200:
-            # JSONP 형식에서 JSON 부분만 추출 (callback 함수 제거)
-            content = response.text
-            json_str = re.search(r'google\.sbox\.p50\((.*?)\)', content)
-            
-            if json_str:
-                data = json.loads(json_str.group(1))
-                
-                # YouTube 자동완성 검색어 추출
-                suggestions = []
-                if isinstance(data, list) and len(data) > 1 and isinstance(data[1], list):
-                    for item in data[1]:
-                        if isinstance(item, list) and len(item) > 0:
-                            suggestion = item[0]
-                            if suggestion.lower() != keyword.lower():
-                                suggestions.append(suggestion)
-                
-                if suggestions:
-                    print(f"성공적으로 {len(suggestions)}개의 연관 검색어를 가져왔습니다.")
-                    return suggestions
+        # YouTube 자동완성 API
+        suggestions = [s for s in fetch_youtube_suggestions(keyword) if s.lower() != keyword.lower()]
+        if suggestions:
+            print(f"성공적으로 {len(suggestions)}개의 연관 검색어를 가져왔습니다.")
+            return suggestions
                     
         # 두 번째 방법: 구글 자동완성 API 시도
-        google_url = f"http://suggestqueries.google.com/complete/search?client=firefox&ds=yt&q={encoded_keyword}"
-        response = requests.get(google_url, headers=headers, timeout=5)
-        
-        if response.status_code == 200:
-            data = response.json()
-            suggestions = [item for item in data[1] if item.lower() != keyword.lower()]
-            
-            if suggestions:
-                print(f"구글 API에서 {len(suggestions)}개의 연관 검색어를 가져왔습니다.")
-                print("연관 검색어:", suggestions)
-                return suggestions
+        suggestions = [s for s in fetch_google_suggestions(keyword) if s.lower() != keyword.lower()]
+        if suggestions:
+            print(f"구글 API에서 {len(suggestions)}개의 연관 검색어를 가져왔습니다.")
+            print("연관 검색어:", suggestions)
+            return suggestions
     
     except Exception as e:
         print(f"연관 검색어 가져오기 실패: {e}")
@@ -8,11 +8,28 @@ YouTube 페이지 파서 모듈
 
 import re
 import json
+import time
 import random
-import requests
+from youtube.f_http_client import http_get
+from youtube.h_initial_data import extract_initial_data
+from youtube.i_text_parsers import parse_view_count, published_timestamp
+from youtube.l_short_record import ShortRecord
+from youtube.r_crawl_deadline import request_timeout
 
-def extract_shorts_from_page_with_token(url):
-    """웹페이지에서 쇼츠 데이터와 연속 토큰 추출"""
+def extract_shorts_from_page_with_token(url, prefilter=None, metrics=None, deadline=None):
+    """
+    웹페이지에서 쇼츠 데이터와 연속 토큰 추출
+    
+    prefilter(e_data_filters.RendererPrefilter)를 넘기면 원시 렌더러 단계에서
+    중복/날짜/조회수로 먼저 거르고 통과한 항목만 dict로 만든다.
+    metrics(dict)를 넘기면 요청 지연(latency), 응답 크기(bytes), 디코딩 시간(decode_seconds),
+    순회 시간(parse_seconds), 렌더러 수(renderers), 상태 코드, 캐시 적중, 오류를 기록한다.
+    deadline(CrawlDeadline)을 넘기면 요청 타임아웃을 마감까지 남은 시간 이하로 줄인다.
+    """
+    if metrics is None:
+        metrics = {}
+    metrics.update(latency=0.0, bytes=0, decode_seconds=0.0, parse_seconds=0.0, renderers=0,
+                   status_code=None, from_cache=False, error=None)
     try:
         # 사용자 에이전트 순환 (탐지 방지)
         user_agents = [
@@ -42,274 +59,205 @@ def extract_shorts_from_page_with_token(url):
         if "browse_ajax" in url:
             try:
                 # API 요청으로 처리
-                response = requests.get(url, headers=headers)
+                response = timed_get(url, headers, request_timeout(10, deadline), metrics)
                 if response.status_code != 200:
+                    metrics["error"] = f"http_{response.status_code}"
                     return [], None
                     
+                started = time.perf_counter()
                 data = response.json()
-                return extract_shorts_from_ajax_response(data), extract_continuation_token_from_ajax(data)
+                metrics["decode_seconds"] = time.perf_counter() - started
+                return extract_shorts_and_token(data, prefilter, metrics)
             except Exception as e:
                 print(f"AJAX 요청 오류: {e}")
+                metrics["error"] = type(e).__name__
                 return [], None
         
         # 일반 페이지 요청
-        response = requests.get(url, headers=headers, timeout=15)
+        response = timed_get(url, headers, request_timeout(15, deadline), metrics)
         
         if response.status_code != 200:
             print(f"페이지 요청 실패: {response.status_code}")
-            return [], None
-        
-        # 초기 데이터 추출 (여러 패턴 시도)
-        patterns = [
-            r'var\s+ytInitialData\s*=\s*({.+?});</script>',
-            r'window\["ytInitialData"\]\s*=\s*({.+?});</script>',
-            r'ytInitialData\s*=\s*({.+?});</script>'
-        ]
-        
-        data_match = None
-        for pattern in patterns:
-            matches = re.search(pattern, response.text, re.DOTALL)
-            if matches:
-                data_match = matches
-                break
-        
-        if not data_match:
-            print("페이지에서 데이터를 찾을 수 없습니다.")
+            metrics["error"] = f"http_{response.status_code}"
             return [], None
         
         try:
-            # JSON 파싱
-            data = json.loads(data_match.group(1))
+            # 초기 데이터 추출 (할당문 1회 탐색 + JSON 객체만 디코딩)
+            started = time.perf_counter()
+            data = extract_initial_data(response.content)
+            metrics["decode_seconds"] = time.perf_counter() - started
             
-            # 쇼츠 데이터와 연속 토큰 추출
-            shorts_data = extract_shorts_from_data(data)
-            continuation_token = extract_continuation_token(data)
+            if data is None:
+                print("페이지에서 데이터를 찾을 수 없습니다.")
+                metrics["error"] = "no_initial_data"
+                return [], None
             
-            return shorts_data, continuation_token
+            # 쇼츠 데이터와 연속 토큰을 한 번의 순회로 추출
+            return extract_shorts_and_token(data, prefilter, metrics)
             
         except json.JSONDecodeError as e:
             print(f"JSON 파싱 오류: {e}")
+            metrics["error"] = "json_decode"
             return [], None
             
     except Exception as e:
         print(f"페이지 처리 중 오류: {str(e)}")
+        metrics["error"] = type(e).__name__
         return [], None
 
-def extract_shorts_from_ajax_response(data):
-    """AJAX 응답에서 쇼츠 데이터 추출"""
-    shorts_data = []
-    
+
+VIDEO_PAGE_URL = "https://www.youtube.com/shorts/{}"
+PUBLISH_DATE_PATTERN = re.compile(rb'"(?:publishDate|uploadDate)":"(\d{4})-(\d{2})-(\d{2})')
+
+
+def fetch_publish_time(video_id, timeout=10):
+    """
+    쇼츠 페이지의 publishDate로 게시일 조회 (채널 쇼츠 탭 릴처럼 게시 시간 문구가 없는 항목용)
+
+    영상 페이지는 크고(~1MB) 영상마다 한 번만 보므로 응답 캐시에 넣지 않는다
+    (검색 페이지 캐시가 밀려나지 않도록).
+
+    Returns:
+        "2024년 5월 1일" 형식 문자열 (is_within_days/published_timestamp가 해석), 실패하면 ""
+    """
+    headers = {"Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7", "Referer": "https://www.youtube.com/"}
     try:
-        # 응답 구조에 따라 처리
-        if isinstance(data, list) and len(data) >= 1:
-            response_data = data[1].get("response", {})
-        else:
-            response_data = data.get("response", {})
-        
-        # onResponseReceivedActions 확인
-        actions = response_data.get("onResponseReceivedActions", [])
-        for action in actions:
-            if "appendContinuationItemsAction" in action:
-                items = action["appendContinuationItemsAction"].get("continuationItems", [])
-                shorts_data.extend(process_items(items))
-        
-        return shorts_data
+        response = http_get(VIDEO_PAGE_URL.format(video_id), headers=headers, timeout=timeout, use_cache=False)
     except Exception as e:
-        print(f"AJAX 응답 처리 오류: {e}")
-        return []
+        print(f"게시일 조회 실패 ({video_id}): {e}")
+        return ""
+    if response.status_code != 200:
+        return ""
+    match = PUBLISH_DATE_PATTERN.search(response.content or b"")
+    if not match:
+        return ""
+    year, month, day = (int(group) for group in match.groups())
+    return f"{year}년 {month}월 {day}일"
 
-def extract_continuation_token_from_ajax(data):
-    """AJAX 응답에서 연속 토큰 추출"""
-    try:
-        if isinstance(data, list) and len(data) >= 1:
-            response_data = data[1].get("response", {})
-        else:
-            response_data = data.get("response", {})
-        
-        actions = response_data.get("onResponseReceivedActions", [])
-        for action in actions:
-            if "appendContinuationItemsAction" in action:
-                items = action["appendContinuationItemsAction"].get("continuationItems", [])
-                for item in items:
-                    if "continuationItemRenderer" in item:
-                        token = item["continuationItemRenderer"].get("continuationEndpoint", {}).get("continuationCommand", {}).get("token")
+
+def timed_get(url, headers, timeout, metrics):
+    """http_get 후 지연 시간/응답 크기/캐시 적중 여부를 metrics에 기록"""
+    started = time.perf_counter()
+    response = http_get(url, headers=headers, timeout=timeout)
+    metrics["latency"] = time.perf_counter() - started
+    metrics["status_code"] = response.status_code
+    metrics["bytes"] = len(response.content or b"")
+    metrics["from_cache"] = bool(getattr(response, "from_cache", False))
+    return response
+
+# 쇼츠 후보 렌더러 종류 (richItemRenderer 등 감싸는 렌더러는 순회 중 자연히 내려감)
+VIDEO_RENDERER_KEYS = frozenset(["videoRenderer", "reelItemRenderer", "gridVideoRenderer"])
+CONTINUATION_RENDERER_KEY = "continuationItemRenderer"
+
+
+def walk_renderers(data):
+    """
+    디코딩된 트리를 문서 순서대로 한 번 순회하며 렌더러 생성
+
+    경로를 하드코딩하지 않으므로 검색/홈/채널/쇼츠 탭/AJAX 응답 등
+    어느 레이아웃에 있든 다음 항목을 찾는다.
+        ("videoRenderer" | "reelItemRenderer" | "gridVideoRenderer", 렌더러 dict)
+        ("continuationItemRenderer", 연속 토큰 문자열)
+    찾은 렌더러 내부로는 더 내려가지 않는다.
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            children = []
+            for key, value in node.items():
+                if key in VIDEO_RENDERER_KEYS:
+                    if isinstance(value, dict):
+                        yield key, value
+                elif key == CONTINUATION_RENDERER_KEY:
+                    if isinstance(value, dict):
+                        token = value.get("continuationEndpoint", {}).get("continuationCommand", {}).get("token")
                         if token:
-                            return token
+                            yield key, token
+                elif isinstance(value, (dict, list)):
+                    children.append(value)
+            stack.extend(reversed(children))
+        elif isinstance(node, list):
+            stack.extend(child for child in reversed(node) if isinstance(child, (dict, list)))
+
+
+def process_renderer(kind, renderer, prefilter=None):
+    """렌더러 하나를 쇼츠 정보로 변환 (쇼츠가 아니거나 사전 필터에서 거부되면 None)"""
+    # 이미 본 영상은 쇼츠 판별 전에 바로 제외
+    if prefilter is not None and prefilter.is_duplicate(renderer):
         return None
-    except Exception as e:
-        print(f"연속 토큰 추출 오류: {e}")
+    
+    is_reel = kind == "reelItemRenderer"
+    if not is_reel and not detect_if_short(renderer):
         return None
-        
-def extract_shorts_from_data(data):
-    """데이터에서 쇼츠 항목 추출"""
+    
+    # 조회수/게시 시간만 먼저 확인하고 통과한 항목만 전체 정보 생성
+    if prefilter is not None and not prefilter.accept(renderer, is_reel):
+        return None
+    
+    return extract_video_info(renderer, is_reel=is_reel)
+
+
+def extract_shorts_and_token(data, prefilter=None, metrics=None):
+    """
+    데이터에서 쇼츠 항목과 첫 번째 연속 토큰을 한 번의 순회로 추출
+    
+    metrics(dict)를 넘기면 순회한 영상 렌더러 수(renderers)와 소요 시간(parse_seconds)을 기록한다.
+    """
     shorts_data = []
+    continuation_token = None
+    renderers = 0
+    started = time.perf_counter()
     
     try:
-        # 여러 가능한 콘텐츠 경로 탐색
-        content_paths = [
-            # 검색 결과 경로
-            data.get("contents", {}).get("twoColumnSearchResultsRenderer", {}).get("primaryContents", {}).get("sectionListRenderer", {}).get("contents", []),
-            # 홈피드 경로
-            data.get("contents", {}).get("twoColumnBrowseResultsRenderer", {}).get("tabs", []),
-            # 채널 페이지 경로
-            data.get("contents", {}).get("twoColumnBrowseResultsRenderer", {}).get("secondaryContents", {}).get("sectionListRenderer", {}).get("contents", []),
-            # 쇼츠 탭 경로
-            data.get("contents", {}).get("twoColumnBrowseResultsRenderer", {}).get("richGridRenderer", {}).get("contents", [])
-        ]
-        
-        for content_path in content_paths:
-            if not content_path:
+        # 페이지의 영상 ID를 먼저 모아 영상 인덱스 조회를 페이지당 한 번으로
+        entries = list(walk_renderers(data))
+        if prefilter is not None:
+            prefilter.begin_page(payload for kind, payload in entries if kind != CONTINUATION_RENDERER_KEY)
+        
+        for kind, payload in entries:
+            if kind == CONTINUATION_RENDERER_KEY:
+                if continuation_token is None:
+                    continuation_token = payload
                 continue
             
-            # 탭 처리 (twoColumnBrowseResultsRenderer.tabs)
-            if isinstance(content_path, list) and content_path and "tabRenderer" in content_path[0]:
-                for tab in content_path:
-                    if "tabRenderer" in tab:
-                        tab_content = tab["tabRenderer"].get("content", {})
-                        
-                        # 섹션 리스트 처리
-                        if "sectionListRenderer" in tab_content:
-                            sections = tab_content["sectionListRenderer"].get("contents", [])
-                            for section in sections:
-                                # 아이템 섹션 렌더러 처리
-                                if "itemSectionRenderer" in section:
-                                    items = section["itemSectionRenderer"].get("contents", [])
-                                    shorts_data.extend(process_items(items))
-                        
-                        # 리치 그리드 처리
-                        elif "richGridRenderer" in tab_content:
-                            items = tab_content["richGridRenderer"].get("contents", [])
-                            shorts_data.extend(process_items(items))
-            
-            # 섹션 리스트 처리 (일반 검색 결과)
-            elif isinstance(content_path, list):
-                for section in content_path:
-                    # 아이템 섹션 렌더러 처리
-                    if "itemSectionRenderer" in section:
-                        items = section["itemSectionRenderer"].get("contents", [])
-                        shorts_data.extend(process_items(items))
-                    # 리치 그리드 처리
-                    elif "richGridRenderer" in section:
-                        items = section["richGridRenderer"].get("contents", [])
-                        shorts_data.extend(process_items(items))
-            
-            # 리치 그리드 콘텐츠 직접 처리
-            elif isinstance(content_path, list):
-                shorts_data.extend(process_items(content_path))
+            renderers += 1
+            video_info = process_renderer(kind, payload, prefilter)
+            if video_info:
+                shorts_data.append(video_info)
         
-        return shorts_data
+        if prefilter is not None:
+            prefilter.end_page()
+        return shorts_data, continuation_token
         
     except Exception as e:
         print(f"데이터 처리 중 오류: {str(e)}")
-        return []
+        return shorts_data, continuation_token
+    
+    finally:
+        if metrics is not None:
+            metrics["renderers"] = renderers
+            metrics["parse_seconds"] = time.perf_counter() - started
+
+def extract_shorts_from_ajax_response(data):
+    """AJAX 응답에서 쇼츠 데이터 추출"""
+    return extract_shorts_and_token(data)[0]
+
+def extract_continuation_token_from_ajax(data):
+    """AJAX 응답에서 연속 토큰 추출"""
+    return extract_shorts_and_token(data)[1]
+        
+def extract_shorts_from_data(data):
+    """데이터에서 쇼츠 항목 추출"""
+    return extract_shorts_and_token(data)[0]
 
 def extract_continuation_token(data):
     """데이터에서 연속 토큰 추출"""
-    try:
-        # 가능한 토큰 경로 확인
-        # 1. 검색 결과 내 토큰
-        search_contents = data.get("contents", {}).get("twoColumnSearchResultsRenderer", {}).get("primaryContents", {}).get("sectionListRenderer", {}).get("contents", [])
-        for item in search_contents:
-            if "continuationItemRenderer" in item:
-                token = item["continuationItemRenderer"].get("continuationEndpoint", {}).get("continuationCommand", {}).get("token")
-                if token:
-                    return token
-        
-        # 2. 탭 내 토큰
-        tabs = data.get("contents", {}).get("twoColumnBrowseResultsRenderer", {}).get("tabs", [])
-        for tab in tabs:
-            if "tabRenderer" in tab:
-                tab_content = tab["tabRenderer"].get("content", {})
-                
-                # 리치 그리드 내 토큰
-                if "richGridRenderer" in tab_content:
-                    rich_contents = tab_content["richGridRenderer"].get("contents", [])
-                    for item in rich_contents:
-                        if "continuationItemRenderer" in item:
-                            token = item["continuationItemRenderer"].get("continuationEndpoint", {}).get("continuationCommand", {}).get("token")
-                            if token:
-                                return token
-                
-                # 섹션 리스트 내 토큰
-                elif "sectionListRenderer" in tab_content:
-                    sections = tab_content["sectionListRenderer"].get("contents", [])
-                    for section in sections:
-                        if "continuationItemRenderer" in section:
-                            token = section["continuationItemRenderer"].get("continuationEndpoint", {}).get("continuationCommand", {}).get("token")
-                            if token:
-                                return token
-                        
-                        # 아이템 섹션 내 토큰
-                        elif "itemSectionRenderer" in section:
-                            items = section["itemSectionRenderer"].get("contents", [])
-                            for item in items:
-                                if "continuationItemRenderer" in item:
-                                    token = item["continuationItemRenderer"].get("continuationEndpoint", {}).get("continuationCommand", {}).get("token")
-                                    if token:
-                                        return token
-        
-        # 3. 리치 그리드 직접 확인
-        grid_contents = data.get("contents", {}).get("twoColumnBrowseResultsRenderer", {}).get("richGridRenderer", {}).get("contents", [])
-        if grid_contents:
-            for item in grid_contents:
-                if "continuationItemRenderer" in item:
-                    token = item["continuationItemRenderer"].get("continuationEndpoint", {}).get("continuationCommand", {}).get("token")
-                    if token:
-                        return token
-        
-        return None
-    except Exception as e:
-        print(f"연속 토큰 추출 중 오류: {str(e)}")
-        return None
+    return extract_shorts_and_token(data)[1]
         
 def process_items(items):
     """아이템 목록에서 쇼츠 추출"""
-    shorts_data = []
-    
-    for item in items:
-        # 비디오 렌더러 처리
-        if "videoRenderer" in item:
-            video = item["videoRenderer"]
-            if detect_if_short(video):
-                video_info = extract_video_info(video)
-                if video_info:
-                    shorts_data.append(video_info)
-        
-        # 릴 아이템 렌더러 처리 (쇼츠)
-        elif "reelItemRenderer" in item:
-            reel = item["reelItemRenderer"]
-            video_info = extract_video_info(reel, is_reel=True)
-            if video_info:
-                shorts_data.append(video_info)
-        
-        # 리치 아이템 렌더러 처리
-        elif "richItemRenderer" in item:
-            rich_content = item["richItemRenderer"].get("content", {})
-            
-            # 릴 아이템 렌더러 처리
-            if "reelItemRenderer" in rich_content:
-                reel = rich_content["reelItemRenderer"]
-                video_info = extract_video_info(reel, is_reel=True)
-                if video_info:
-                    shorts_data.append(video_info)
-            
-            # 비디오 렌더러 처리
-            elif "videoRenderer" in rich_content:
-                video = rich_content["videoRenderer"]
-                if detect_if_short(video):
-                    video_info = extract_video_info(video)
-                    if video_info:
-                        shorts_data.append(video_info)
-        
-        # 그리드 비디오 렌더러 처리
-        elif "gridVideoRenderer" in item:
-            video = item["gridVideoRenderer"]
-            if detect_if_short(video):
-                video_info = extract_video_info(video)
-                if video_info:
-                    shorts_data.append(video_info)
-    
-    return shorts_data
+    return extract_shorts_and_token(items)[0]
 
 def detect_if_short(video):
     """비디오가 쇼츠인지 감지"""
@@ -370,8 +318,9 @@ def extract_video_info(video, is_reel=False):
         view_count_text = extract_text(video.get("viewCountText", {}))
         views = parse_view_count(view_count_text)
         
-        # 게시 시간
+        # 게시 시간 (절대 시각 추정치도 함께 저장해 이후 단계에서 재해석하지 않음)
         published_time = extract_text(video.get("publishedTimeText", {}))
+        published_at = published_timestamp(published_time)
         
         # 채널 정보
         channel_name = ""
@@ -397,9 +346,6 @@ def extract_video_info(video, is_reel=False):
             if thumbnails:
                 thumbnail_url = thumbnails[-1].get("url", "")
         
-        # 비디오 URL
-        video_url = f"https://www.youtube.com/shorts/{video_id}"
-        
         # 기본 설명만 추출 (API 호출 없이)
         description = ""
         if "descriptionSnippet" in video:
@@ -415,18 +361,19 @@ def extract_video_info(video, is_reel=False):
                         description = snippet_description
                         break
 
-        return {
-            "video_id": video_id,
-            "title": title,
-            "view_count_text": view_count_text,
-            "views": views,
-            "published_time": published_time,
-            "channel_name": channel_name,
-            "channel_id": channel_id,
-            "thumbnail_url": thumbnail_url,
-            "description": description,
-            "video_url": video_url
-        }
+        # video_url은 video_id에서 계산되는 속성
+        return ShortRecord(
+            video_id=video_id,
+            title=title,
+            view_count_text=view_count_text,
+            views=views,
+            published_time=published_time,
+            published_at=published_at,
+            channel_name=channel_name,
+            channel_id=channel_id,
+            thumbnail_url=thumbnail_url,
+            description=description
+        )
         
     except Exception as e:
         print(f"비디오 정보 추출 중 오류: {str(e)}")
@@ -443,53 +390,3 @@ def extract_text(text_container):
         return "".join([run.get("text", "") for run in text_container["runs"]])
     
     return ""
-
-def parse_view_count(view_count_text):
-    """조회수 텍스트에서 숫자 추출"""
-    if not view_count_text:
-        return 0
-    
-    # 한국어 조회수 패턴 처리 ("조회수 1.5만회", "조회수 1000회" 등)
-    match = re.search(r'(\d+(?:,\d+)*(?:\.\d+)?)\s*([천만억])?회', view_count_text)
-    if match:
-        # 콤마(,) 제거 후 숫자 변환
-        number_str = match.group(1).replace(',', '')
-        number = float(number_str)
-        unit = match.group(2) if match.group(2) else ""
-        
-        multiplier = {
-            "": 1,
-            "천": 1000,
-            "만": 10000,
-            "억": 100000000
-        }.get(unit, 1)
-        
-        return int(number * multiplier)
-    
-    # 영어 패턴 처리 ("1.5M views", "1K views" 등)
-    en_match = re.search(r'(\d+(?:,\d+)*(?:\.\d+)?)\s*([KMB])', view_count_text, re.IGNORECASE)
-    if en_match:
-        number_str = en_match.group(1).replace(',', '')
-        number = float(number_str)
-        unit = en_match.group(2).upper()
-        
-        multiplier = {
-            "K": 1000,
-            "M": 1000000,
-            "B": 1000000000
-        }.get(unit, 1)
-        
-        return int(number * multiplier)
-    
-    # 단순 숫자 추출
-    numbers = re.findall(r'\d+', view_count_text)
-    if numbers:
-        try:
-            # 콤마 제거 후 모든 숫자 연결
-            number_str = "".join(numbers).replace(',', '')
-            return int(number_str)
-        except:
-            pass
-    
-    return 0
-
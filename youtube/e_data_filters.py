@@ -6,90 +6,393 @@ YouTube 쇼츠 데이터 필터링 모듈
 조회수 및 날짜 기반 필터링, 중복 제거
 """
 
-import re
-from datetime import datetime, timedelta
+import time
+import threading
+from youtube.d_page_parser import extract_text, extract_video_info
+from youtube.i_text_parsers import parse_time_text, parse_view_count, published_timestamp
+from youtube.l_short_record import ShortRecord
+from common.near_duplicates import NEW_CLUSTER, NEW_CANONICAL
 
-def is_within_days(time_text, days=3):
+# 시간/분/초 단위는 항상 최근, 주/개월/년 단위는 항상 거부
+RECENT_UNITS = frozenset(["second", "minute", "hour"])
+REJECTED_UNITS = frozenset(["week", "month", "year"])
+
+def is_within_days(time_text, days=3, now=None):
     """
     게시 시간이 지정된 일수 이내인지 확인
     """
-    if not time_text:
-        return False
+    # 컴파일된 토크나이저 + 메모이제이션 캐시로 해석
+    parsed = parse_time_text(time_text)
     
-    # "N일 전" 패턴
-    day_match = re.search(r'(\d+)\s*일\s*전', time_text)
-    if day_match:
-        days_ago = int(day_match.group(1))
-        return days_ago <= days
+    # 기본적으로 확인할 수 없는 형식은 거부
+    if parsed is None:
+        return False
     
-    # "N days ago" 패턴 (영어)
-    day_en_match = re.search(r'(\d+)\s*days?\s*ago', time_text, re.IGNORECASE)
-    if day_en_match:
-        days_ago = int(day_en_match.group(1))
-        return days_ago <= days
+    unit, amount = parsed
     
-    # 시간, 분, 초 전은 항상 최근
-    if re.search(r'시간\s*전|분\s*전|초\s*전|방금', time_text, re.IGNORECASE):
-        return True
+    # "N일 전", "N days ago" 패턴
+    if unit == "day":
+        return amount <= days
     
-    # "어제", "오늘", "yesterday", "today"는 최근
-    if re.search(r'어제|오늘|yesterday|today', time_text, re.IGNORECASE):
+    # 시간, 분, 초 전 / 방금 / 오늘 / 어제는 항상 최근
+    if unit in RECENT_UNITS:
         return True
     
-    # "N주 전", "N weeks ago" 패턴은 명시적으로 거부
-    if re.search(r'\d+\s*주\s*전|\d+\s*weeks?\s*ago', time_text, re.IGNORECASE):
+    # "N주 전", "N개월 전", "N년 전" 패턴은 명시적으로 거부
+    if unit in REJECTED_UNITS:
         return False
     
-    # "N개월 전", "N months ago" 패턴은 명시적으로 거부
-    if re.search(r'\d+\s*(?:개월|달)\s*전|\d+\s*months?\s*ago', time_text, re.IGNORECASE):
-        return False
-    
-    # "N년 전", "N years ago" 패턴은 명시적으로 거부
-    if re.search(r'\d+\s*년\s*전|\d+\s*years?\s*ago', time_text, re.IGNORECASE):
+    # 특정 날짜 형식 (예: "2023년 10월 15일") - 현재 날짜와 비교
+    if now is None:
+        now = time.time()
+    return (now - amount) // 86400 <= days
+
+class SharedIdSet(set):
+    """
+    여러 스레드(키워드)가 함께 쓰는 영상 ID 집합
+
+    확인 후 추가가 두 단계로 나뉘면 두 키워드가 같은 영상을 동시에 가져갈 수 있으므로
+    claim()으로 잠금 안에서 한 번에 처리한다.
+    """
+
+    def __init__(self, ids=()):
+        super().__init__(ids)
+        self._lock = threading.Lock()
+
+    def claim(self, video_id):
+        """처음 보는 ID면 추가하고 True, 이미 있으면 False"""
+        with self._lock:
+            if video_id in self:
+                return False
+            self.add(video_id)
+            return True
+
+class RunIdSet:
+    """
+    공유 영상 ID 집합을 감싸 이번 실행이 추가한 ID만 따로 기록 (체크포인트용)
+
+    포함 여부와 추가는 공유 집합에 그대로 전달하고, 순회와 len()은 이번 실행이
+    추가한 ID만 대상으로 한다. 다른 키워드가 채운 ID나 이전부터 알던 ID는 저장하지 않는다.
+    """
+
+    def __init__(self, shared):
+        self.shared = shared
+        self._added = set()
+        self._lock = threading.Lock()
+
+    def __contains__(self, video_id):
+        return video_id in self.shared
+
+    def __len__(self):
+        with self._lock:
+            return len(self._added)
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._added))
+
+    def add(self, video_id):
+        self.shared.add(video_id)
+        with self._lock:
+            self._added.add(video_id)
+
+    def update(self, video_ids):
+        video_ids = list(video_ids)
+        self.shared.update(video_ids)
+        with self._lock:
+            self._added.update(video_ids)
+
+    def claim(self, video_id):
+        """처음 보는 ID면 공유 집합에 추가하고 True (이번 실행의 ID로 기록)"""
+        if not claim_id(self.shared, video_id):
+            return False
+        with self._lock:
+            self._added.add(video_id)
+        return True
+
+def claim_id(existing_ids, video_id):
+    """video_id를 처음 보면 existing_ids에 추가하고 True (SharedIdSet이면 잠금 안에서)"""
+    claim = getattr(existing_ids, "claim", None)
+    if claim is not None:
+        return claim(video_id)
+    if video_id in existing_ids:
         return False
+    existing_ids.add(video_id)
+    return True
+
+def filter_shorts(shorts_list, min_views, max_days, now=None, pool=None):
+    """
+    페이지 단위 일괄 필터 (중복 처리 없이 날짜/조회수만 확인)
     
-    # 특정 날짜 형식 (예: "2023년 10월 15일")
-    date_match = re.search(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일', time_text)
-    if date_match:
-        year = int(date_match.group(1))
-        month = int(date_match.group(2))
-        day = int(date_match.group(3))
-        
-        # 현재 날짜와 비교
-        now = datetime.now()
-        video_date = datetime(year, month, day)
-        delta = now - video_date
-        
-        return delta.days <= days
+    한 페이지 목록 전체에 같은 기준 시각을 적용하고, 각 레코드에
+    published_at(게시 시각 epoch 추정치)이 없으면 채워 넣는다.
+    pool(CandidatePool)을 넘기면 날짜는 통과했지만 조회수가 부족한 레코드를 보관한다.
     
-    # 기본적으로 확인할 수 없는 형식은 거부
-    return False
-
-def filter_and_add_shorts(shorts_list, filtered_results, existing_ids, min_views, max_days):
-    """쇼츠 데이터를 필터링하고 결과 목록에 추가"""
-    added_count = 0
+    Returns:
+        list: 두 필터를 모두 통과한 레코드
+    """
+    if now is None:
+        now = time.time()
     
+    passed = []
     for short in shorts_list:
-        video_id = short.get("video_id", "")
+        published_time = short.get("published_time", "")
+        if short.get("published_at") is None:
+            short["published_at"] = published_timestamp(published_time, now)
         
-        # 중복 건너뛰기
-        if video_id in existing_ids:
+        if not is_within_days(published_time, max_days, now):
             continue
-            
-        # ID 추적에 추가
-        existing_ids.add(video_id)
-        
-        # 시간 필터
-        if not is_within_days(short.get("published_time", ""), max_days):
+        if short.get("views", 0) < min_views:
+            if pool is not None:
+                pool.add_record(short)
             continue
-            
-        # 조회수 필터
-        views = short.get("views", 0)
-        if views < min_views:
-            continue
-            
-        # 두 필터를 모두 통과한 결과만 추가
-        filtered_results.append(short)
-        added_count += 1
+        passed.append(short)
+    
+    return passed
+
+def filter_and_add_shorts(shorts_list, filtered_results, existing_ids, min_views, max_days, pool=None,
+                          video_index=None, keyword=None, output=None, near_duplicates=None):
+    """
+    쇼츠 데이터를 필터링하고 결과 목록에 추가
+    
+    video_index(common.video_index.VideoIndex)를 넘기면 통과한 영상은 인덱스에
+    저장/갱신하고, 통과하지 못했지만 이미 알려진 영상은 조회수 스냅샷만 갱신한다.
+    output(common.utils.ResultStream)을 넘기면 통과한 영상을 바로 JSONL 파일에 기록한다.
+    near_duplicates(common.near_duplicates.NearDuplicateIndex)를 넘기면 유사 중복 묶음마다
+    대표 영상 하나만 결과에 남긴다 (조회수가 더 높은 재업로드가 오면 결과의 대표를 교체하고,
+    output에 이미 기록된 이전 대표는 retract로 무효 표시).
+    """
+    # 중복 건너뛰기 + ID 추적에 추가 (같은 페이지 안의 중복도 제거)
+    unique_shorts = [short for short in shorts_list if claim_id(existing_ids, short.get("video_id", ""))]
+    
+    # 시간/조회수 필터를 페이지 단위로 일괄 적용
+    passed = filter_shorts(unique_shorts, min_views, max_days, pool=pool)
     
-    return added_count
\ No newline at end of file
+    # 영구 인덱스 갱신 (페이지당 한 트랜잭션, 유사 중복도 영상 단위로 기록)
+    if video_index is not None:
+        video_index.record_page(unique_shorts, passed, keyword)
+    replacements, superseded = [], []
+    if near_duplicates is not None:
+        passed, replacements, superseded = collapse_near_duplicates(passed, filtered_results, near_duplicates)
+    if output is not None:
+        output.write_all(passed + replacements)
+        if superseded:
+            output.retract(superseded)
+    
+    # 두 필터를 모두 통과한 결과만 추가
+    filtered_results.extend(passed)
+    return len(passed)
+
+def collapse_near_duplicates(passed, filtered_results, near_duplicates):
+    """
+    통과한 영상을 유사 중복 인덱스에 넣고 결과에 추가할 대표만 반환
+    
+    이미 결과에 있는 대표보다 조회수가 높은 재업로드는 그 자리를 바로 교체하고,
+    나머지 유사 중복은 버린다. 이전 대표가 다른 결과 모음(다른 키워드)에 들어간 경우는
+    인덱스의 owner로 구분해 교체하지 않는다.
+    
+    Returns:
+        (새 묶음의 대표 목록, 결과에서 기존 대표를 교체한 영상 목록, 교체되어 빠진 이전 대표의 video_id 목록)
+    """
+    new_clusters = []
+    replacements = []
+    superseded = []
+    for short in passed:
+        _, status, previous, previous_owner = near_duplicates.add_owned(short, filtered_results)
+        if status == NEW_CLUSTER:
+            new_clusters.append(short)
+        elif status == NEW_CANONICAL:
+            # 이전 대표가 같은 페이지에서 들어와 아직 결과에 없으면 그 자리를 대신함
+            for position, existing in enumerate(new_clusters):
+                if existing is previous:
+                    new_clusters[position] = short
+                    break
+            else:
+                if previous_owner is filtered_results and replace_result(filtered_results, previous, short):
+                    replacements.append(short)
+                    superseded.append(previous.get("video_id"))
+    return new_clusters, replacements, superseded
+
+def replace_result(filtered_results, previous, short):
+    """
+    결과 목록에서 previous를 short로 교체 (TopKRanking 같은 결과 모음은 자체 replace 사용)
+
+    previous는 filtered_results에 들어갔던 레코드여야 한다 (collapse_near_duplicates가 인덱스의 owner로 확인).
+    """
+    replace = getattr(filtered_results, "replace", None)
+    if replace is not None:
+        return replace(previous, short)
+    for position, existing in enumerate(filtered_results):
+        if existing is previous:
+            filtered_results[position] = short
+            return True
+    return False
+
+class RendererPrefilter:
+    """
+    원시 렌더러 단계의 빠른 거부 필터
+
+    videoId 중복 여부와 viewCountText/publishedTimeText만 보고 판단하므로
+    썸네일, 채널, 설명 등 전체 정보는 통과한 항목에 대해서만 만들어진다.
+    filter_and_add_shorts와 같은 규칙을 따른다: 중복은 그대로 건너뛰고,
+    날짜/조회수로 거부된 영상은 existing_ids에 기록한다. 통과한 영상은
+    이후 filter_and_add_shorts가 existing_ids에 추가한다.
+    거부 기록, 후보 풀 추가, 인덱스 갱신은 모아 두었다가 호출자가 페이지를 실제로 쓸 때
+    commit()으로 반영한다 (마감 등으로 버린 페이지는 공유 상태를 바꾸지 않는다).
+
+    video_index(common.video_index.VideoIndex)를 넘기면 begin_page()에서 페이지의 영상 ID를
+    한 번에 조회해, 이미 인덱스에 있는 영상은 skip_known이면 중복으로 건너뛰고,
+    레코드를 만들지 않고 걸러진 경우에도 commit()에서 발견 시각/조회수를 갱신한다.
+
+    defer_undated가 True면 게시 시간 문구가 없는 릴(채널 쇼츠 탭의 reelItemRenderer)은
+    날짜로 거부하지 않고 조회수만 보고 통과시킨다 (existing_ids에도 넣지 않음).
+    호출자가 게시일을 따로 조회한 뒤 filter_and_add_shorts로 날짜 필터를 적용해야 한다.
+    """
+
+    def __init__(self, existing_ids, min_views, max_days, pool=None, video_index=None, skip_known=False,
+                 defer_undated=False):
+        self.existing_ids = existing_ids
+        self.pool = pool  # 조회수만 부족한 후보 보관 (CandidatePool)
+        self.min_views = min_views
+        self.max_days = max_days
+        self.video_index = video_index
+        self.skip_known = skip_known
+        self.defer_undated = defer_undated
+        self.now = time.time()  # 페이지 하나에 같은 기준 시각 적용
+        self._known = frozenset()  # 이 페이지에서 인덱스에 있는 영상 ID
+        self._touched = {}  # 인덱스 갱신 대상: video_id -> 렌더러 (통과한 영상은 filter_and_add_shorts가 기록)
+        self._seen = set()  # commit() 때 existing_ids에 넣을 영상 ID
+        self._pooled = []  # commit() 때 후보 풀에 넣을 (video_id, views, renderer, is_reel)
+        self._observations = []  # commit() 때 인덱스에 반영할 (video_id, views)
+
+        self.detected = 0  # 발견된 쇼츠 수 (중복 포함)
+        self.duplicates = 0
+        self.rejected_date = 0
+        self.rejected_views = 0
+        self.accepted = 0
+        self.undated = 0  # 게시 시간 없이 통과시킨 릴 수 (defer_undated)
+
+    def begin_page(self, renderers):
+        """페이지의 영상 ID를 영상 인덱스에 한 번에 조회 (video_index가 없으면 아무것도 하지 않음)"""
+        if self.video_index is not None:
+            self._known = self.video_index.known_among(renderer.get("videoId") for renderer in renderers)
+
+    def end_page(self):
+        """렌더러 단계에서 걸러진 기존 영상의 발견 시각/조회수를 모아 둠 (반영은 commit())"""
+        self._observations.extend(
+            (video_id, parse_view_count(extract_text(renderer.get("viewCountText", {}))))
+            for video_id, renderer in self._touched.items()
+        )
+        self._touched = {}
+
+    def commit(self):
+        """모아 둔 거부 기록/후보/인덱스 갱신을 반영 (페이지 결과를 쓰기로 했을 때 한 번 호출)"""
+        self.existing_ids.update(self._seen)
+        if self.pool is not None:
+            for video_id, views, renderer, is_reel in self._pooled:
+                self.pool.add_renderer(video_id, views, renderer, is_reel)
+        if self._observations:
+            self.video_index.touch(self._observations, self.now)
+        self._seen, self._pooled, self._observations = set(), [], []
+
+    def is_duplicate(self, renderer):
+        """이미 처리한 영상이면 True (skip_known이면 인덱스에 있는 영상도)"""
+        video_id = renderer.get("videoId")
+        if not video_id:
+            return False
+        if video_id in self.existing_ids or video_id in self._seen:
+            self.detected += 1
+            self.duplicates += 1
+            return True
+        if video_id in self._known:
+            self._touched[video_id] = renderer
+            if self.skip_known:
+                self._seen.add(video_id)
+                self.detected += 1
+                self.duplicates += 1
+                return True
+        return False
+
+    def accept(self, renderer, is_reel=False):
+        """날짜/조회수 필터 통과 여부 (거부된 영상은 commit() 때 existing_ids에 기록)"""
+        video_id = renderer.get("videoId")
+        if not video_id:
+            return False
+        self.detected += 1
+
+        # 시간 필터 (게시 시간 문구가 없는 릴은 defer_undated면 판단을 미룸)
+        published_time = extract_text(renderer.get("publishedTimeText", {}))
+        undated = is_reel and self.defer_undated and not published_time
+        if not undated and not is_within_days(published_time, self.max_days, self.now):
+            self._seen.add(video_id)
+            self.rejected_date += 1
+            return False
+
+        # 조회수 필터 (날짜를 모르는 후보는 기준 완화용 후보 풀에 넣지 않음)
+        views = parse_view_count(extract_text(renderer.get("viewCountText", {})))
+        if views < self.min_views:
+            self._seen.add(video_id)
+            self.rejected_views += 1
+            if self.pool is not None and not undated:
+                self._pooled.append((video_id, views, renderer, is_reel))
+            return False
+
+        if undated:
+            self.undated += 1
+        self.accepted += 1
+        self._touched.pop(video_id, None)  # 통과한 영상은 filter_and_add_shorts가 인덱스에 기록
+        return True
+
+# 결과가 부족할 때 적용할 조회수 기준 완화 단계 (원래 min_views 대비 비율)
+DEFAULT_RELAXATION_SCHEDULE = (0.5,)
+
+
+class CandidatePool:
+    """
+    날짜 필터는 통과했지만 조회수가 부족했던 후보 보관소
+
+    조회수와 ShortRecord만 들고 있다가, 기준을 낮출 때 추가 요청 없이 바로 다시 걸러낸다.
+    원시 렌더러(썸네일 목록, 메뉴, 접근성 문구 등)는 보관하지 않는다.
+    """
+
+    def __init__(self):
+        self._candidates = {}  # video_id -> (views, ShortRecord)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._candidates)
+
+    def add_renderer(self, video_id, views, renderer, is_reel=False):
+        short = extract_video_info(renderer, is_reel=is_reel)
+        if not short:
+            return
+        with self._lock:
+            self._candidates[video_id] = (views, short)
+
+    def add_record(self, short):
+        video_id = short.get("video_id")
+        if not video_id:
+            return
+        with self._lock:
+            self._candidates[video_id] = (short.get("views", 0), ShortRecord.from_dict(short))
+
+    def relax(self, min_views, filtered_results, max_results):
+        """
+        조회수 min_views 이상인 후보를 조회수 높은 순으로 결과에 추가
+
+        Returns:
+            int: 복구된 항목 수
+        """
+        with self._lock:
+            eligible = sorted(
+                ((views, video_id) for video_id, (views, _) in self._candidates.items() if views >= min_views),
+                reverse=True
+            )
+            recovered = 0
+            for _, video_id in eligible:
+                if len(filtered_results) >= max_results:
+                    break
+                _, short = self._candidates.pop(video_id)
+                filtered_results.append(short)
+                recovered += 1
+            return recovered
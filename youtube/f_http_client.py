@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+YouTube HTTP 전송 모듈
+youtube 패키지의 모든 요청이 공유하는 커넥션 풀 세션 (keep-alive, 압축, 재시도, 타임아웃)
+연결 오류는 세션이 재시도하고, 429/5xx 응답은 속도 제한기가 보도록 http_get이 토큰을 다시 얻어 재시도
+"""
+
+import threading
+from urllib.parse import urlparse, urlunparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from youtube.g_response_cache import get_response_cache
+from youtube.j_rate_limiter import get_rate_limiter, OK
+
+# brotli 패키지가 있을 때만 br 압축을 요청 (urllib3가 디코딩 담당)
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+DEFAULT_TIMEOUT = 15  # 초 (연결, 읽기 공통)
+DEFAULT_POOL_SIZE = 10  # 호스트당 유지할 커넥션 수
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5  # 0.5s, 1s, 2s ...
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)  # http_get이 속도 제한기를 거쳐 재시도하는 응답
+
+
+class HttpTransport:
+    """커넥션 풀과 재시도 정책을 가진 공유 HTTP 세션"""
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, pool_size=DEFAULT_POOL_SIZE,
+                 max_retries=DEFAULT_MAX_RETRIES, backoff_factor=DEFAULT_BACKOFF_FACTOR,
+                 host_overrides=None):
+        """
+        Args:
+            timeout: 요청별 기본 타임아웃 (초)
+            pool_size: 호스트당 커넥션 풀 크기
+            max_retries: 재시도 횟수 (연결 오류는 세션, 429/5xx 응답은 http_get이 재시도)
+            backoff_factor: 재시도 간 지수 백오프 계수
+            host_overrides: {"www.youtube.com": "http://127.0.0.1:8000"} 형식의 호스트 치환 (테스트용 로컬 서버)
+        """
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.host_overrides = dict(host_overrides or {})
+
+        # 상태 코드 재시도는 하지 않음 (세션 안에서 재시도하면 속도 제한기가 429/5xx를 보지 못함)
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=0,
+            backoff_factor=backoff_factor,
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        self.session.headers["Connection"] = "keep-alive"
+
+    def resolve_url(self, url):
+        """host_overrides에 등록된 호스트는 대체 주소로 변경"""
+        if not self.host_overrides:
+            return url
+        parsed = urlparse(url)
+        override = self.host_overrides.get(parsed.netloc)
+        if not override:
+            return url
+        target = urlparse(override)
+        return urlunparse(parsed._replace(scheme=target.scheme or parsed.scheme, netloc=target.netloc))
+
+    def get(self, url, headers=None, timeout=None):
+        """GET 요청 (timeout 미지정 시 기본 타임아웃 적용)"""
+        return self.session.get(
+            self.resolve_url(url),
+            headers=headers,
+            timeout=timeout if timeout is not None else self.timeout
+        )
+
+    def close(self):
+        """풀에 남은 커넥션 정리"""
+        self.session.close()
+
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport():
+    """공유 전송 객체 반환 (최초 호출 시 생성)"""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = HttpTransport()
+        return _transport
+
+
+def set_transport(transport):
+    """
+    공유 전송 객체 교체 (테스트에서 로컬 대역 서버/가짜 전송 주입용)
+
+    transport는 get(url, headers=None, timeout=None)을 제공하고
+    status_code, text, content, json()을 가진 응답을 반환해야 한다.
+    None을 넘기면 다음 호출 때 기본 전송 객체를 새로 만든다.
+
+    Returns:
+        이전 전송 객체
+    """
+    global _transport
+    with _transport_lock:
+        previous = _transport
+        _transport = transport
+        return previous
+
+
+def http_get(url, headers=None, timeout=None, use_cache=True):
+    """
+    공유 전송 객체로 GET 요청
+
+    응답 캐시가 활성화되어 있으면 유효한 캐시 응답을 먼저 반환하고,
+    네트워크 요청은 공유 속도 제한기의 토큰을 얻은 뒤 보낸다.
+    429/5xx 응답은 속도 제한기에 반영한 뒤(감속/대기) 다시 토큰을 얻어 전송 객체의
+    max_retries번까지 재시도한다 (max_retries가 없는 가짜/재생 전송 객체는 재시도하지 않음).
+    정상(200, 동의/캡차 페이지 아님) 응답만 캐시에 저장한다.
+    """
+    cache = get_response_cache() if use_cache else None
+    if cache is not None:
+        cached = cache.get(url)
+        if cached is not None:
+            return cached
+
+    limiter = get_rate_limiter()
+    transport = get_transport()
+    retries = getattr(transport, "max_retries", 0)
+    for attempt in range(retries + 1):
+        limiter.acquire(url)
+        try:
+            response = transport.get(url, headers=headers, timeout=timeout)
+        except Exception as e:
+            limiter.record(url, error=e)
+            raise
+
+        outcome = limiter.record(url, response)
+        if response.status_code not in RETRY_STATUS_CODES:
+            break
+        if attempt < retries:
+            print(f"재시도 {attempt + 1}/{retries} ({response.status_code}): {url}")
+    if cache is not None and outcome == OK:
+        cache.put(url, response)
+    return response
@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+YouTube 응답 캐시 모듈
+정규화된 URL 기준 디스크 캐시 (엔드포인트별 TTL, 용량 제한 LRU 제거, 적중/실패 통계)
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
+
+DEFAULT_CACHE_PATH = "data/cache/responses.sqlite3"
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024  # 200MB
+DEFAULT_TTL = 60 * 60  # 1시간
+
+# (호스트 포함 문자열, 경로 접두사, TTL 초) - 위에서부터 먼저 일치하는 항목 사용
+ENDPOINT_TTLS = [
+    ("suggestqueries", "/complete/search", 24 * 60 * 60),  # 자동완성 (하루)
+    ("youtube.com", "/browse_ajax", 30 * 60),  # 연속 페이지 (30분)
+    ("youtube.com", "/results", 2 * 60 * 60),  # 검색 결과 (2시간)
+    ("youtube.com", "/hashtag/", 2 * 60 * 60),  # 해시태그 페이지 (2시간)
+]
+
+
+def normalize_url(url):
+    """캐시 키용 URL 정규화 (스킴/호스트 소문자, 쿼리 정렬, 프래그먼트 제거)"""
+    parsed = urlparse(url.strip())
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return urlunparse((
+        parsed.scheme.lower(),
+        parsed.netloc.lower(),
+        parsed.path or "/",
+        parsed.params,
+        query,
+        ""
+    ))
+
+
+def ttl_for_url(url, endpoint_ttls=None, default_ttl=DEFAULT_TTL):
+    """URL에 해당하는 엔드포인트 TTL 반환"""
+    parsed = urlparse(url)
+    for host_part, path_prefix, ttl in (endpoint_ttls or ENDPOINT_TTLS):
+        if host_part in parsed.netloc and parsed.path.startswith(path_prefix):
+            return ttl
+    return default_ttl
+
+
+class CachedResponse:
+    """캐시에서 복원한 응답 (requests.Response의 필요한 부분만 제공)"""
+
+    from_cache = True
+
+    def __init__(self, url, status_code, content, encoding="utf-8"):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class ResponseCache:
+    """SQLite 기반 디스크 응답 캐시"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES,
+                 endpoint_ttls=None, default_ttl=DEFAULT_TTL):
+        """
+        Args:
+            path: 캐시 파일 경로
+            max_bytes: 캐시 본문 총 용량 상한 (초과 시 가장 오래 사용되지 않은 항목부터 제거)
+            endpoint_ttls: (호스트 포함 문자열, 경로 접두사, TTL 초) 목록
+            default_ttl: 일치하는 엔드포인트가 없을 때의 TTL (초)
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.endpoint_ttls = endpoint_ttls or ENDPOINT_TTLS
+        self.default_ttl = default_ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                status_code INTEGER NOT NULL,
+                encoding TEXT,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)")
+        self._conn.commit()
+
+    def get(self, url):
+        """유효한 캐시 응답 반환 (없거나 만료되면 None)"""
+        key = normalize_url(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status_code, encoding, body, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[3] < now:
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return CachedResponse(url, row[0], row[2], row[1])
+
+    def put(self, url, response):
+        """200 응답만 저장 후 용량 초과분 제거"""
+        if getattr(response, "status_code", None) != 200:
+            return
+        body = response.content
+        if body is None or len(body) > self.max_bytes:
+            return
+
+        key = normalize_url(url)
+        now = time.time()
+        expires_at = now + ttl_for_url(url, self.endpoint_ttls, self.default_ttl)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, status_code, encoding, body, size, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, response.status_code, getattr(response, "encoding", None) or "utf-8",
+                 sqlite3.Binary(body), len(body), expires_at, now)
+            )
+            self.stores += 1
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """만료 항목 삭제 후 용량 상한을 넘으면 LRU 순서로 제거 (잠금 안에서 호출)"""
+        cursor = self._conn.execute("DELETE FROM responses WHERE expires_at < ?", (time.time(),))
+        self.evictions += cursor.rowcount
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def stats(self):
+        """적중/실패 통계 반환"""
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": total
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_UNSET = object()
+_cache = _UNSET
+_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """공유 응답 캐시 반환 (최초 호출 시 기본 경로에 생성, 비활성화 상태면 None)"""
+    global _cache
+    with _cache_lock:
+        if _cache is _UNSET:
+            try:
+                _cache = ResponseCache()
+            except (OSError, sqlite3.Error) as e:
+                print(f"응답 캐시를 열 수 없어 캐시 없이 진행합니다: {e}")
+                _cache = None
+        return _cache
+
+
+def set_response_cache(cache):
+    """
+    공유 응답 캐시 교체 (None을 넘기면 캐시 비활성화)
+
+    Returns:
+        이전 캐시 객체
+    """
+    global _cache
+    with _cache_lock:
+        previous = None if _cache is _UNSET else _cache
+        _cache = cache
+        return previous
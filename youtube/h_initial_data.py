@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+ytInitialData 추출 모듈
+HTML 본문에서 ytInitialData 할당문을 한 번만 찾아 JSON 객체만 잘라내 디코딩
+"""
+
+import json
+
+MARKER = b"ytInitialData"
+SCRIPT_END = b";</script>"
+WHITESPACE = b" \t\r\n"
+
+_decoder = json.JSONDecoder()
+
+
+def find_initial_data_start(body, start=0):
+    """
+    ytInitialData 할당문의 JSON 시작 위치('{') 반환 (없으면 -1)
+
+    다음 형식을 모두 한 번의 전방 탐색으로 처리한다.
+        var ytInitialData = {...};
+        window["ytInitialData"] = {...};
+        ytInitialData = {...};
+    """
+    length = len(body)
+    pos = body.find(MARKER, start)
+    while pos != -1:
+        i = pos + len(MARKER)
+
+        # window["ytInitialData"] 형식의 닫는 따옴표/괄호 건너뛰기
+        if body[i:i + 2] in (b'"]', b"']"):
+            i += 2
+
+        while i < length and body[i] in WHITESPACE:
+            i += 1
+        if i < length and body[i] == 0x3D:  # '='
+            i += 1
+            while i < length and body[i] in WHITESPACE:
+                i += 1
+            if i < length and body[i] == 0x7B:  # '{'
+                return i
+
+        # 할당문이 아닌 참조(예: ytInitialData.contents)는 건너뛰고 계속 탐색
+        pos = body.find(MARKER, pos + len(MARKER))
+    return -1
+
+
+def extract_initial_data(body, encoding="utf-8"):
+    """
+    HTML 본문(bytes 또는 str)에서 ytInitialData 객체 추출
+
+    JSON 시작 위치를 찾은 뒤 그 뒤의 첫 ';</script>'까지만 잘라 디코딩하고
+    json의 raw_decode로 객체 하나만 읽는다 (문서 전체 .text 디코딩과 재탐색 없음).
+    YouTube는 문자열 안의 '<'를 이스케이프하므로 보통 첫 ';</script>'가 객체의 끝이며,
+    그렇지 않은 경우에만 나머지 본문 전체로 다시 디코딩한다.
+
+    Returns:
+        dict 또는 None (할당문을 찾지 못한 경우)
+
+    Raises:
+        json.JSONDecodeError: 할당문은 찾았지만 JSON이 손상된 경우
+    """
+    if isinstance(body, str):
+        body = body.encode(encoding)
+
+    start = find_initial_data_start(body)
+    if start == -1:
+        return None
+
+    end = body.find(SCRIPT_END, start)
+    if end != -1:
+        try:
+            data, _ = _decoder.raw_decode(body[start:end].decode(encoding, errors="replace"))
+            return data
+        except json.JSONDecodeError:
+            pass
+
+    data, _ = _decoder.raw_decode(body[start:].decode(encoding, errors="replace"))
+    return data
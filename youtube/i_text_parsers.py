@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+YouTube 텍스트 파서 모듈
+게시 시간/조회수 텍스트를 미리 컴파일한 정규식 하나로 해석하고 결과를 메모이제이션
+"""
+
+import re
+import time
+from datetime import datetime
+from functools import lru_cache
+
+PARSE_CACHE_SIZE = 4096  # 같은 문구("3일 전", "조회수 1.2만회")가 크롤링 중 반복됨
+
+# 게시 시간 토크나이저 (날짜 > 상대 시간 > 단어 순으로 시도)
+TIME_PATTERN = re.compile(
+    r'(?P<year>\d{4})년\s*(?P<month>\d{1,2})월\s*(?P<day>\d{1,2})일'
+    r'|(?P<num>\d+)\s*(?P<unit>초|분|시간|일|주|개월|달|년|seconds?|minutes?|hours?|days?|weeks?|months?|years?)\s*(?:전|ago)'
+    r'|(?P<word>방금|오늘|어제|just\s+now|today|yesterday)',
+    re.IGNORECASE
+)
+
+TIME_UNITS = {
+    "초": "second", "second": "second", "seconds": "second",
+    "분": "minute", "minute": "minute", "minutes": "minute",
+    "시간": "hour", "hour": "hour", "hours": "hour",
+    "일": "day", "day": "day", "days": "day",
+    "주": "week", "week": "week", "weeks": "week",
+    "개월": "month", "달": "month", "month": "month", "months": "month",
+    "년": "year", "year": "year", "years": "year",
+}
+
+UNIT_SECONDS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 60 * 60,
+    "day": 24 * 60 * 60,
+    "week": 7 * 24 * 60 * 60,
+    "month": 30 * 24 * 60 * 60,
+    "year": 365 * 24 * 60 * 60,
+}
+
+# 단어 표현 → (단위, 수량)
+# "오늘"은 0~24시간 전 어디든 될 수 있으므로 중간값(12시간)으로 추정
+# (0으로 두면 시간당 조회수 순위에서 오늘 올라온 영상이 항상 맨 위로 감)
+TIME_WORDS = {
+    "방금": ("second", 0),
+    "just now": ("second", 0),
+    "오늘": ("hour", 12),
+    "today": ("hour", 12),
+    "어제": ("hour", 24),
+    "yesterday": ("hour", 24),
+}
+
+# 조회수 토크나이저 (한국어 단위 > 영어 단위 > 숫자만)
+VIEW_KO_PATTERN = re.compile(r'(\d+(?:,\d+)*(?:\.\d+)?)\s*([천만억])?회')
+VIEW_EN_PATTERN = re.compile(r'(\d+(?:,\d+)*(?:\.\d+)?)\s*([KMB])', re.IGNORECASE)
+DIGITS_PATTERN = re.compile(r'\d+')
+
+VIEW_MULTIPLIERS = {
+    "": 1,
+    "천": 1000,
+    "만": 10000,
+    "억": 100000000,
+    "K": 1000,
+    "M": 1000000,
+    "B": 1000000000,
+}
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_time_text(time_text):
+    """
+    게시 시간 텍스트를 (단위, 값)으로 해석
+
+    Returns:
+        ("second" | "minute" | "hour" | "day" | "week" | "month" | "year", 경과 수량)
+        ("date", 해당 날짜 자정의 epoch 초)
+        None (해석할 수 없는 형식)
+    """
+    if not time_text:
+        return None
+
+    match = TIME_PATTERN.search(time_text)
+    if not match:
+        return None
+
+    if match.group("year"):
+        try:
+            video_date = datetime(int(match.group("year")), int(match.group("month")), int(match.group("day")))
+        except ValueError:
+            return None
+        return "date", video_date.timestamp()
+
+    if match.group("unit"):
+        return TIME_UNITS[match.group("unit").lower()], int(match.group("num"))
+
+    word = re.sub(r'\s+', ' ', match.group("word").lower())
+    return TIME_WORDS[word]
+
+
+def published_timestamp(time_text, now=None):
+    """게시 시간 텍스트를 절대 시각(epoch 초) 추정치로 변환 (해석 불가 시 None)"""
+    parsed = parse_time_text(time_text)
+    if parsed is None:
+        return None
+
+    unit, amount = parsed
+    if unit == "date":
+        return amount
+
+    if now is None:
+        now = time.time()
+    return now - amount * UNIT_SECONDS[unit]
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_view_count(view_count_text):
+    """조회수 텍스트에서 숫자 추출"""
+    if not view_count_text:
+        return 0
+
+    # 한국어 조회수 패턴 처리 ("조회수 1.5만회", "조회수 1000회" 등)
+    match = VIEW_KO_PATTERN.search(view_count_text)
+    if not match:
+        # 영어 패턴 처리 ("1.5M views", "1K views" 등)
+        match = VIEW_EN_PATTERN.search(view_count_text)
+
+    if match:
+        # 콤마(,) 제거 후 숫자 변환
+        number = float(match.group(1).replace(',', ''))
+        unit = (match.group(2) or "").upper()
+        return int(number * VIEW_MULTIPLIERS.get(unit, 1))
+
+    # 단순 숫자 추출 (모든 숫자 연결)
+    numbers = DIGITS_PATTERN.findall(view_count_text)
+    if numbers:
+        return int("".join(numbers))
+
+    return 0
+
+
+def parser_cache_info():
+    """메모이제이션 캐시 적중 통계"""
+    return {
+        "time": parse_time_text.cache_info()._asdict(),
+        "views": parse_view_count.cache_info()._asdict()
+    }
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+YouTube 요청 속도 제한 모듈
+호스트별 적응형 토큰 버킷 (정상 응답 시 점진 가속, 429/5xx/동의·캡차 페이지 시 감속 및 대기)
+"""
+
+import time
+import random
+import threading
+from urllib.parse import urlparse
+
+DEFAULT_INITIAL_RATE = 0.5  # 초당 요청 수 (기존 1.5~3초 딜레이와 비슷한 시작점)
+DEFAULT_MIN_RATE = 0.1
+DEFAULT_MAX_RATE = 4.0
+DEFAULT_BURST = 2  # 버킷에 모아둘 수 있는 최대 토큰 수
+DEFAULT_INCREASE_STEP = 0.1  # 정상 응답마다 더하는 속도 (가산 증가)
+DEFAULT_DECREASE_FACTOR = 0.5  # 차단/오류 시 곱하는 비율 (승산 감소)
+DEFAULT_THROTTLE_PENALTY = 30.0  # 429/차단 페이지 후 대기 시간 (초, Retry-After가 없을 때)
+DEFAULT_ERROR_PENALTY = 5.0  # 5xx/연결 오류 후 대기 시간 (초)
+DEFAULT_JITTER = 0.25  # 대기 시간에 더할 무작위 비율 (기계적인 요청 간격 방지)
+
+# 동의/캡차 중간 페이지로 리다이렉트되는 호스트 및 경로
+INTERSTITIAL_HOSTS = ("consent.youtube.com", "consent.google.com")
+INTERSTITIAL_PATHS = ("/sorry/",)
+
+OK = "ok"
+THROTTLED = "throttled"
+BLOCKED = "blocked"
+ERROR = "error"
+
+
+def classify_response(response):
+    """응답을 ok / throttled(429) / blocked(동의·캡차 페이지) / error(5xx)로 분류"""
+    status_code = getattr(response, "status_code", 0)
+    if status_code == 429:
+        return THROTTLED
+    if status_code >= 500:
+        return ERROR
+
+    final_url = getattr(response, "url", "") or ""
+    parsed = urlparse(final_url)
+    if parsed.netloc in INTERSTITIAL_HOSTS or any(parsed.path.startswith(p) for p in INTERSTITIAL_PATHS):
+        return BLOCKED
+    return OK
+
+
+def retry_after_seconds(response):
+    """Retry-After 헤더(초 단위)를 읽어 반환 (없으면 None)"""
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class _HostBucket:
+    """호스트 하나의 토큰 버킷 상태"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.blocked_until = 0.0
+
+        self.requests = 0
+        self.throttled = 0
+        self.blocked = 0
+        self.errors = 0
+        self.total_wait = 0.0
+        self.last_wait = 0.0
+
+
+class AdaptiveRateLimiter:
+    """모든 fetch가 공유하는 호스트별 적응형 토큰 버킷"""
+
+    def __init__(self, initial_rate=DEFAULT_INITIAL_RATE, min_rate=DEFAULT_MIN_RATE,
+                 max_rate=DEFAULT_MAX_RATE, burst=DEFAULT_BURST,
+                 increase_step=DEFAULT_INCREASE_STEP, decrease_factor=DEFAULT_DECREASE_FACTOR,
+                 throttle_penalty=DEFAULT_THROTTLE_PENALTY, error_penalty=DEFAULT_ERROR_PENALTY,
+                 jitter=DEFAULT_JITTER):
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.throttle_penalty = throttle_penalty
+        self.error_penalty = error_penalty
+        self.jitter = jitter
+
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host):
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = _HostBucket(self.initial_rate, self.burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    def _refill(self, bucket, now):
+        elapsed = now - bucket.last_refill
+        bucket.tokens = min(float(self.burst), bucket.tokens + elapsed * bucket.rate)
+        bucket.last_refill = now
+
+    def acquire(self, url):
+        """요청 토큰을 얻을 때까지 대기하고 대기 시간(초)을 반환"""
+        host = urlparse(url).netloc
+        waited = 0.0
+        while True:
+            with self._lock:
+                bucket = self._bucket(host)
+                now = time.monotonic()
+                self._refill(bucket, now)
+
+                if now < bucket.blocked_until:
+                    delay = bucket.blocked_until - now
+                elif bucket.tokens >= 1.0:
+                    bucket.tokens -= 1.0
+                    bucket.requests += 1
+                    bucket.total_wait += waited
+                    bucket.last_wait = waited
+                    return waited
+                else:
+                    delay = (1.0 - bucket.tokens) / bucket.rate
+
+            delay *= 1.0 + random.uniform(0, self.jitter)
+            time.sleep(delay)
+            waited += delay
+
+    def record(self, url, response=None, error=None):
+        """
+        응답 결과를 반영해 속도 조절
+
+        Returns:
+            classify_response 결과 (연결 오류면 ERROR)
+        """
+        outcome = ERROR if error is not None or response is None else classify_response(response)
+        host = urlparse(url).netloc
+
+        with self._lock:
+            bucket = self._bucket(host)
+            now = time.monotonic()
+
+            if outcome == OK:
+                bucket.rate = min(self.max_rate, bucket.rate + self.increase_step)
+                return outcome
+
+            bucket.rate = max(self.min_rate, bucket.rate * self.decrease_factor)
+            bucket.tokens = 0.0
+            if outcome == THROTTLED:
+                bucket.throttled += 1
+                penalty = retry_after_seconds(response)
+                penalty = self.throttle_penalty if penalty is None else penalty
+            elif outcome == BLOCKED:
+                bucket.blocked += 1
+                penalty = self.throttle_penalty
+            else:
+                bucket.errors += 1
+                penalty = self.error_penalty
+            bucket.blocked_until = max(bucket.blocked_until, now + penalty)
+
+        print(f"⚠️ {host} 응답 이상({outcome}) - 요청 속도를 초당 {bucket.rate:.2f}회로 낮추고 {penalty:.1f}초 대기합니다.")
+        return outcome
+
+    def metrics(self):
+        """호스트별 현재 속도/대기 시간 등 지표 반환"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                host: {
+                    "rate": round(bucket.rate, 3),
+                    "tokens": round(bucket.tokens, 3),
+                    "blocked_for": round(max(0.0, bucket.blocked_until - now), 3),
+                    "requests": bucket.requests,
+                    "throttled": bucket.throttled,
+                    "blocked": bucket.blocked,
+                    "errors": bucket.errors,
+                    "total_wait": round(bucket.total_wait, 3),
+                    "last_wait": round(bucket.last_wait, 3)
+                }
+                for host, bucket in self._buckets.items()
+            }
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """공유 속도 제한기 반환 (최초 호출 시 생성)"""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = AdaptiveRateLimiter()
+        return _limiter
+
+
+def set_rate_limiter(limiter):
+    """
+    공유 속도 제한기 교체 (None을 넘기면 다음 호출 때 기본값으로 새로 생성)
+
+    Returns:
+        이전 속도 제한기
+    """
+    global _limiter
+    with _limiter_lock:
+        previous = _limiter
+        _limiter = limiter
+        return previous
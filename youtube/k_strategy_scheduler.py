@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+검색 전략 스케줄러 모듈
+전략 종류별 수확량(요청당/초당 필터 통과 수)을 실행 간에 기록하고 UCB 밴딧으로 전략 순서를 정함
+"""
+
+import os
+import json
+import math
+import random
+import threading
+
+DEFAULT_STATS_PATH = "data/strategy_stats.json"
+DEFAULT_EXPLORATION = 1.0  # UCB 탐색 가중치 (클수록 덜 시도한 전략을 앞으로)
+DEFAULT_SKIP_AFTER_REQUESTS = 10  # 이만큼 요청해도 통과가 0이면 건너뛰기 후보
+DEFAULT_SKIP_EXPLORE_RATE = 0.1  # 건너뛰기 후보도 이 확률로는 다시 시도
+
+
+class StrategyScheduler:
+    """전략 종류별 수확량을 로컬 파일에 누적하고 다음 실행의 전략 순서를 결정"""
+
+    def __init__(self, path=DEFAULT_STATS_PATH, exploration=DEFAULT_EXPLORATION,
+                 skip_after_requests=DEFAULT_SKIP_AFTER_REQUESTS,
+                 skip_explore_rate=DEFAULT_SKIP_EXPLORE_RATE, rng=None):
+        """
+        Args:
+            path: 통계 저장 파일 경로
+            exploration: UCB 탐색 가중치
+            skip_after_requests: 통과 0개로 이만큼 요청된 전략 종류는 건너뛰기 후보
+            skip_explore_rate: 건너뛰기 후보를 그래도 시도할 확률
+            rng: 난수 생성기 (테스트용)
+        """
+        self.path = path
+        self.exploration = exploration
+        self.skip_after_requests = skip_after_requests
+        self.skip_explore_rate = skip_explore_rate
+        self.rng = rng or random.Random()
+
+        self._lock = threading.Lock()
+        self.stats = self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError) as e:
+            print(f"전략 통계 로드 실패 (새로 시작합니다): {e}")
+            return {}
+
+    def save(self):
+        """통계를 파일에 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            snapshot = json.dumps(self.stats, ensure_ascii=False, indent=2)
+        temp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(snapshot)
+        os.replace(temp_path, self.path)
+
+    def record(self, strategy_type, requests, passes, seconds):
+        """전략 한 번 실행 결과 누적 (요청 수, 필터 통과 수, 소요 시간)"""
+        if not strategy_type:
+            return
+        with self._lock:
+            entry = self.stats.setdefault(strategy_type, {"runs": 0, "requests": 0, "passes": 0, "seconds": 0.0})
+            entry["runs"] += 1
+            entry["requests"] += requests
+            entry["passes"] += passes
+            entry["seconds"] = round(entry["seconds"] + seconds, 3)
+
+    def yield_of(self, strategy_type):
+        """전략 종류의 요청당/초당 통과 수 (기록이 없으면 None)"""
+        with self._lock:
+            return self._yield_of(strategy_type)
+
+    def _yield_of(self, strategy_type):
+        # 호출자가 self._lock을 잡고 있어야 함 (record()가 다른 스레드에서 값을 바꾸므로)
+        entry = self.stats.get(strategy_type)
+        if not entry or not entry["requests"]:
+            return None
+        return {
+            "per_request": entry["passes"] / entry["requests"],
+            "per_second": entry["passes"] / entry["seconds"] if entry["seconds"] else 0.0,
+            "requests": entry["requests"]
+        }
+
+    def _score(self, strategy_type, total_requests, scale):
+        """UCB1 점수 (기록 없는 종류는 무한대로 먼저 시도)"""
+        observed = self._yield_of(strategy_type)
+        if observed is None:
+            return float("inf")
+        bonus = self.exploration * math.sqrt(math.log(max(total_requests, 1)) / observed["requests"])
+        return observed["per_request"] / scale + bonus
+
+    def order(self, strategies):
+        """
+        전략 목록을 기대 수확량 순으로 재정렬하고 쓸모없는 종류는 건너뜀
+
+        같은 점수(같은 종류 포함)는 원래 순서를 유지하며,
+        type이 없는 전략은 기록이 없는 것으로 취급한다.
+        """
+        with self._lock:
+            total_requests = sum(entry["requests"] for entry in self.stats.values())
+            means = [
+                entry["passes"] / entry["requests"]
+                for entry in self.stats.values() if entry["requests"]
+            ]
+            scale = max(means) if means and max(means) > 0 else 1.0
+
+            scored = []
+            skipped = []
+            for index, strategy in enumerate(strategies):
+                strategy_type = strategy.get("type")
+                entry = self.stats.get(strategy_type) if strategy_type else None
+                if (entry and entry["passes"] == 0 and entry["requests"] >= self.skip_after_requests
+                        and self.rng.random() >= self.skip_explore_rate):
+                    skipped.append(strategy)
+                    continue
+                scored.append((-self._score(strategy_type, total_requests, scale), index, strategy))
+
+        scored.sort(key=lambda item: (item[0], item[1]))
+        if skipped:
+            print(f"수확량이 없던 전략 {len(skipped)}개 건너뜀: {', '.join(sorted({s.get('type', '') for s in skipped}))}")
+        return [strategy for _, _, strategy in scored]
+
+    def summary(self):
+        """전략 종류별 누적 수확량 요약"""
+        with self._lock:
+            return {strategy_type: self._yield_of(strategy_type) for strategy_type in self.stats}
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+쇼츠 레코드 모듈
+수집한 쇼츠 한 건을 __slots__ 객체로 보관 (채널 필드 intern, video_url은 video_id에서 계산)
+기존 dict 레코드처럼 get()/[]/dict()로 읽을 수 있어 필터·저장·분석 코드를 그대로 사용
+"""
+
+import sys
+
+VIDEO_URL_FORMAT = "https://www.youtube.com/shorts/{}"
+
+# 저장되는 필드 (to_dict 순서 = 기존 extract_video_info dict 순서)
+FIELDS = (
+    "video_id", "title", "view_count_text", "views", "published_time", "published_at",
+    "channel_name", "channel_id", "thumbnail_url", "description"
+)
+DERIVED_FIELDS = ("video_url",)
+
+DEFAULTS = {
+    "video_id": "",
+    "title": "",
+    "view_count_text": "",
+    "views": 0,
+    "published_time": "",
+    "published_at": None,
+    "channel_name": "",
+    "channel_id": "",
+    "thumbnail_url": "",
+    "description": "",
+}
+
+
+def _intern(value):
+    """같은 채널 이름/ID 문자열을 레코드 간에 공유"""
+    return sys.intern(value) if type(value) is str else value
+
+
+class ShortRecord:
+    """쇼츠 한 건 (dict 레코드와 같은 키로 읽기/쓰기 가능)"""
+
+    __slots__ = FIELDS
+
+    def __init__(self, video_id="", title="", view_count_text="", views=0, published_time="",
+                 published_at=None, channel_name="", channel_id="", thumbnail_url="", description=""):
+        self.video_id = video_id
+        self.title = title
+        self.view_count_text = view_count_text
+        self.views = views
+        self.published_time = _intern(published_time)  # "3일 전" 같은 문구도 반복됨
+        self.published_at = published_at
+        self.channel_name = _intern(channel_name)
+        self.channel_id = _intern(channel_id)
+        self.thumbnail_url = thumbnail_url
+        self.description = description
+
+    @property
+    def video_url(self):
+        return VIDEO_URL_FORMAT.format(self.video_id)
+
+    @classmethod
+    def from_dict(cls, data):
+        """dict 레코드(저장된 JSON 포함)에서 생성 (video_url 등 계산 필드와 모르는 키는 무시)"""
+        if isinstance(data, cls):
+            return data
+        return cls(**{field: data.get(field, DEFAULTS[field]) for field in FIELDS})
+
+    def to_dict(self):
+        """기존 extract_video_info와 같은 형태의 dict로 변환"""
+        data = {field: getattr(self, field) for field in FIELDS}
+        data["video_url"] = self.video_url
+        return data
+
+    # dict 레코드 호환 인터페이스
+    def keys(self):
+        return FIELDS + DERIVED_FIELDS
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(FIELDS) + len(DERIVED_FIELDS)
+
+    def __contains__(self, key):
+        return key in FIELDS or key in DERIVED_FIELDS
+
+    def __getitem__(self, key):
+        if key in FIELDS or key in DERIVED_FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in FIELDS:
+            raise KeyError(key)
+        if key in ("channel_name", "channel_id", "published_time"):
+            value = _intern(value)
+        setattr(self, key, value)
+
+    def get(self, key, default=None):
+        if key in FIELDS or key in DERIVED_FIELDS:
+            return getattr(self, key)
+        return default
+
+    def __eq__(self, other):
+        if isinstance(other, ShortRecord):
+            return all(getattr(self, field) == getattr(other, field) for field in FIELDS)
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"ShortRecord(video_id={self.video_id!r}, title={self.title!r}, views={self.views!r})"
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+HTTP 응답 녹화/재생 모듈
+youtube 패키지의 모든 요청(검색 HTML, 연속 페이지 JSON, 자동완성 JSONP)을 픽스처 디렉토리에 녹화하고,
+오프라인에서 같은 순서로 재생 (지연 시간 시뮬레이션 포함)
+
+사용 예:
+    install_fixtures("record", "fixtures/동물")   # 실제 요청을 보내면서 저장
+    install_fixtures("replay", "fixtures/동물", latency=0.2)   # 저장된 응답만으로 실행
+"""
+
+import os
+import json
+import time
+import random
+import hashlib
+import threading
+from youtube.f_http_client import HttpTransport, set_transport
+from youtube.g_response_cache import CachedResponse, normalize_url, set_response_cache
+from youtube.j_rate_limiter import AdaptiveRateLimiter, set_rate_limiter
+from youtube.o_keyword_expansion import KeywordExpander, set_keyword_expander
+
+MANIFEST_NAME = "manifest.json"
+RECORDED_HEADERS = ("Content-Type", "Retry-After")  # 재생 시 의미가 있는 헤더만 저장
+
+# 재생 시 속도 제한기 설정 (사실상 무제한, 지연은 latency로만 시뮬레이션)
+REPLAY_RATE = 1e6
+
+
+def fixture_key(url):
+    """정규화된 URL의 파일명용 해시"""
+    return hashlib.sha1(normalize_url(url).encode("utf-8")).hexdigest()[:20]
+
+
+class FixtureResponse(CachedResponse):
+    """픽스처에서 복원한 응답"""
+
+    from_cache = False
+
+    def __init__(self, url, status_code, content, encoding="utf-8", headers=None):
+        super().__init__(url, status_code, content, encoding)
+        self.headers = dict(headers or {})
+
+
+class RecordingTransport:
+    """실제 전송 객체로 요청하고 모든 응답을 픽스처 디렉토리에 저장"""
+
+    def __init__(self, fixture_dir, transport=None):
+        """
+        Args:
+            fixture_dir: 픽스처 저장 디렉토리 (기존 녹화가 있으면 이어서 추가)
+            transport: 실제 요청을 보낼 전송 객체 (기본값: 새 HttpTransport)
+        """
+        self.fixture_dir = fixture_dir
+        self.transport = transport or HttpTransport()
+        self.max_retries = getattr(self.transport, "max_retries", 0)  # http_get의 429/5xx 재시도 횟수
+        os.makedirs(fixture_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.manifest = _load_manifest(fixture_dir)
+
+    def get(self, url, headers=None, timeout=None):
+        started = time.monotonic()
+        response = self.transport.get(url, headers=headers, timeout=timeout)
+        elapsed = time.monotonic() - started
+
+        key = normalize_url(url)
+        body = response.content or b""
+        response_headers = getattr(response, "headers", None) or {}
+        with self._lock:
+            entries = self.manifest.setdefault(key, [])
+            body_name = f"{fixture_key(url)}.{len(entries)}.body"
+            with open(os.path.join(self.fixture_dir, body_name), "wb") as f:
+                f.write(body)
+            entries.append({
+                "url": url,
+                "final_url": getattr(response, "url", url) or url,
+                "status_code": response.status_code,
+                "encoding": getattr(response, "encoding", None) or "utf-8",
+                "headers": {name: response_headers[name] for name in RECORDED_HEADERS if name in response_headers},
+                "elapsed": round(elapsed, 4),
+                "body": body_name
+            })
+            _save_manifest(self.fixture_dir, self.manifest)
+        return response
+
+    def close(self):
+        close = getattr(self.transport, "close", None)
+        if close:
+            close()
+
+
+class ReplayTransport:
+    """녹화된 응답을 네트워크 없이 재생"""
+
+    def __init__(self, fixture_dir, latency=0.0, jitter=0.0, use_recorded_latency=False,
+                 strict=False, seed=0):
+        """
+        Args:
+            fixture_dir: 픽스처 디렉토리
+            latency: 응답마다 추가할 고정 지연 (초)
+            jitter: 지연에 더할 무작위 범위 (초, seed로 재현 가능)
+            use_recorded_latency: True면 녹화 당시 응답 시간을 지연으로 사용 (latency는 추가분)
+            strict: True면 녹화되지 않은 URL 요청 시 LookupError, False면 404 응답
+            seed: jitter 난수 시드
+        """
+        self.fixture_dir = fixture_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.use_recorded_latency = use_recorded_latency
+        self.strict = strict
+
+        self.manifest = _load_manifest(fixture_dir)
+        if not self.manifest:
+            raise FileNotFoundError(f"픽스처가 없습니다: {os.path.join(fixture_dir, MANIFEST_NAME)}")
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._positions = {}  # 정규화 URL → 다음에 재생할 녹화 순번
+        self.served = 0
+        self.missing = []
+
+    def get(self, url, headers=None, timeout=None):
+        key = normalize_url(url)
+        with self._lock:
+            entries = self.manifest.get(key)
+            if entries:
+                # 같은 URL을 여러 번 녹화했으면 순서대로, 다 쓰면 마지막 응답 반복
+                position = self._positions.get(key, 0)
+                entry = entries[min(position, len(entries) - 1)]
+                self._positions[key] = position + 1
+                self.served += 1
+            else:
+                entry = None
+                self.missing.append(url)
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+
+        if entry is None:
+            if self.strict:
+                raise LookupError(f"녹화되지 않은 요청입니다: {url}")
+            print(f"⚠️ 녹화되지 않은 요청 (404로 응답): {url}")
+            return FixtureResponse(url, 404, b"")
+
+        if self.use_recorded_latency:
+            delay += entry.get("elapsed", 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+        with open(os.path.join(self.fixture_dir, entry["body"]), "rb") as f:
+            body = f.read()
+        return FixtureResponse(
+            entry.get("final_url") or url, entry["status_code"], body,
+            entry.get("encoding"), entry.get("headers")
+        )
+
+    def stats(self):
+        """재생한 응답 수와 녹화되지 않은 요청 목록"""
+        with self._lock:
+            return {"served": self.served, "missing": list(self.missing)}
+
+    def close(self):
+        pass
+
+
+def _load_manifest(fixture_dir):
+    path = os.path.join(fixture_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save_manifest(fixture_dir, manifest):
+    """임시 파일에 쓴 뒤 교체 (녹화 중 중단되어도 manifest가 깨지지 않도록)"""
+    path = os.path.join(fixture_dir, MANIFEST_NAME)
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, path)
+
+
+def install_fixtures(mode, fixture_dir, **kwargs):
+    """
+    공유 전송 객체를 녹화/재생 전송으로 교체
+
+    녹화/재생 모두 응답 캐시와 연관 검색어 캐시를 끄고(모든 요청이 전송 계층을 거치도록),
+    재생 시에는 속도 제한기도 사실상 무제한으로 바꿔 지연을 latency 설정으로만 결정한다.
+
+    Args:
+        mode: "record" 또는 "replay"
+        fixture_dir: 픽스처 디렉토리
+        **kwargs: RecordingTransport / ReplayTransport 생성 인자
+
+    Returns:
+        설치한 전송 객체
+    """
+    if mode == "record":
+        transport = RecordingTransport(fixture_dir, **kwargs)
+    elif mode == "replay":
+        transport = ReplayTransport(fixture_dir, **kwargs)
+        set_rate_limiter(AdaptiveRateLimiter(initial_rate=REPLAY_RATE, max_rate=REPLAY_RATE, burst=REPLAY_RATE))
+    else:
+        raise ValueError(f"지원하지 않는 모드입니다: {mode} (record 또는 replay)")
+
+    set_response_cache(None)
+    set_keyword_expander(KeywordExpander(cache_ttl=0))
+    set_transport(transport)
+    return transport
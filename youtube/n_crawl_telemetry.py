@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+크롤링 지표 모듈
+전략 종류·연속 페이지 깊이별로 요청 지연, 응답 크기, 디코딩/순회 시간, 렌더러 수,
+쇼츠 발견 수, 필터 통과/거부 사유를 모아 JSON 요약과 Prometheus 텍스트 파일로 저장
+"""
+
+import os
+import time
+import threading
+from common.utils import directory, today, save_results
+
+# 페이지 단위로 누적하는 카운터 (Prometheus에는 youtube_crawl_<이름>_total로 출력)
+COUNTERS = (
+    "requests", "errors", "cache_hits", "bytes", "renderers", "shorts_detected",
+    "duplicates", "rejected_date", "rejected_views", "rejected_other", "passed"
+)
+# 누적 시간 (초, Prometheus에는 youtube_crawl_<이름>_total로 출력)
+TIMERS = ("latency_seconds", "decode_seconds", "parse_seconds")
+
+def _empty_entry():
+    entry = {name: 0 for name in COUNTERS}
+    entry.update({name: 0.0 for name in TIMERS})
+    entry["max_latency_seconds"] = 0.0
+    entry["error_kinds"] = {}
+    return entry
+
+
+def _round_timers(entry):
+    for name in TIMERS + ("max_latency_seconds",):
+        entry[name] = round(entry[name], 4)
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class CrawlTelemetry:
+    """한 키워드 크롤링의 전략/깊이별 지표 누적기 (스레드 안전)"""
+
+    def __init__(self, keyword):
+        self.keyword = keyword
+        self.started_at = time.time()
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+        self._entries = {}  # (전략 종류, 깊이) -> 지표
+        self._descriptions = {}  # 전략 종류 -> 처음 본 설명
+
+    def record_page(self, strategy, depth, metrics, prefilter=None, passed=0):
+        """
+        페이지 하나의 결과 반영
+
+        Args:
+            strategy: 검색 전략 dict (type, description 사용)
+            depth: 0은 첫 페이지, 1 이상은 연속 페이지 깊이
+            metrics: extract_shorts_from_page_with_token이 채운 dict
+            prefilter: 해당 페이지에 쓴 RendererPrefilter (발견/거부 수)
+            passed: filter_and_add_shorts를 최종 통과한 수
+        """
+        strategy_type = strategy.get("type") or "unknown"
+        metrics = metrics or {}
+        with self._lock:
+            self._descriptions.setdefault(strategy_type, strategy.get("description", ""))
+            entry = self._entries.setdefault((strategy_type, depth), _empty_entry())
+
+            entry["requests"] += 1
+            entry["bytes"] += metrics.get("bytes", 0)
+            entry["renderers"] += metrics.get("renderers", 0)
+            entry["cache_hits"] += 1 if metrics.get("from_cache") else 0
+            entry["latency_seconds"] += metrics.get("latency", 0.0)
+            entry["decode_seconds"] += metrics.get("decode_seconds", 0.0)
+            entry["parse_seconds"] += metrics.get("parse_seconds", 0.0)
+            entry["max_latency_seconds"] = max(entry["max_latency_seconds"], metrics.get("latency", 0.0))
+
+            error = metrics.get("error")
+            if error:
+                entry["errors"] += 1
+                entry["error_kinds"][error] = entry["error_kinds"].get(error, 0) + 1
+
+            entry["passed"] += passed
+            if prefilter is not None:
+                entry["shorts_detected"] += prefilter.detected
+                entry["duplicates"] += prefilter.duplicates
+                entry["rejected_date"] += prefilter.rejected_date
+                entry["rejected_views"] += prefilter.rejected_views
+                # 사전 필터는 통과했지만 최종 단계에서 빠진 항목 (같은 페이지 안의 중복 등)
+                entry["rejected_other"] += max(0, prefilter.accepted - passed)
+
+    def summary(self):
+        """전략별(깊이별 포함) 지표 요약 dict"""
+        with self._lock:
+            entries = {key: dict(value, error_kinds=dict(value["error_kinds"])) for key, value in self._entries.items()}
+            descriptions = dict(self._descriptions)
+
+        strategies = {}
+        totals = _empty_entry()
+        for (strategy_type, depth), entry in sorted(entries.items()):
+            strategy = strategies.setdefault(strategy_type, {
+                "description": descriptions.get(strategy_type, ""),
+                "totals": _empty_entry(),
+                "by_depth": {}
+            })
+            strategy["by_depth"][str(depth)] = entry
+            for target in (strategy["totals"], totals):
+                for name in COUNTERS + TIMERS:
+                    target[name] += entry[name]
+                target["max_latency_seconds"] = max(target["max_latency_seconds"], entry["max_latency_seconds"])
+                for kind, count in entry["error_kinds"].items():
+                    target["error_kinds"][kind] = target["error_kinds"].get(kind, 0) + count
+
+        for strategy in strategies.values():
+            strategy["totals"].update(self._derived(strategy["totals"]))
+            for entry in list(strategy["by_depth"].values()) + [strategy["totals"]]:
+                _round_timers(entry)
+        totals.update(self._derived(totals))
+        _round_timers(totals)
+
+        return {
+            "keyword": self.keyword,
+            "started_at": self.started_at,
+            "wall_seconds": round(time.monotonic() - self._started, 3),
+            "totals": totals,
+            "strategies": strategies
+        }
+
+    @staticmethod
+    def _derived(entry):
+        """요청당 평균 지연/통과 수, 발견 대비 통과율"""
+        requests = entry["requests"]
+        return {
+            "avg_latency_seconds": round(entry["latency_seconds"] / requests, 4) if requests else 0.0,
+            "passed_per_request": round(entry["passed"] / requests, 3) if requests else 0.0,
+            "pass_rate": round(entry["passed"] / entry["shorts_detected"], 3) if entry["shorts_detected"] else 0.0
+        }
+
+    def to_prometheus(self):
+        """Prometheus 텍스트 노출 형식 문자열"""
+        with self._lock:
+            entries = sorted(self._entries.items())
+
+        lines = []
+        for name in COUNTERS + TIMERS:
+            metric = f"youtube_crawl_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for (strategy_type, depth), entry in entries:
+                labels = f'keyword="{_escape_label(self.keyword)}",strategy="{_escape_label(strategy_type)}",depth="{depth}"'
+                value = entry[name]
+                lines.append(f"{metric}{{{labels}}} {round(value, 6) if isinstance(value, float) else value}")
+        lines.append("# TYPE youtube_crawl_max_latency_seconds gauge")
+        for (strategy_type, depth), entry in entries:
+            labels = f'keyword="{_escape_label(self.keyword)}",strategy="{_escape_label(strategy_type)}",depth="{depth}"'
+            lines.append(f"youtube_crawl_max_latency_seconds{{{labels}}} {round(entry['max_latency_seconds'], 6)}")
+        return "\n".join(lines) + "\n"
+
+    def save(self, prom_path=None):
+        """
+        JSON 요약(data/<날짜>/telemetry_<키워드>_<날짜>.json)과 Prometheus 텍스트 파일 저장
+
+        Returns:
+            (JSON 경로, Prometheus 파일 경로)
+        """
+        json_path = save_results(f"telemetry_{self.keyword}", self.summary())
+        prom_path = prom_path or f"{directory}/telemetry_{self.keyword}_{today}.prom"
+        temp_path = f"{prom_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(temp_path, prom_path)  # 수집기가 쓰다 만 파일을 읽지 않도록
+        return json_path, prom_path
+
+    def print_report(self):
+        """전략별 한 줄 요약 출력 (느리거나 통과가 없는 전략 확인용)"""
+        summary = self.summary()
+        print(f"\n📈 전략별 지표 ('{self.keyword}')")
+        for strategy_type, strategy in summary["strategies"].items():
+            totals = strategy["totals"]
+            print(f"  {strategy_type}: 요청 {totals['requests']}회, 평균 지연 {totals['avg_latency_seconds']:.2f}초, "
+                  f"{totals['bytes'] / 1024:.0f}KB, 렌더러 {totals['renderers']}개, 쇼츠 {totals['shorts_detected']}개, "
+                  f"통과 {totals['passed']}개 (중복 {totals['duplicates']}, 날짜 {totals['rejected_date']}, "
+                  f"조회수 {totals['rejected_views']})")
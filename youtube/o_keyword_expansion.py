@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+연관 검색어 확장 모듈
+YouTube/구글 자동완성을 동시에 조회하고 너비 우선으로 여러 단계 확장해
+정규화·중복 제거된 순위별 키워드 목록(프론티어)을 만든다 (시드별 TTL 캐시)
+"""
+
+import os
+import re
+import json
+import time
+import threading
+import unicodedata
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+from youtube.f_http_client import http_get
+
+DEFAULT_MAX_DEPTH = 2  # 시드에서 몇 단계까지 확장할지
+DEFAULT_BRANCHING = 5  # 단계마다 다음 확장에 쓸 상위 키워드 수
+DEFAULT_MAX_KEYWORDS = 30  # 프론티어 최대 크기
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_DEPTH_DECAY = 0.5  # 한 단계 깊어질 때마다 점수에 곱하는 비율
+DEFAULT_CACHE_TTL = 6 * 60 * 60  # 6시간
+DEFAULT_CACHE_PATH = "data/cache/keyword_expansion.json"
+
+SUGGEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Referer": "https://www.youtube.com/"
+}
+JSONP_PATTERN = re.compile(r'google\.sbox\.p50\((.*?)\)', re.DOTALL)
+
+
+def normalize_keyword(keyword):
+    """비교용 정규화 (NFKC, 소문자, 공백 정리)"""
+    if not keyword:
+        return ""
+    keyword = unicodedata.normalize("NFKC", keyword)
+    return re.sub(r'\s+', ' ', keyword).strip().lower()
+
+
+def fetch_youtube_suggestions(keyword, timeout=5):
+    """YouTube 자동완성(JSONP) 검색어 목록 (응답이 비정상이면 빈 목록)"""
+    url = (f"https://suggestqueries-clients6.youtube.com/complete/search?client=youtube&hl=ko&gl=kr&ds=yt"
+           f"&q={quote(keyword)}&callback=google.sbox.p50")
+    response = http_get(url, headers=SUGGEST_HEADERS, timeout=timeout)
+    if response.status_code != 200:
+        return []
+
+    # JSONP 형식에서 JSON 부분만 추출 (callback 함수 제거)
+    match = JSONP_PATTERN.search(response.text)
+    if not match:
+        return []
+    data = json.loads(match.group(1))
+
+    suggestions = []
+    if isinstance(data, list) and len(data) > 1 and isinstance(data[1], list):
+        for item in data[1]:
+            if isinstance(item, list) and item and isinstance(item[0], str):
+                suggestions.append(item[0])
+    return suggestions
+
+
+def fetch_google_suggestions(keyword, timeout=5):
+    """구글 자동완성(YouTube 데이터셋) 검색어 목록 (응답이 비정상이면 빈 목록)"""
+    url = f"http://suggestqueries.google.com/complete/search?client=firefox&ds=yt&q={quote(keyword)}"
+    response = http_get(url, headers=SUGGEST_HEADERS, timeout=timeout)
+    if response.status_code != 200:
+        return []
+    data = response.json()
+    if isinstance(data, list) and len(data) > 1 and isinstance(data[1], list):
+        return [item for item in data[1] if isinstance(item, str)]
+    return []
+
+
+SUGGESTION_SOURCES = (
+    ("youtube", fetch_youtube_suggestions),
+    ("google", fetch_google_suggestions),
+)
+
+
+class KeywordExpander:
+    """자동완성 기반 너비 우선 연관 검색어 확장기"""
+
+    def __init__(self, max_depth=DEFAULT_MAX_DEPTH, branching=DEFAULT_BRANCHING,
+                 max_keywords=DEFAULT_MAX_KEYWORDS, max_workers=DEFAULT_MAX_WORKERS,
+                 depth_decay=DEFAULT_DEPTH_DECAY, cache_ttl=DEFAULT_CACHE_TTL,
+                 cache_path=DEFAULT_CACHE_PATH, sources=SUGGESTION_SOURCES):
+        """
+        Args:
+            max_depth: 확장 단계 수 (1이면 시드의 자동완성만)
+            branching: 단계마다 다음 확장에 사용할 상위 키워드 수
+            max_keywords: 반환할 프론티어 최대 크기
+            max_workers: 동시에 보낼 자동완성 요청 수
+            depth_decay: 깊이별 점수 감쇠 비율
+            cache_ttl: 시드별 결과 캐시 유지 시간 (초, 0이면 캐시 안 함)
+            cache_path: 캐시 파일 경로 (None이면 메모리에만 보관)
+            sources: (이름, 조회 함수) 목록
+        """
+        self.max_depth = max_depth
+        self.branching = branching
+        self.max_keywords = max_keywords
+        self.max_workers = max_workers
+        self.depth_decay = depth_decay
+        self.cache_ttl = cache_ttl
+        self.cache_path = cache_path
+        self.sources = sources
+
+        self._lock = threading.Lock()
+        self._cache = self._load_cache()
+
+    def _load_cache(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError) as e:
+            print(f"연관 검색어 캐시 로드 실패 (새로 시작합니다): {e}")
+            return {}
+
+    def _save_cache(self):
+        """만료 항목을 정리하고 임시 파일에 쓴 뒤 교체"""
+        if not self.cache_path:
+            return
+        directory = os.path.dirname(self.cache_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        now = time.time()
+        with self._lock:
+            self._cache = {key: entry for key, entry in self._cache.items() if entry.get("expires_at", 0) > now}
+            snapshot = json.dumps(self._cache, ensure_ascii=False, indent=2)
+        temp_path = f"{self.cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(snapshot)
+        os.replace(temp_path, self.cache_path)
+
+    def _cache_key(self, seed, max_keywords):
+        """결과에 영향을 주는 설정이 모두 같을 때만 같은 캐시 항목을 쓰도록"""
+        sources = ",".join(name for name, _ in self.sources)
+        return f"{normalize_keyword(seed)}|{self.max_depth}|{self.branching}|{max_keywords}|{self.depth_decay}|{sources}"
+
+    @staticmethod
+    def _suggest(name, fetch, keyword):
+        """자동완성 소스 하나 조회 (실패하면 빈 목록)"""
+        try:
+            return fetch(keyword)
+        except Exception as e:
+            print(f"연관 검색어 조회 실패 ({name}, '{keyword}'): {e}")
+            return []
+
+    def expand(self, seed, use_cache=True, max_keywords=None):
+        """
+        시드 키워드를 확장한 순위별 프론티어 반환
+
+        점수는 자동완성 목록 내 순위(1/(순위+1))에 부모 점수와 깊이 감쇠를 곱해 더한 값이며,
+        여러 소스/부모에서 반복해 나온 검색어일수록 높아진다.
+        max_keywords(기본값: 생성 시 설정)만큼 찾았으면 다음 단계는 요청하지 않는다.
+
+        Returns:
+            list: [{"keyword", "score", "depth", "parent"}] (점수 내림차순, 시드 제외)
+        """
+        seed_key = normalize_keyword(seed)
+        if not seed_key:
+            return []
+
+        max_keywords = min(self.max_keywords, max_keywords) if max_keywords else self.max_keywords
+        cache_key = self._cache_key(seed, max_keywords)
+        if use_cache and self.cache_ttl:
+            with self._lock:
+                entry = self._cache.get(cache_key)
+            if entry and entry.get("expires_at", 0) > time.time():
+                return [dict(item) for item in entry["frontier"]][:max_keywords]
+
+        found = {}  # 정규화 키워드 -> {"keyword", "score", "depth", "parent"}
+        seen = {seed_key}
+        level = [(seed, 1.0)]
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            for depth in range(1, self.max_depth + 1):
+                # 쓸 만큼 찾았으면 더 깊이 요청하지 않음
+                if not level or len(found) >= max_keywords:
+                    break
+                # 같은 단계의 키워드 x 자동완성 소스를 모두 동시에 조회
+                futures = [
+                    (keyword, score, executor.submit(self._suggest, name, fetch, keyword))
+                    for keyword, score in level for name, fetch in self.sources
+                ]
+                discovered = []
+                for parent, parent_score, future in futures:
+                    for rank, suggestion in enumerate(future.result()):
+                        key = normalize_keyword(suggestion)
+                        if not key or key == seed_key:
+                            continue
+                        gain = parent_score * (self.depth_decay ** (depth - 1)) / (rank + 1)
+                        item = found.get(key)
+                        if item is None:
+                            item = {"keyword": suggestion.strip(), "score": 0.0, "depth": depth, "parent": parent}
+                            found[key] = item
+                        item["score"] += gain
+                        if key not in seen:
+                            seen.add(key)
+                            discovered.append(key)
+
+                # 이번 단계에서 새로 찾은 키워드 중 점수 상위만 다음 단계로 확장
+                discovered.sort(key=lambda k: found[k]["score"], reverse=True)
+                level = [(found[key]["keyword"], found[key]["score"]) for key in discovered[:self.branching]]
+
+        frontier = sorted(found.values(), key=lambda item: (-item["score"], item["depth"], item["keyword"]))
+        frontier = [dict(item, score=round(item["score"], 4)) for item in frontier[:max_keywords]]
+
+        if self.cache_ttl:
+            with self._lock:
+                self._cache[cache_key] = {"expires_at": time.time() + self.cache_ttl, "frontier": frontier}
+            try:
+                self._save_cache()
+            except OSError as e:
+                print(f"연관 검색어 캐시 저장 실패: {e}")
+        return frontier
+
+    def frontier(self, seed, limit=None):
+        """확장된 키워드 문자열만 순위대로 반환 (limit이 있으면 그만큼만 확장)"""
+        return [item["keyword"] for item in self.expand(seed, max_keywords=limit)]
+
+
+_expander = None
+_expander_lock = threading.Lock()
+
+
+def get_keyword_expander():
+    """공유 연관 검색어 확장기 반환 (최초 호출 시 생성)"""
+    global _expander
+    with _expander_lock:
+        if _expander is None:
+            _expander = KeywordExpander()
+        return _expander
+
+
+def set_keyword_expander(expander):
+    """
+    공유 연관 검색어 확장기 교체 (None을 넘기면 다음 호출 때 기본값으로 새로 생성)
+
+    Returns:
+        이전 확장기
+    """
+    global _expander
+    with _expander_lock:
+        previous = _expander
+        _expander = expander
+        return previous
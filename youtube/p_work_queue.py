@@ -0,0 +1,481 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+분산 크롤링 작업 큐 모듈
+(전략 URL, 연속 토큰, 깊이) 작업을 SQLite 파일에 보관하고, 여러 프로세스/호스트의 작업자가
+임대(lease)와 하트비트로 나눠 가져가며, 조정자가 결과를 같은 중복 제거/필터 규칙으로 병합
+
+여러 호스트에서 쓸 때는 큐 파일을 파일 잠금이 동작하는 공유 볼륨에 둔다
+(WAL 모드는 네트워크 파일시스템에서 안전하지 않으므로 기본 저널 모드를 사용).
+
+사용법:
+    python -m youtube.p_work_queue coordinate 동물 --queue data/queue/crawl.sqlite3 --local-workers 2
+    python -m youtube.p_work_queue worker --queue data/queue/crawl.sqlite3
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+import sqlite3
+import argparse
+import threading
+from youtube.c_strategies import create_strategies, create_url
+from youtube.d_page_parser import extract_shorts_from_page_with_token
+from youtube.e_data_filters import filter_and_add_shorts, RendererPrefilter
+from youtube.k_strategy_scheduler import StrategyScheduler
+from youtube.l_short_record import ShortRecord
+from youtube.s_view_ranking import TopKRanking, RANK_BY_VELOCITY
+
+DEFAULT_QUEUE_PATH = "data/queue/crawl.sqlite3"
+DEFAULT_LEASE_SECONDS = 60.0  # 하트비트 없이 이 시간이 지나면 다른 작업자가 다시 가져감
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_POLL_INTERVAL = 0.5
+DEFAULT_IDLE_EXIT = 30.0  # 작업자가 이 시간 동안 할 일이 없으면 종료
+DEFAULT_MAX_SEARCH_DEPTH = 5
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+JOB_RUNNING = "running"
+JOB_FINISHED = "finished"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    keyword TEXT NOT NULL,
+    min_views INTEGER NOT NULL,
+    max_days INTEGER NOT NULL,
+    max_search_depth INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    strategy_type TEXT,
+    description TEXT,
+    url TEXT NOT NULL,
+    token TEXT NOT NULL DEFAULT '',
+    depth INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    UNIQUE (job_id, url, token)
+);
+CREATE TABLE IF NOT EXISTS results (
+    result_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    task_id INTEGER NOT NULL,
+    worker_id TEXT NOT NULL,
+    detected INTEGER NOT NULL,
+    shorts TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_lease ON tasks (status, lease_expires);
+CREATE INDEX IF NOT EXISTS idx_results_job ON results (job_id, result_id);
+"""
+
+
+def default_worker_id():
+    """호스트명-PID-스레드 형식의 작업자 ID"""
+    return f"{socket.gethostname()}-{os.getpid()}-{threading.get_ident()}"
+
+
+class WorkQueue:
+    """SQLite 파일 기반 내구성 작업 큐 (프로세스마다 하나씩 열어 사용)"""
+
+    def __init__(self, path=DEFAULT_QUEUE_PATH, lease_seconds=DEFAULT_LEASE_SECONDS,
+                 max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # isolation_level=None: 트랜잭션을 BEGIN IMMEDIATE로 직접 관리 (임대 경쟁 직렬화)
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.executescript(SCHEMA)
+
+    def _transaction(self, func):
+        """쓰기 잠금을 먼저 잡는 트랜잭션 안에서 func(conn) 실행"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = func(self._conn)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return result
+
+    def create_job(self, keyword, min_views, max_days, max_search_depth=DEFAULT_MAX_SEARCH_DEPTH):
+        """새 작업 묶음(job) 생성 후 ID 반환"""
+        job_id = uuid.uuid4().hex[:12]
+        self._transaction(lambda conn: conn.execute(
+            "INSERT INTO jobs (job_id, keyword, min_views, max_days, max_search_depth, status, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (job_id, keyword, min_views, max_days, max_search_depth, JOB_RUNNING, time.time())
+        ))
+        return job_id
+
+    def job(self, job_id):
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def finish_job(self, job_id):
+        """작업 묶음 종료 (남은 대기 작업은 더 이상 임대되지 않음)"""
+        self._transaction(lambda conn: conn.execute(
+            "UPDATE jobs SET status = ? WHERE job_id = ?", (JOB_FINISHED, job_id)
+        ))
+
+    def enqueue(self, job_id, strategy, url, token=None, depth=0):
+        """작업 추가 (같은 job의 같은 URL+토큰은 한 번만 들어감) - 추가됐으면 True"""
+        def insert(conn):
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO tasks (job_id, strategy_type, description, url, token, depth, status, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, strategy.get("type"), strategy.get("description"), url, token or "", depth, PENDING, time.time())
+            )
+            return cursor.rowcount > 0
+        return self._transaction(insert)
+
+    def lease(self, worker_id):
+        """
+        실행 중인 job의 대기 작업(또는 임대가 만료된 작업) 하나를 임대
+
+        얕은 깊이(첫 페이지)부터 가져가 여러 전략이 고르게 진행되도록 한다.
+        최대 시도 횟수만큼 임대됐는데 또 만료된 작업(작업자가 죽거나 멈추게 하는 페이지)은
+        다시 임대하지 않고 실패로 기록한다.
+
+        Returns:
+            dict: 작업 + job 설정, 없으면 None
+        """
+        def take(conn):
+            now = time.time()
+            conn.execute(
+                "UPDATE tasks SET status = ?, lease_owner = NULL, lease_expires = NULL, error = ?, updated_at = ? "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                (FAILED, "임대 만료 (최대 시도 횟수 초과)", now, LEASED, now, self.max_attempts)
+            )
+            row = conn.execute(
+                "SELECT t.*, j.keyword, j.min_views, j.max_days, j.max_search_depth "
+                "FROM tasks t JOIN jobs j ON j.job_id = t.job_id "
+                "WHERE j.status = ? AND (t.status = ? OR (t.status = ? AND t.lease_expires < ?)) "
+                "ORDER BY t.depth, t.task_id LIMIT 1",
+                (JOB_RUNNING, PENDING, LEASED, now)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE tasks SET status = ?, lease_owner = ?, lease_expires = ?, attempts = attempts + 1, updated_at = ? "
+                "WHERE task_id = ?",
+                (LEASED, worker_id, now + self.lease_seconds, now, row["task_id"])
+            )
+            return dict(row)
+        return self._transaction(take)
+
+    def heartbeat(self, task_id, worker_id):
+        """임대 연장 (아직 이 작업자가 임대 중이면 True)"""
+        def extend(conn):
+            now = time.time()
+            cursor = conn.execute(
+                "UPDATE tasks SET lease_expires = ?, updated_at = ? WHERE task_id = ? AND status = ? AND lease_owner = ?",
+                (now + self.lease_seconds, now, task_id, LEASED, worker_id)
+            )
+            return cursor.rowcount > 0
+        return self._transaction(extend)
+
+    def complete(self, task, worker_id, shorts, detected, next_token):
+        """
+        작업 완료: 결과 저장 + 다음 연속 페이지 작업 추가를 한 트랜잭션으로 처리
+
+        임대가 만료되어 다른 작업자에게 넘어간 작업이면 결과를 버리고 False를 반환한다
+        (같은 페이지 결과가 두 번 병합되지 않도록).
+        """
+        payload = json.dumps([ShortRecord.from_dict(short).to_dict() for short in shorts], ensure_ascii=False)
+
+        def finish(conn):
+            now = time.time()
+            cursor = conn.execute(
+                "UPDATE tasks SET status = ?, lease_owner = NULL, lease_expires = NULL, error = NULL, updated_at = ? "
+                "WHERE task_id = ? AND status = ? AND lease_owner = ?",
+                (DONE, now, task["task_id"], LEASED, worker_id)
+            )
+            if cursor.rowcount == 0:
+                return False
+            conn.execute(
+                "INSERT INTO results (job_id, task_id, worker_id, detected, shorts, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (task["job_id"], task["task_id"], worker_id, detected, payload, now)
+            )
+            if next_token and detected and task["depth"] < task["max_search_depth"]:
+                conn.execute(
+                    "INSERT OR IGNORE INTO tasks (job_id, strategy_type, description, url, token, depth, status, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (task["job_id"], task["strategy_type"], task["description"], task["url"], next_token,
+                     task["depth"] + 1, PENDING, now)
+                )
+            return True
+        return self._transaction(finish)
+
+    def fail(self, task, worker_id, error):
+        """작업 실패 기록 (최대 시도 횟수 전까지는 다시 대기 상태로)"""
+        def record(conn):
+            conn.execute(
+                "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                "lease_owner = NULL, lease_expires = NULL, error = ?, updated_at = ? "
+                "WHERE task_id = ? AND status = ? AND lease_owner = ?",
+                (self.max_attempts, FAILED, PENDING, str(error)[:500], time.time(), task["task_id"], LEASED, worker_id)
+            )
+        self._transaction(record)
+
+    def results_after(self, job_id, after_id=0):
+        """result_id가 after_id보다 큰 결과 목록 (작업 순서 유지)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT result_id, task_id, worker_id, detected, shorts FROM results "
+                "WHERE job_id = ? AND result_id > ? ORDER BY result_id",
+                (job_id, after_id)
+            ).fetchall()
+        return [dict(row, shorts=json.loads(row["shorts"])) for row in rows]
+
+    def counts(self, job_id):
+        """상태별 작업 수"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM tasks WHERE job_id = ? GROUP BY status", (job_id,)
+            ).fetchall()
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def process_task(task):
+    """
+    작업 하나 실행 (페이지 요청 + 파싱 + 날짜/조회수 사전 필터)
+
+    중복 제거는 조정자가 전체 결과를 보고 하므로, 여기서는 페이지 안의 중복만 거른다.
+
+    Returns:
+        (쇼츠 목록, 발견 수, 다음 연속 토큰)
+    """
+    url = create_url(task["url"], task["token"]) if task["token"] else task["url"]
+    prefilter = RendererPrefilter(set(), task["min_views"], task["max_days"])
+    shorts, next_token = extract_shorts_from_page_with_token(url, prefilter)
+    return shorts, prefilter.detected, next_token
+
+
+def run_worker(queue_path=DEFAULT_QUEUE_PATH, worker_id=None, idle_exit=DEFAULT_IDLE_EXIT,
+               poll_interval=DEFAULT_POLL_INTERVAL, stop_event=None, lease_seconds=DEFAULT_LEASE_SECONDS):
+    """
+    작업자 루프: 임대 → 실행(하트비트 유지) → 완료/실패 기록
+
+    idle_exit초 동안 가져올 작업이 없거나 stop_event가 설정되면 종료한다.
+
+    Returns:
+        처리한 작업 수
+    """
+    worker_id = worker_id or default_worker_id()
+    stop_event = stop_event or threading.Event()
+    work_queue = WorkQueue(queue_path, lease_seconds=lease_seconds)
+    processed = 0
+    idle_since = time.monotonic()
+
+    try:
+        while not stop_event.is_set():
+            try:
+                task = work_queue.lease(worker_id)
+            except sqlite3.OperationalError as e:
+                # 공유 볼륨에서 잠금 대기 시간 초과 등 - 잠시 후 다시 시도
+                print(f"[{worker_id}] 작업 임대 실패 (다시 시도): {e}")
+                stop_event.wait(poll_interval)
+                continue
+            if task is None:
+                if time.monotonic() - idle_since >= idle_exit:
+                    break
+                stop_event.wait(poll_interval)
+                continue
+
+            # 요청/파싱 중에는 임대 시간의 1/3마다 하트비트
+            done = threading.Event()
+
+            def beat(task_id=task["task_id"]):
+                while not done.wait(work_queue.lease_seconds / 3):
+                    try:
+                        if not work_queue.heartbeat(task_id, worker_id):
+                            print(f"[{worker_id}] 작업 {task_id}의 임대를 잃었습니다 (다른 작업자가 다시 처리).")
+                            break
+                    except sqlite3.OperationalError as e:
+                        print(f"[{worker_id}] 작업 {task_id} 하트비트 실패 (다음 주기에 다시 시도): {e}")
+
+            heartbeat = threading.Thread(target=beat, daemon=True)
+            heartbeat.start()
+            try:
+                shorts, detected, next_token = process_task(task)
+            except Exception as e:
+                done.set()
+                heartbeat.join()
+                print(f"[{worker_id}] 작업 {task['task_id']} 실패: {e}")
+                try:
+                    work_queue.fail(task, worker_id, e)
+                except sqlite3.OperationalError as db_error:
+                    print(f"[{worker_id}] 작업 {task['task_id']} 실패 기록 실패 (임대 만료 후 다시 처리됨): {db_error}")
+                continue
+            done.set()
+            heartbeat.join()
+
+            try:
+                completed = work_queue.complete(task, worker_id, shorts, detected, next_token)
+            except sqlite3.OperationalError as e:
+                completed = None
+                print(f"[{worker_id}] 작업 {task['task_id']} 결과 기록 실패 (임대 만료 후 다시 처리됨): {e}")
+            if completed:
+                processed += 1
+                print(f"[{worker_id}] 작업 {task['task_id']} 완료: {task['description']} "
+                      f"(깊이 {task['depth']}, {detected}개 발견, {len(shorts)}개 후보)")
+            elif completed is not None:
+                print(f"[{worker_id}] 작업 {task['task_id']}의 임대를 잃어 결과를 버립니다 (다른 작업자가 처리).")
+            idle_since = time.monotonic()
+    finally:
+        work_queue.close()
+    return processed
+
+
+def coordinate(keyword, min_views=100000, max_days=3, max_results=50, queue_path=DEFAULT_QUEUE_PATH,
+               max_search_depth=DEFAULT_MAX_SEARCH_DEPTH, local_workers=0, existing_ids=None,
+               video_index=None, output=None, use_scheduler=True, poll_interval=DEFAULT_POLL_INTERVAL,
+               timeout=None, near_duplicates=None, rank_by=RANK_BY_VELOCITY):
+    """
+    키워드 검색 전략을 큐에 넣고 작업자 결과를 병합
+
+    병합은 get_shorts_by_keyword와 같은 filter_and_add_shorts(전역 중복 제거 + 날짜/조회수 필터)를
+    작업 완료 순서대로 적용한다. max_results에 도달하거나 남은 작업이 없으면 job을 종료한다.
+
+    Args:
+        keyword: 검색 키워드
+        min_views / max_days / max_results: get_shorts_by_keyword와 동일
+        queue_path: 작업 큐 파일 (여러 호스트가 공유하는 볼륨 경로 가능)
+        max_search_depth: 전략별 연속 페이지 최대 깊이
+        local_workers: 이 프로세스 안에서 함께 돌릴 작업자 스레드 수 (0이면 외부 작업자만 사용)
+        existing_ids / video_index / output / near_duplicates / rank_by: get_shorts_by_keyword와 동일
+        use_scheduler: 전략 스케줄러로 초기 작업 순서를 정할지 여부
+        timeout: 최대 대기 시간 (초, None이면 작업이 모두 끝날 때까지)
+
+    Returns:
+        list: 순위 기준(기본값: 시간당 조회수) 내림차순 필터 통과 쇼츠 (최대 max_results개)
+    """
+    filtered_shorts = TopKRanking(max_results, rank_by)
+    if existing_ids is None:
+        existing_ids = set()
+
+    work_queue = WorkQueue(queue_path)
+    job_id = work_queue.create_job(keyword, min_views, max_days, max_search_depth)
+
+    strategies = create_strategies(keyword)
+    if use_scheduler:
+        strategies = StrategyScheduler().order(strategies)
+    for strategy in strategies:
+        work_queue.enqueue(job_id, strategy, strategy["url"])
+    print(f"작업 큐 '{queue_path}'에 job {job_id} 등록: 전략 {len(strategies)}개")
+
+    stop_event = threading.Event()
+    workers = [
+        threading.Thread(target=run_worker, kwargs={
+            "queue_path": queue_path, "worker_id": f"{default_worker_id()}-local{i}",
+            "idle_exit": float("inf"), "stop_event": stop_event
+        }, daemon=True)
+        for i in range(local_workers)
+    ]
+    for worker in workers:
+        worker.start()
+
+    started = time.monotonic()
+    last_result_id = 0
+    try:
+        while True:
+            results = work_queue.results_after(job_id, last_result_id)
+            for result in results:
+                last_result_id = result["result_id"]
+                shorts = [ShortRecord.from_dict(short) for short in result["shorts"]]
+                filtered_count = filter_and_add_shorts(shorts, filtered_shorts, existing_ids, min_views, max_days,
+                                                       video_index=video_index, keyword=keyword, output=output,
+                                                       near_duplicates=near_duplicates)
+                print(f"병합: 작업 {result['task_id']} ({result['worker_id']}) {result['detected']}개 발견, "
+                      f"필터 통과 {filtered_count}개 (누적 {len(filtered_shorts)}개/{max_results}개)")
+                if len(filtered_shorts) >= max_results:
+                    break
+
+            if len(filtered_shorts) >= max_results:
+                print(f"\n✅ 목표 달성! {max_results}개의 필터링된 쇼츠를 찾았습니다.")
+                break
+            counts = work_queue.counts(job_id)
+            if not results and counts[PENDING] == 0 and counts[LEASED] == 0:
+                # 마지막 완료와 결과 조회 사이 경쟁을 피하려고 한 번 더 확인
+                if not work_queue.results_after(job_id, last_result_id):
+                    print(f"\n남은 작업이 없습니다 (완료 {counts[DONE]}개, 실패 {counts[FAILED]}개).")
+                    break
+            if timeout is not None and time.monotonic() - started >= timeout:
+                print(f"\n⚠️ 제한 시간 {timeout}초가 지나 병합을 멈춥니다.")
+                break
+            time.sleep(poll_interval)
+    finally:
+        work_queue.finish_job(job_id)
+        stop_event.set()
+        for worker in workers:
+            worker.join()
+        work_queue.close()
+
+    return filtered_shorts.ranked()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분산 크롤링 작업 큐")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    worker_parser = subparsers.add_parser("worker", help="작업자 실행")
+    worker_parser.add_argument("--queue", default=DEFAULT_QUEUE_PATH, help="작업 큐 파일 경로")
+    worker_parser.add_argument("--worker-id", help="작업자 ID (기본값: 호스트명-PID-스레드)")
+    worker_parser.add_argument("--idle-exit", type=float, default=DEFAULT_IDLE_EXIT,
+                               help="할 일이 없을 때 종료까지 대기 시간 (초)")
+
+    coordinate_parser = subparsers.add_parser("coordinate", help="작업 등록 및 결과 병합")
+    coordinate_parser.add_argument("keyword", help="검색 키워드")
+    coordinate_parser.add_argument("--queue", default=DEFAULT_QUEUE_PATH, help="작업 큐 파일 경로")
+    coordinate_parser.add_argument("--min-views", type=int, default=100000)
+    coordinate_parser.add_argument("--max-days", type=int, default=3)
+    coordinate_parser.add_argument("--max-results", type=int, default=50)
+    coordinate_parser.add_argument("--local-workers", type=int, default=0, help="함께 실행할 로컬 작업자 수")
+    coordinate_parser.add_argument("--timeout", type=float, help="최대 대기 시간 (초)")
+
+    args = parser.parse_args()
+    if args.command == "worker":
+        processed = run_worker(args.queue, args.worker_id, idle_exit=args.idle_exit)
+        print(f"작업자 종료: {processed}개 작업 처리")
+        return
+
+    shorts = coordinate(
+        args.keyword, args.min_views, args.max_days, args.max_results, queue_path=args.queue,
+        local_workers=args.local_workers, timeout=args.timeout
+    )
+    print(f"병합 결과: {len(shorts)}개")
+
+
+if __name__ == "__main__":
+    main()
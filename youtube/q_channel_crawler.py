@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+채널 후속 탐색 모듈
+검색 중 필터를 통과한 쇼츠가 많았던 채널(discovered_channels)의 쇼츠 탭을
+우선순위 큐 순서로 동시에 크롤링해 결과를 보충한다
+"""
+
+import time
+import heapq
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from youtube.c_strategies import create_url
+from youtube.d_page_parser import extract_shorts_from_page_with_token, fetch_publish_time
+from youtube.i_text_parsers import published_timestamp
+from youtube.e_data_filters import filter_and_add_shorts, RendererPrefilter
+from youtube.r_crawl_deadline import STOP_DEADLINE, STOP_BUDGET, request_timeout
+
+DEFAULT_MAX_CHANNELS = 10  # 후속 탐색할 최대 채널 수
+DEFAULT_CHANNEL_DEPTH = 2  # 채널마다 따라갈 연속 페이지 수
+DEFAULT_MAX_WORKERS = 4
+
+CHANNEL_SHORTS_URL = "https://www.youtube.com/channel/{channel_id}/shorts"
+CHANNEL_STRATEGY_TYPE = "channel_shorts"
+
+
+def channel_shorts_url(channel_id):
+    """채널 쇼츠 탭 URL (richGridRenderer → richItemRenderer → reelItemRenderer 구조)"""
+    return CHANNEL_SHORTS_URL.format(channel_id=channel_id)
+
+
+class ChannelFrontier:
+    """
+    채널 페이지 우선순위 큐
+
+    필터를 통과한 영상 수(video_count)가 많은 채널이 먼저, 같으면 직전 페이지의
+    필터 통과율(yield)이 높은 쪽이 먼저 나온다. 아직 요청하지 않은 채널의 통과율은
+    1.0으로 두고, 페이지를 받을 때마다 실제 통과율로 갱신해 연속 페이지를 다시 넣는다.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._sequence = 0  # 같은 우선순위는 넣은 순서대로
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, channel_id, info, url, depth=0, filter_yield=1.0):
+        entry = {"channel_id": channel_id, "name": info.get("name", ""), "video_count": info.get("video_count", 0),
+                 "yield": filter_yield, "url": url, "depth": depth}
+        heapq.heappush(self._heap, (-entry["video_count"], -filter_yield, self._sequence, entry))
+        self._sequence += 1
+
+    def pop(self):
+        return heapq.heappop(self._heap)[-1]
+
+
+def crawl_channels(discovered_channels, filtered_shorts, existing_ids, min_views, max_days, max_results,
+                   max_channels=DEFAULT_MAX_CHANNELS, max_channel_depth=DEFAULT_CHANNEL_DEPTH,
+                   max_workers=DEFAULT_MAX_WORKERS, fetch=extract_shorts_from_page_with_token,
+                   processed_urls=None, candidate_pool=None, video_index=None, skip_known=False, keyword=None,
+                   output=None, telemetry=None, near_duplicates=None, deadline=None,
+                   lookup_publish_time=fetch_publish_time):
+    """
+    발견된 채널의 쇼츠 탭을 우선순위대로 동시에 크롤링
+
+    큐에서 꺼낸 페이지를 최대 max_workers개까지 동시에 요청하고(요청 간격은 공유
+    속도 제한기가 조절), 결과는 이 함수를 호출한 스레드에서 검색 단계와 같은
+    filter_and_add_shorts로 반영한다. 필터를 통과한 영상이 있었던 채널만 연속
+    페이지를 큐에 다시 넣으며, max_results에 도달하면 대기 중인 요청은 취소하고
+    실행 중인 요청 결과는 버린다. deadline(CrawlDeadline)을 넘기면 남은 시간으로
+    받을 수 있는 만큼만 요청하고, 마감이 지나면 실행 중인 요청을 기다리지 않는다
+    (요청 타임아웃은 남은 시간 이하로 줄이고, 버린 페이지의 사전 필터 결과는 반영하지 않음).
+
+    쇼츠 탭의 릴에는 게시 시간 문구가 없으므로 조회수 필터를 통과한 릴만
+    lookup_publish_time(영상 페이지의 게시일)으로 게시 시간을 채운 뒤 날짜 필터를 적용한다.
+    게시일을 알아내지 못한 릴은 버리되 이미 본 영상으로 기록하지 않는다.
+
+    Args:
+        discovered_channels: {채널 ID: {"name", "video_count"}} (검색 단계에서 수집)
+        max_channels: 쇼츠 탭을 요청할 최대 채널 수 (video_count 상위)
+        max_channel_depth: 채널마다 따라갈 연속 페이지 수
+        fetch: 페이지 요청 함수 (동시 모드에서는 HostConcurrencyLimiter.fetch)
+        processed_urls: 이미 요청한 URL 집합 (채널 URL도 추가됨)
+        skip_known: True면 video_index에 이미 있는 영상은 건너뜀 (페이지마다 인덱스 조회)
+
+    Returns:
+        int: 채널 탐색으로 추가된 쇼츠 수
+    """
+    if processed_urls is None:
+        processed_urls = set()
+    frontier = ChannelFrontier()
+    ranked = sorted(discovered_channels.items(), key=lambda item: -item[1].get("video_count", 0))
+    for channel_id, info in ranked[:max_channels]:
+        url = channel_shorts_url(channel_id)
+        if url not in processed_urls:
+            frontier.push(channel_id, info, url)
+    if not len(frontier):
+        return 0
+
+    print(f"\n채널 후속 탐색: 상위 채널 {len(frontier)}개의 쇼츠 탭 확인 (작업자 {max_workers}개)")
+    stop_event = threading.Event()
+    original_size = len(filtered_shorts)
+
+    def load(entry):
+        """채널 페이지 하나 요청 (중단 후에는 요청하지 않음)"""
+        if stop_event.is_set():
+            return entry, [], None, None, {}
+        prefilter = RendererPrefilter(existing_ids, min_views, max_days, candidate_pool, video_index, skip_known,
+                                      defer_undated=True)
+        metrics = {}
+        started = time.monotonic()
+        shorts, next_token = fetch(entry["url"], prefilter, metrics, deadline=deadline)
+        if deadline is not None:
+            deadline.observe(time.monotonic() - started)
+
+        # 게시 시간이 없는 릴은 영상 페이지에서 게시일 조회 (조회수 필터를 통과한 것만)
+        for short in shorts:
+            if short.get("published_time"):
+                continue
+            if stop_event.is_set() or (deadline is not None and not deadline.allows()):
+                break
+            published_time = lookup_publish_time(short.get("video_id"), request_timeout(10, deadline))
+            if published_time:
+                short["published_time"] = published_time
+                short["published_at"] = published_timestamp(published_time)
+        return entry, shorts, next_token, prefilter, metrics
+
+    def absorb(entry, shorts, next_token, prefilter, metrics):
+        """필터 결과 반영 후 통과율로 연속 페이지 우선순위를 정해 다시 넣기"""
+        # 쇼츠 탭의 릴 렌더러에는 채널 정보가 없으므로 요청한 채널로 채움
+        for short in shorts:
+            if not short.get("channel_id"):
+                short["channel_id"] = entry["channel_id"]
+                short["channel_name"] = entry["name"]
+
+        prefilter.commit()
+
+        # 게시일을 끝내 모르는 릴은 날짜 필터에서 거부되어 본 영상으로 기록되지 않도록 제외
+        dated = [short for short in shorts if short.get("published_time")]
+        undated = len(shorts) - len(dated)
+        filtered_count = filter_and_add_shorts(dated, filtered_shorts, existing_ids, min_views, max_days, candidate_pool,
+                                               video_index=video_index, keyword=keyword, output=output,
+                                               near_duplicates=near_duplicates)
+        if telemetry is not None:
+            strategy = {"type": CHANNEL_STRATEGY_TYPE, "description": "채널 쇼츠 탭 후속 탐색"}
+            telemetry.record_page(strategy, entry["depth"], metrics, prefilter, filtered_count)
+
+        label = f"[채널 {entry['name'] or entry['channel_id']}]" + (f" ↳ 연속 페이지 {entry['depth']}" if entry["depth"] else "")
+        print(f"{label} {prefilter.detected}개 발견, 필터 통과: {filtered_count}개 (누적 {len(filtered_shorts)}개/{max_results}개)"
+              + (f", 게시일 확인 실패 {undated}개" if undated else ""))
+
+        channel = discovered_channels.get(entry["channel_id"])
+        if channel is not None:
+            channel["video_count"] += filtered_count
+        if filtered_count and next_token and entry["depth"] < max_channel_depth:
+            info = {"name": entry["name"], "video_count": entry["video_count"] + filtered_count}
+            frontier.push(entry["channel_id"], info, create_url(entry["url"], next_token), entry["depth"] + 1,
+                          filtered_count / max(1, prefilter.detected))
+
+    executor = ThreadPoolExecutor(max_workers=max(1, int(max_workers)))
+    pending = set()
+    try:
+        while (len(frontier) or pending) and not stop_event.is_set():
+            # 작업자 수만큼만 꺼내 두어야 완료된 페이지의 연속 페이지가 우선순위 경쟁에 참여한다
+            while len(frontier) and len(pending) < max_workers:
+                if deadline is not None and not deadline.allows():
+                    deadline.mark_partial(STOP_BUDGET)
+                    break
+                entry = frontier.pop()
+                processed_urls.add(entry["url"])
+                pending.add(executor.submit(load, entry))
+
+            if not pending:
+                break
+            done, pending = wait(pending, timeout=deadline.remaining() if deadline is not None else None,
+                                 return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception():
+                    print(f"채널 페이지 요청 중 오류: {future.exception()}")
+                    continue
+                entry, shorts, next_token, prefilter, metrics = future.result()
+                if prefilter is None or stop_event.is_set():
+                    continue
+                absorb(entry, shorts, next_token, prefilter, metrics)
+                if len(filtered_shorts) >= max_results:
+                    stop_event.set()
+            if pending and deadline is not None and deadline.expired() and not stop_event.is_set():
+                deadline.mark_partial(STOP_DEADLINE)
+                deadline.abandon(len(pending))
+                stop_event.set()
+    finally:
+        stop_event.set()
+        executor.shutdown(wait=deadline is None or not deadline.expired(), cancel_futures=True)
+
+    added = len(filtered_shorts) - original_size
+    print(f"채널 후속 탐색으로 {added}개 추가 (총 {len(filtered_shorts)}개)")
+    return added
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+크롤링 시간 예산 모듈
+마감 시각까지 남은 시간으로 다음 요청을 보낼지 정하고, 마감이 되면 진행 중인
+요청을 기다리지 않고 그때까지의 결과를 부분 결과로 돌려주기 위한 도구
+"""
+
+import time
+import threading
+
+DEFAULT_PAGE_ESTIMATE = 1.0  # 아직 측정한 요청이 없을 때 가정할 페이지당 소요 시간 (초)
+PAGE_ESTIMATE_WEIGHT = 0.3  # 페이지 소요 시간 지수 이동 평균 가중치
+MIN_REQUEST_TIMEOUT = 0.05  # 마감 직전 요청에 줄 최소 타임아웃 (초, requests는 0 이하를 받지 않음)
+
+# 부분 결과가 된 이유
+STOP_DEADLINE = "deadline"  # 마감 시각이 지나 진행 중인 요청을 버림
+STOP_BUDGET = "budget"  # 남은 시간이 한 페이지 예상 소요 시간보다 짧아 새 요청을 보내지 않음
+STOP_CANCELLED = "cancelled"  # 호출자가 중단을 요청함 (일괄 검색 중 Ctrl-C 등)
+
+
+class DeadlineExceeded(Exception):
+    """마감 시각까지 요청이 끝나지 않음"""
+
+
+class CrawlDeadline:
+    """
+    한 번의 크롤링에 주어진 시간 예산 (스레드 안전)
+
+    time_budget(초)이나 deadline(time.time() 기준 마감 시각) 중 이른 쪽을 마감으로 쓰고,
+    둘 다 없으면 제한이 없다. 요청마다 걸린 시간을 지수 이동 평균으로 기록해
+    남은 시간 안에 다음 페이지를 받을 수 있을지(allows) 판단한다.
+    """
+
+    def __init__(self, time_budget=None, deadline=None):
+        self.started_at = time.time()
+        self._started = time.monotonic()
+        limits = []
+        if time_budget is not None:
+            limits.append(self._started + max(0.0, time_budget))
+        if deadline is not None:
+            limits.append(self._started + max(0.0, deadline - self.started_at))
+        self._deadline = min(limits) if limits else None
+        self.budget = round(self._deadline - self._started, 3) if limits else None
+
+        self._lock = threading.Lock()
+        self.page_estimate = DEFAULT_PAGE_ESTIMATE
+        self.pages = 0
+        self.abandoned = 0  # 마감 때문에 결과를 기다리지 않고 버린 작업 수 (요청 또는 전략)
+        self.partial = False
+        self.stop_reason = None
+        self._phases = {}  # 단계 이름 -> 누적 시간 (초)
+        self._last_lap = self._started
+
+    @property
+    def limited(self):
+        return self._deadline is not None
+
+    def remaining(self):
+        """남은 시간 (초, 제한이 없으면 None)"""
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+
+    def expired(self):
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def timeout(self, default):
+        """요청 타임아웃을 남은 시간 이하로 제한 (마감 후 버린 요청이 오래 남지 않도록)"""
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        return max(MIN_REQUEST_TIMEOUT, min(default, remaining))
+
+    def allows(self, pages=1):
+        """남은 시간 안에 pages개 페이지를 받을 수 있을 것 같으면 True"""
+        if self._deadline is None:
+            return True
+        with self._lock:
+            needed = self.page_estimate * pages
+        return self.remaining() >= needed
+
+    def observe(self, seconds):
+        """요청 하나의 소요 시간 반영"""
+        with self._lock:
+            if self.pages:
+                self.page_estimate += PAGE_ESTIMATE_WEIGHT * (seconds - self.page_estimate)
+            else:
+                self.page_estimate = seconds
+            self.pages += 1
+
+    def mark_partial(self, reason):
+        """부분 결과로 표시 (처음 기록한 이유 유지)"""
+        with self._lock:
+            if not self.partial:
+                self.partial = True
+                self.stop_reason = reason
+
+    def abandon(self, count=1):
+        """마감 때문에 결과를 기다리지 않고 버린 작업 수 기록"""
+        with self._lock:
+            self.abandoned += count
+
+    def lap(self, name):
+        """직전 lap 이후 경과 시간을 name 단계의 소요 시간으로 누적"""
+        now = time.monotonic()
+        with self._lock:
+            self._phases[name] = self._phases.get(name, 0.0) + now - self._last_lap
+            self._last_lap = now
+
+    def run(self, fn, *args, **kwargs):
+        """
+        마감 시각까지만 기다리며 fn 실행
+
+        제한이 없으면 그대로 호출한다. 마감이 지나면 DeadlineExceeded를 던지고,
+        실행 중인 호출은 백그라운드(데몬 스레드)에서 끝나도록 두고 결과는 버린다.
+        fn에 deadline을 넘겨 요청 타임아웃을 timeout()으로 제한하면 버린 호출도
+        마감 직후 끝나고, 렌더러 사전 필터는 commit()하지 않으므로 공유 상태에 남지 않는다.
+        """
+        if self._deadline is None:
+            return fn(*args, **kwargs)
+
+        outcome = {}
+
+        def target():
+            try:
+                outcome["result"] = fn(*args, **kwargs)
+            except BaseException as e:
+                outcome["error"] = e
+
+        worker = threading.Thread(target=target, daemon=True)
+        worker.start()
+        worker.join(self.remaining())
+        if worker.is_alive():
+            self.abandon()
+            raise DeadlineExceeded(f"마감 시각까지 요청이 끝나지 않았습니다 ({fn.__name__})")
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["result"]
+
+    def fetch(self, fn, *args, **kwargs):
+        """페이지 요청 하나를 run()으로 실행하고 소요 시간을 페이지 추정치에 반영"""
+        started = time.monotonic()
+        result = self.run(fn, *args, **kwargs)
+        self.observe(time.monotonic() - started)
+        return result
+
+    def summary(self):
+        """예산, 경과/남은 시간, 단계별 시간, 부분 결과 여부"""
+        remaining = self.remaining()
+        with self._lock:
+            return {
+                "time_budget": self.budget,
+                "elapsed": round(time.monotonic() - self._started, 3),
+                "remaining": round(remaining, 3) if remaining is not None else None,
+                "partial": self.partial,
+                "stop_reason": self.stop_reason,
+                "pages": self.pages,
+                "abandoned": self.abandoned,
+                "page_estimate": round(self.page_estimate, 3),
+                "phases": {name: round(seconds, 3) for name, seconds in self._phases.items()}
+            }
+
+
+def request_timeout(default, deadline=None):
+    """deadline(CrawlDeadline)이 있으면 남은 시간 이하로 제한한 요청 타임아웃"""
+    return deadline.timeout(default) if deadline is not None else default
+
+
+class CrawlResults(list):
+    """
+    get_shorts_by_keyword 결과 목록 (기존처럼 list로 사용)
+
+    partial은 시간 예산 때문에 목표 수나 전략 소진 전에 멈췄는지 여부,
+    timings는 CrawlDeadline.summary() 값이다.
+    """
+
+    def __init__(self, shorts=(), partial=False, stop_reason=None, timings=None):
+        super().__init__(shorts)
+        self.partial = partial
+        self.stop_reason = stop_reason
+        self.timings = timings or {}
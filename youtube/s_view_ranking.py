@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+조회수 속도 순위 모듈
+필터를 통과한 쇼츠를 들어오는 즉시 크기 K의 힙에 넣어 시간당 조회수(조회수 ÷ 게시 후 경과 시간)
+상위 K개만 유지 (마지막에 전체를 정렬하지 않고, 메모리는 O(K))
+"""
+
+import time
+import heapq
+import threading
+from youtube.i_text_parsers import published_timestamp
+
+MIN_AGE_HOURS = 1.0  # 방금 올라온 영상의 점수가 무한대로 커지지 않도록 하는 최소 경과 시간
+UNKNOWN_AGE_HOURS = 24.0 * 30  # 게시 시간을 해석할 수 없을 때 가정하는 경과 시간 (순위 하단)
+
+RANK_BY_VELOCITY = "velocity"
+RANK_BY_VIEWS = "views"
+
+
+def age_hours(short, now=None):
+    """게시 후 경과 시간 (시간 단위, published_at이 없으면 published_time으로 추정)"""
+    if now is None:
+        now = time.time()
+    published_at = short.get("published_at")
+    if published_at is None:
+        published_at = published_timestamp(short.get("published_time", ""), now)
+    if published_at is None:
+        return UNKNOWN_AGE_HOURS
+    return max(MIN_AGE_HOURS, (now - published_at) / 3600)
+
+
+def view_velocity(short, now=None):
+    """시간당 조회수"""
+    return short.get("views", 0) / age_hours(short, now)
+
+
+def view_count(short, now=None):
+    """조회수 (기존 정렬 기준)"""
+    return short.get("views", 0)
+
+
+RANKING_SCORES = {
+    RANK_BY_VELOCITY: view_velocity,
+    RANK_BY_VIEWS: view_count,
+}
+
+
+class TopKRanking:
+    """
+    점수 상위 K개만 보관하는 결과 모음 (최소 힙, 스레드 안전)
+
+    filter_and_add_shorts 등에서 결과 목록 대신 넘길 수 있도록 append/extend를 제공한다.
+    len()은 지금까지 들어온 결과 수(목표 수 도달 판단용)이고, 순회와 ranked()는
+    보관 중인 상위 K개를 돌려준다. 점수의 기준 시각(now)은 생성 시 한 번 정해
+    크롤링 중 먼저 들어온 영상과 나중에 들어온 영상을 같은 기준으로 비교한다.
+    """
+
+    def __init__(self, k, rank_by=RANK_BY_VELOCITY, now=None):
+        if rank_by not in RANKING_SCORES:
+            raise ValueError(f"지원하지 않는 순위 기준입니다: {rank_by} ({', '.join(RANKING_SCORES)})")
+        self.k = max(1, int(k))
+        self.rank_by = rank_by
+        self.now = now if now is not None else time.time()
+        self._score = RANKING_SCORES[rank_by]
+        self._heap = []  # (점수, 순번, 레코드) - 가장 낮은 점수가 맨 앞
+        self._sequence = 0  # 같은 점수는 먼저 들어온 쪽이 위
+        self._admitted = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._admitted
+
+    def __iter__(self):
+        with self._lock:
+            records = [record for _, _, record in self._heap]
+        return iter(records)
+
+    def score(self, short):
+        return self._score(short, self.now)
+
+    def _push(self, short):
+        # 순번을 음수로 넣어 점수가 같으면 나중에 들어온 항목이 먼저 밀려나도록
+        entry = (self.score(short), -self._sequence, short)
+        self._sequence += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def append(self, short):
+        with self._lock:
+            self._admitted += 1
+            self._push(short)
+
+    def extend(self, shorts):
+        with self._lock:
+            for short in shorts:
+                self._admitted += 1
+                self._push(short)
+
+    def restore(self, shorts, admitted):
+        """체크포인트에서 보관 중이던 결과와 들어온 결과 수를 복원"""
+        with self._lock:
+            for short in shorts:
+                self._push(short)
+            self._admitted += max(admitted, len(shorts))
+
+    def replace(self, previous, short):
+        """
+        previous를 short로 교체 (들어온 결과 수는 그대로)
+
+        previous는 이 모음에 들어왔던 레코드여야 한다 (e_data_filters.replace_result 호출 전에
+        유사 중복 인덱스의 owner로 확인하므로 밀려난 레코드를 따로 기억하지 않는다).
+        previous가 이미 상위 K개에서 밀려났으면 short만 새로 순위 경쟁에 참여한다.
+        """
+        with self._lock:
+            for position, (_, _, record) in enumerate(self._heap):
+                if record is previous:
+                    self._heap[position] = self._heap[-1]
+                    self._heap.pop()
+                    heapq.heapify(self._heap)
+                    break
+            self._push(short)
+        return True
+
+    def ranked(self):
+        """보관 중인 결과를 점수 내림차순으로 반환"""
+        with self._lock:
+            return [record for _, _, record in sorted(self._heap, reverse=True)]
+
+    def min_score(self):
+        """상위 K개에 들기 위한 현재 최저 점수 (아직 K개가 안 찼으면 None)"""
+        with self._lock:
+            return self._heap[0][0] if len(self._heap) >= self.k else None
+
+
+def rank_results(shorts, k=None, rank_by=RANK_BY_VELOCITY, now=None):
+    """이미 모은 결과 목록을 한 번에 순위화 (상위 k개, k가 없으면 전체)"""
+    ranking = TopKRanking(k or max(1, len(shorts)), rank_by, now)
+    ranking.extend(shorts)
+    return ranking.ranked()
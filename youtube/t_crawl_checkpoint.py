@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+크롤링 체크포인트 모듈
+진행 중인 크롤링 상태(처리한 URL, 전략별 남은 연속 토큰과 깊이, 이미 본 영상 ID,
+필터를 통과한 쇼츠, 발견한 채널, 결과 스트림 파일)를 주기적으로 파일에 저장하고, 중단된 실행을 이어서 재개
+"""
+
+import os
+import json
+import time
+import threading
+from youtube.l_short_record import ShortRecord
+
+DEFAULT_CHECKPOINT_DIR = "data/checkpoints"
+DEFAULT_CHECKPOINT_INTERVAL = 10.0  # 저장 간격 (초)
+DEFAULT_MAX_AGE = 6 * 60 * 60  # 이보다 오래된 체크포인트는 재개하지 않음 ("N일 전" 게시 시간이 달라지므로)
+CHECKPOINT_VERSION = 1
+
+
+def checkpoint_path(keyword, min_views, max_days, checkpoint_dir=DEFAULT_CHECKPOINT_DIR):
+    """키워드와 필터 조건별 체크포인트 파일 경로 (조건이 다르면 다른 파일)"""
+    return os.path.join(checkpoint_dir, f"{keyword}_{min_views}_{max_days}.json")
+
+
+def _record_dict(short):
+    return short.to_dict() if hasattr(short, "to_dict") else dict(short)
+
+
+class CrawlCheckpoint:
+    """
+    get_shorts_by_keyword 한 번의 상태를 파일로 저장/복원 (스레드 안전)
+
+    bind()로 크롤러의 상태 객체(집합/결과 모음/dict)를 참조해 두므로, 크롤러 밖에서도
+    save()를 부를 수 있다 (Ctrl-C나 예외 처리부에서 마지막 상태 저장).
+    저장은 임시 파일에 쓴 뒤 교체하므로 저장 도중 중단되어도 이전 체크포인트가 남는다.
+    """
+
+    def __init__(self, path, interval=DEFAULT_CHECKPOINT_INTERVAL, max_age=DEFAULT_MAX_AGE):
+        """
+        Args:
+            path: 체크포인트 파일 경로 (checkpoint_path()로 생성 권장)
+            interval: maybe_save()가 실제로 저장하는 최소 간격 (초)
+            max_age: load()가 받아들이는 체크포인트 최대 나이 (초)
+        """
+        self.path = path
+        self.interval = interval
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._state = None
+        self._in_progress = {}  # 전략 URL -> {"strategy", "token", "depth"} (다음에 받을 연속 페이지)
+        self._last_saved = time.monotonic()
+        self.saves = 0
+
+    @classmethod
+    def for_keyword(cls, keyword, min_views, max_days, checkpoint_dir=DEFAULT_CHECKPOINT_DIR, **kwargs):
+        return cls(checkpoint_path(keyword, min_views, max_days, checkpoint_dir), **kwargs)
+
+    def bind(self, keyword, min_views, max_days, processed_urls, existing_ids, results, discovered_channels,
+             output=None):
+        """
+        저장할 크롤러 상태 객체 연결 (results는 TopKRanking 또는 list)
+
+        existing_ids는 이번 실행이 본 ID만 순회하는 집합(e_data_filters.RunIdSet)을 넘긴다.
+        여러 키워드가 공유하는 집합을 그대로 넘기면 다른 키워드의 ID까지 저장된다.
+        output(common.utils.ResultStream)을 넘기면 그 파일 경로를 저장해, 재개한 실행이
+        상위 K개 밖의 결과까지 이전 파일에서 이어받을 수 있게 한다.
+        """
+        with self._lock:
+            self._state = {
+                "keyword": keyword,
+                "min_views": min_views,
+                "max_days": max_days,
+                "processed_urls": processed_urls,
+                "existing_ids": existing_ids,
+                "results": results,
+                "discovered_channels": discovered_channels,
+                "output_file": getattr(output, "filename", None)
+            }
+
+    def track(self, strategy, token, depth, max_depth):
+        """전략의 다음 연속 페이지 기록 (토큰이 없거나 최대 깊이면 완료로 처리)"""
+        with self._lock:
+            if token and depth < max_depth:
+                self._in_progress[strategy["url"]] = {"strategy": dict(strategy), "token": token, "depth": depth}
+            else:
+                self._in_progress.pop(strategy["url"], None)
+
+    def finish(self, strategy):
+        """전략 완료 (더 이어받을 연속 페이지 없음)"""
+        with self._lock:
+            self._in_progress.pop(strategy["url"], None)
+
+    def snapshot(self):
+        """현재 상태를 JSON으로 저장할 수 있는 dict로 (bind 전이면 None)"""
+        with self._lock:
+            state = self._state
+            if state is None:
+                return None
+            in_progress = [dict(entry) for entry in self._in_progress.values()]
+        results = state["results"]
+        shorts = [_record_dict(short) for short in list(results)]
+        return {
+            "version": CHECKPOINT_VERSION,
+            "saved_at": time.time(),
+            "keyword": state["keyword"],
+            "min_views": state["min_views"],
+            "max_days": state["max_days"],
+            "processed_urls": sorted(state["processed_urls"]),
+            "in_progress": in_progress,
+            "existing_ids": list(state["existing_ids"]),
+            "admitted": len(results),
+            "shorts": shorts,
+            "discovered_channels": {key: dict(value) for key, value in list(state["discovered_channels"].items())},
+            "output_file": state["output_file"]
+        }
+
+    def save(self):
+        """지금 상태를 저장 (bind 전이면 아무것도 하지 않음)"""
+        snapshot = self.snapshot()
+        if snapshot is None:
+            return None
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+        with self._lock:
+            self._last_saved = time.monotonic()
+            self.saves += 1
+        return self.path
+
+    def maybe_save(self):
+        """마지막 저장 후 interval초가 지났으면 저장 (실패해도 크롤링은 계속)"""
+        with self._lock:
+            if time.monotonic() - self._last_saved < self.interval:
+                return None
+            self._last_saved = time.monotonic()
+        try:
+            return self.save()
+        except OSError as e:
+            print(f"체크포인트 저장 실패: {e}")
+            return None
+
+    def load(self, keyword, min_views, max_days):
+        """
+        재개할 상태 읽기
+
+        파일이 없거나, 손상됐거나, 조건이 다르거나, max_age보다 오래됐으면 None.
+        쇼츠는 ShortRecord로 복원하고 in_progress는 이 체크포인트의 추적 상태로도 이어받는다.
+        """
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"체크포인트를 읽을 수 없어 처음부터 시작합니다: {e}")
+            return None
+
+        if state.get("version") != CHECKPOINT_VERSION or \
+                (state.get("keyword"), state.get("min_views"), state.get("max_days")) != (keyword, min_views, max_days):
+            print("체크포인트의 검색 조건이 달라 처음부터 시작합니다.")
+            return None
+        age = time.time() - state.get("saved_at", 0)
+        if self.max_age is not None and age > self.max_age:
+            print(f"체크포인트가 너무 오래되어({age / 3600:.1f}시간) 처음부터 시작합니다.")
+            return None
+
+        state["shorts"] = [ShortRecord.from_dict(short) for short in state.get("shorts", [])]
+        with self._lock:
+            self._in_progress = {entry["strategy"]["url"]: entry for entry in state.get("in_progress", [])}
+        return state
+
+    def clear(self):
+        """크롤링이 끝나면 체크포인트 삭제 (다음 실행은 처음부터)"""
+        with self._lock:
+            self._in_progress = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)